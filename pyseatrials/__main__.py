@@ -0,0 +1,5 @@
+"The `pyseatrials` command run as `python -m pyseatrials`"
+import sys
+from .cli import main
+
+sys.exit(main())
@@ -5,7 +5,47 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://JonnoB.github.io',
                 'git_url': 'https://github.com/JonnoB/pyseatrials',
                 'lib_path': 'pyseatrials'},
-  'syms': { 'pyseatrials.basic': { 'pyseatrials.basic.CF_fn': ('basic_hydro_functions.html#cf_fn', 'pyseatrials/basic.py'),
+  'syms': { 'pyseatrials.align': { 'pyseatrials.align.StreamAligner': ('align.html#streamaligner', 'pyseatrials/align.py'),
+                                   'pyseatrials.align.StreamAligner.__init__': ( 'align.html#streamaligner.__init__',
+                                                                                 'pyseatrials/align.py'),
+                                   'pyseatrials.align.StreamAligner._emit': ('align.html#streamaligner._emit', 'pyseatrials/align.py'),
+                                   'pyseatrials.align.StreamAligner._lookahead': ( 'align.html#streamaligner._lookahead',
+                                                                                   'pyseatrials/align.py'),
+                                   'pyseatrials.align.StreamAligner._trim': ('align.html#streamaligner._trim', 'pyseatrials/align.py'),
+                                   'pyseatrials.align.StreamAligner.align': ('align.html#streamaligner.align', 'pyseatrials/align.py'),
+                                   'pyseatrials.align.StreamAligner.flush': ('align.html#streamaligner.flush', 'pyseatrials/align.py'),
+                                   'pyseatrials.align.StreamAligner.push': ('align.html#streamaligner.push', 'pyseatrials/align.py'),
+                                   'pyseatrials.align.StreamAligner.reset': ('align.html#streamaligner.reset', 'pyseatrials/align.py'),
+                                   'pyseatrials.align._seconds': ('align.html#_seconds', 'pyseatrials/align.py'),
+                                   'pyseatrials.align._sorted': ('align.html#_sorted', 'pyseatrials/align.py'),
+                                   'pyseatrials.align._window_mean': ('align.html#_window_mean', 'pyseatrials/align.py'),
+                                   'pyseatrials.align.align': ('align.html#align', 'pyseatrials/align.py'),
+                                   'pyseatrials.align.align_tables': ('align.html#align_tables', 'pyseatrials/align.py')},
+            'pyseatrials.analysis': { 'pyseatrials.analysis.SeaTrialAnalysis': ( 'analysis.html#seatrialanalysis',
+                                                                                 'pyseatrials/analysis.py'),
+                                      'pyseatrials.analysis.SeaTrialAnalysis.__init__': ( 'analysis.html#seatrialanalysis.__init__',
+                                                                                          'pyseatrials/analysis.py'),
+                                      'pyseatrials.analysis.SeaTrialAnalysis._wind_coefficient': ( 'analysis.html#seatrialanalysis._wind_coefficient',
+                                                                                                   'pyseatrials/analysis.py'),
+                                      'pyseatrials.analysis.SeaTrialAnalysis.current': ( 'analysis.html#seatrialanalysis.current',
+                                                                                         'pyseatrials/analysis.py'),
+                                      'pyseatrials.analysis.SeaTrialAnalysis.displacement': ( 'analysis.html#seatrialanalysis.displacement',
+                                                                                              'pyseatrials/analysis.py'),
+                                      'pyseatrials.analysis.SeaTrialAnalysis.power': ( 'analysis.html#seatrialanalysis.power',
+                                                                                       'pyseatrials/analysis.py'),
+                                      'pyseatrials.analysis.SeaTrialAnalysis.run': ( 'analysis.html#seatrialanalysis.run',
+                                                                                     'pyseatrials/analysis.py'),
+                                      'pyseatrials.analysis.SeaTrialAnalysis.shallow_water': ( 'analysis.html#seatrialanalysis.shallow_water',
+                                                                                               'pyseatrials/analysis.py'),
+                                      'pyseatrials.analysis.SeaTrialAnalysis.water': ( 'analysis.html#seatrialanalysis.water',
+                                                                                       'pyseatrials/analysis.py'),
+                                      'pyseatrials.analysis.SeaTrialAnalysis.waves': ( 'analysis.html#seatrialanalysis.waves',
+                                                                                       'pyseatrials/analysis.py'),
+                                      'pyseatrials.analysis.SeaTrialAnalysis.wind': ( 'analysis.html#seatrialanalysis.wind',
+                                                                                      'pyseatrials/analysis.py')},
+            'pyseatrials.basic': { 'pyseatrials.basic.CF_fn': ('basic_hydro_functions.html#cf_fn', 'pyseatrials/basic.py'),
+                                   'pyseatrials.basic._from_hull': ('basic_hydro_functions.html#_from_hull', 'pyseatrials/basic.py'),
+                                   'pyseatrials.basic._require': ('basic_hydro_functions.html#_require', 'pyseatrials/basic.py'),
                                    'pyseatrials.basic.air_density': ('basic_hydro_functions.html#air_density', 'pyseatrials/basic.py'),
                                    'pyseatrials.basic.calc_salinity': ('basic_hydro_functions.html#calc_salinity', 'pyseatrials/basic.py'),
                                    'pyseatrials.basic.calculate_form_factor': ( 'basic_hydro_functions.html#calculate_form_factor',
@@ -16,27 +56,176 @@ d = { 'settings': { 'branch': 'main',
                                                                                             'pyseatrials/basic.py'),
                                    'pyseatrials.basic.dynamic_viscosity': ( 'basic_hydro_functions.html#dynamic_viscosity',
                                                                             'pyseatrials/basic.py'),
+                                   'pyseatrials.basic.frictional_resistance_coefs': ( 'basic_hydro_functions.html#frictional_resistance_coefs',
+                                                                                      'pyseatrials/basic.py'),
                                    'pyseatrials.basic.froude_number_fn': ( 'basic_hydro_functions.html#froude_number_fn',
                                                                            'pyseatrials/basic.py'),
                                    'pyseatrials.basic.kinematic_viscosity_fn': ( 'basic_hydro_functions.html#kinematic_viscosity_fn',
                                                                                  'pyseatrials/basic.py'),
                                    'pyseatrials.basic.load_water_properties': ( 'basic_hydro_functions.html#load_water_properties',
                                                                                 'pyseatrials/basic.py'),
+                                   'pyseatrials.basic.moist_air_density': ( 'basic_hydro_functions.html#moist_air_density',
+                                                                            'pyseatrials/basic.py'),
                                    'pyseatrials.basic.reynolds_number_fn': ( 'basic_hydro_functions.html#reynolds_number_fn',
                                                                              'pyseatrials/basic.py'),
                                    'pyseatrials.basic.roughness_resistance_fn': ( 'basic_hydro_functions.html#roughness_resistance_fn',
                                                                                   'pyseatrials/basic.py'),
+                                   'pyseatrials.basic.saturation_vapour_pressure': ( 'basic_hydro_functions.html#saturation_vapour_pressure',
+                                                                                     'pyseatrials/basic.py'),
                                    'pyseatrials.basic.wetted_surface_area': ( 'basic_hydro_functions.html#wetted_surface_area',
                                                                               'pyseatrials/basic.py')},
+            'pyseatrials.benchmark': { 'pyseatrials.benchmark._analysis_setup': ( 'benchmark.html#_analysis_setup',
+                                                                                  'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark._case': ('benchmark.html#_case', 'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark._graph_setup': ('benchmark.html#_graph_setup', 'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark._kernel': ('benchmark.html#_kernel', 'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark._metadata': ('benchmark.html#_metadata', 'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark._scenario_inputs': ( 'benchmark.html#_scenario_inputs',
+                                                                                   'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark._stream_setup': ('benchmark.html#_stream_setup', 'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark.compare': ('benchmark.html#compare', 'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark.heavy_imports': ('benchmark.html#heavy_imports', 'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark.import_time': ('benchmark.html#import_time', 'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark.load_results': ('benchmark.html#load_results', 'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark.register': ('benchmark.html#register', 'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark.results_frame': ('benchmark.html#results_frame', 'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark.run_benchmarks': ( 'benchmark.html#run_benchmarks',
+                                                                                 'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark.save_results': ('benchmark.html#save_results', 'pyseatrials/benchmark.py'),
+                                       'pyseatrials.benchmark.time_function': ('benchmark.html#time_function', 'pyseatrials/benchmark.py')},
+            'pyseatrials.cache': { 'pyseatrials.cache.DiskCache': ('cache.html#diskcache', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.DiskCache.__contains__': ( 'cache.html#diskcache.__contains__',
+                                                                                 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.DiskCache.__getitem__': ('cache.html#diskcache.__getitem__', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.DiskCache.__init__': ('cache.html#diskcache.__init__', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.DiskCache.__len__': ('cache.html#diskcache.__len__', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.DiskCache.__repr__': ('cache.html#diskcache.__repr__', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.DiskCache.__setitem__': ('cache.html#diskcache.__setitem__', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.DiskCache._entries': ('cache.html#diskcache._entries', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.DiskCache._path': ('cache.html#diskcache._path', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.DiskCache._remove': ('cache.html#diskcache._remove', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.DiskCache.clear': ('cache.html#diskcache.clear', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.DiskCache.evict': ('cache.html#diskcache.evict', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.DiskCache.size': ('cache.html#diskcache.size', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache._global_names': ('cache.html#_global_names', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache._update': ('cache.html#_update', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache._update_code': ('cache.html#_update_code', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache._update_function': ('cache.html#_update_function', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.cached': ('cache.html#cached', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.caching': ('cache.html#caching', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.code_digest': ('cache.html#code_digest', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.current': ('cache.html#current', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.default_directory': ('cache.html#default_directory', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.disable': ('cache.html#disable', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.enable': ('cache.html#enable', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.input_key': ('cache.html#input_key', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.is_enabled': ('cache.html#is_enabled', 'pyseatrials/cache.py'),
+                                   'pyseatrials.cache.package_version': ('cache.html#package_version', 'pyseatrials/cache.py')},
+            'pyseatrials.catalog': { 'pyseatrials.catalog.Bundle': ('catalog.html#bundle', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog.Bundle.__init__': ('catalog.html#bundle.__init__', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog.Bundle.__repr__': ('catalog.html#bundle.__repr__', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog.Bundle.table': ('catalog.html#bundle.table', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog._column': ('catalog.html#_column', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog._files': ('catalog.html#_files', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog._read_csv': ('catalog.html#_read_csv', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog.build_bundle': ('catalog.html#build_bundle', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog.bundle_path': ('catalog.html#bundle_path', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog.close_bundle': ('catalog.html#close_bundle', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog.describe': ('catalog.html#describe', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog.load_frame': ('catalog.html#load_frame', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog.load_table': ('catalog.html#load_table', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog.open_bundle': ('catalog.html#open_bundle', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog.source_digest': ('catalog.html#source_digest', 'pyseatrials/catalog.py'),
+                                     'pyseatrials.catalog.tables': ('catalog.html#tables', 'pyseatrials/catalog.py')},
+            'pyseatrials.clean': { 'pyseatrials.clean.OutlierFilter': ('clean.html#outlierfilter', 'pyseatrials/clean.py'),
+                                   'pyseatrials.clean.OutlierFilter.__call__': ( 'clean.html#outlierfilter.__call__',
+                                                                                 'pyseatrials/clean.py'),
+                                   'pyseatrials.clean.OutlierFilter.__init__': ( 'clean.html#outlierfilter.__init__',
+                                                                                 'pyseatrials/clean.py'),
+                                   'pyseatrials.clean.OutlierFilter._check': ('clean.html#outlierfilter._check', 'pyseatrials/clean.py'),
+                                   'pyseatrials.clean.OutlierFilter.reset': ('clean.html#outlierfilter.reset', 'pyseatrials/clean.py'),
+                                   'pyseatrials.clean._hampel': ('clean.html#_hampel', 'pyseatrials/clean.py'),
+                                   'pyseatrials.clean._unwrap': ('clean.html#_unwrap', 'pyseatrials/clean.py'),
+                                   'pyseatrials.clean.hampel': ('clean.html#hampel', 'pyseatrials/clean.py'),
+                                   'pyseatrials.clean.rolling_median': ('clean.html#rolling_median', 'pyseatrials/clean.py')},
+            'pyseatrials.cli': { 'pyseatrials.cli._merge': ('cli.html#_merge', 'pyseatrials/cli.py'),
+                                 'pyseatrials.cli._read': ('cli.html#_read', 'pyseatrials/cli.py'),
+                                 'pyseatrials.cli._tasks': ('cli.html#_tasks', 'pyseatrials/cli.py'),
+                                 'pyseatrials.cli._write': ('cli.html#_write', 'pyseatrials/cli.py'),
+                                 'pyseatrials.cli.analyse': ('cli.html#analyse', 'pyseatrials/cli.py'),
+                                 'pyseatrials.cli.analyse_file': ('cli.html#analyse_file', 'pyseatrials/cli.py'),
+                                 'pyseatrials.cli.build_analysis': ('cli.html#build_analysis', 'pyseatrials/cli.py'),
+                                 'pyseatrials.cli.bundle': ('cli.html#bundle', 'pyseatrials/cli.py'),
+                                 'pyseatrials.cli.load_config': ('cli.html#load_config', 'pyseatrials/cli.py'),
+                                 'pyseatrials.cli.main': ('cli.html#main', 'pyseatrials/cli.py'),
+                                 'pyseatrials.cli.parser': ('cli.html#parser', 'pyseatrials/cli.py'),
+                                 'pyseatrials.cli.serve': ('cli.html#serve', 'pyseatrials/cli.py'),
+                                 'pyseatrials.cli.trial_settings': ('cli.html#trial_settings', 'pyseatrials/cli.py')},
+            'pyseatrials.columnar': { 'pyseatrials.columnar.ResultWriter': ('columnar.html#resultwriter', 'pyseatrials/columnar.py'),
+                                      'pyseatrials.columnar.ResultWriter.__enter__': ( 'columnar.html#resultwriter.__enter__',
+                                                                                       'pyseatrials/columnar.py'),
+                                      'pyseatrials.columnar.ResultWriter.__exit__': ( 'columnar.html#resultwriter.__exit__',
+                                                                                      'pyseatrials/columnar.py'),
+                                      'pyseatrials.columnar.ResultWriter.__init__': ( 'columnar.html#resultwriter.__init__',
+                                                                                      'pyseatrials/columnar.py'),
+                                      'pyseatrials.columnar.ResultWriter._table': ( 'columnar.html#resultwriter._table',
+                                                                                    'pyseatrials/columnar.py'),
+                                      'pyseatrials.columnar.ResultWriter.abort': ( 'columnar.html#resultwriter.abort',
+                                                                                   'pyseatrials/columnar.py'),
+                                      'pyseatrials.columnar.ResultWriter.close': ( 'columnar.html#resultwriter.close',
+                                                                                   'pyseatrials/columnar.py'),
+                                      'pyseatrials.columnar.ResultWriter.write': ( 'columnar.html#resultwriter.write',
+                                                                                   'pyseatrials/columnar.py'),
+                                      'pyseatrials.columnar._format': ('columnar.html#_format', 'pyseatrials/columnar.py'),
+                                      'pyseatrials.columnar._pyarrow': ('columnar.html#_pyarrow', 'pyseatrials/columnar.py'),
+                                      'pyseatrials.columnar.iter_batches': ('columnar.html#iter_batches', 'pyseatrials/columnar.py'),
+                                      'pyseatrials.columnar.open_dataset': ('columnar.html#open_dataset', 'pyseatrials/columnar.py'),
+                                      'pyseatrials.columnar.read_columns': ('columnar.html#read_columns', 'pyseatrials/columnar.py'),
+                                      'pyseatrials.columnar.write_results': ('columnar.html#write_results', 'pyseatrials/columnar.py')},
             'pyseatrials.current': { 'pyseatrials.current.current_mean_of_means': ( 'current.html#current_mean_of_means',
                                                                                     'pyseatrials/current.py'),
                                      'pyseatrials.current.estimate_speed_through_water': ( 'current.html#estimate_speed_through_water',
                                                                                            'pyseatrials/current.py')},
+            'pyseatrials.fleet': { 'pyseatrials.fleet.FleetExecutor': ('fleet.html#fleetexecutor', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.FleetExecutor.__init__': ( 'fleet.html#fleetexecutor.__init__',
+                                                                                 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.FleetExecutor.concat': ('fleet.html#fleetexecutor.concat', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.FleetExecutor.map': ('fleet.html#fleetexecutor.map', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.SharedTables': ('fleet.html#sharedtables', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.SharedTables.__contains__': ( 'fleet.html#sharedtables.__contains__',
+                                                                                    'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.SharedTables.__enter__': ( 'fleet.html#sharedtables.__enter__',
+                                                                                 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.SharedTables.__exit__': ('fleet.html#sharedtables.__exit__', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.SharedTables.__getitem__': ( 'fleet.html#sharedtables.__getitem__',
+                                                                                   'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.SharedTables.__init__': ('fleet.html#sharedtables.__init__', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.SharedTables.close': ('fleet.html#sharedtables.close', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.SharedTables.create': ('fleet.html#sharedtables.create', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.SharedTables.keys': ('fleet.html#sharedtables.keys', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.SharedTables.spec': ('fleet.html#sharedtables.spec', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.SharedWindCoefficients': ( 'fleet.html#sharedwindcoefficients',
+                                                                                 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.SharedWindCoefficients.__call__': ( 'fleet.html#sharedwindcoefficients.__call__',
+                                                                                          'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.SharedWindCoefficients.__init__': ( 'fleet.html#sharedwindcoefficients.__init__',
+                                                                                          'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet._close_tables': ('fleet.html#_close_tables', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet._collect': ('fleet.html#_collect', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet._discard': ('fleet.html#_discard', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet._open_tables': ('fleet.html#_open_tables', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet._run': ('fleet.html#_run', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet._shared_directory': ('fleet.html#_shared_directory', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.fleet_tables': ('fleet.html#fleet_tables', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.run_analysis': ('fleet.html#run_analysis', 'pyseatrials/fleet.py'),
+                                   'pyseatrials.fleet.table': ('fleet.html#table', 'pyseatrials/fleet.py')},
             'pyseatrials.general': { 'pyseatrials.general.displacement_correction': ( 'general_functions.html#displacement_correction',
                                                                                       'pyseatrials/general.py'),
                                      'pyseatrials.general.knots_to_ms': ('general_functions.html#knots_to_ms', 'pyseatrials/general.py'),
                                      'pyseatrials.general.load_datasets': ( 'general_functions.html#load_datasets',
                                                                             'pyseatrials/general.py'),
+                                     'pyseatrials.general.met_wind_resistance': ( 'general_functions.html#met_wind_resistance',
+                                                                                  'pyseatrials/general.py'),
                                      'pyseatrials.general.ms_to_knots': ('general_functions.html#ms_to_knots', 'pyseatrials/general.py'),
                                      'pyseatrials.general.power_correction': ( 'general_functions.html#power_correction',
                                                                                'pyseatrials/general.py'),
@@ -44,8 +233,145 @@ d = { 'settings': { 'branch': 'main',
                                                                                      'pyseatrials/general.py'),
                                      'pyseatrials.general.temp_salinity_water_resistance': ( 'general_functions.html#temp_salinity_water_resistance',
                                                                                              'pyseatrials/general.py'),
+                                     'pyseatrials.general.temp_salinity_water_resistance_components': ( 'general_functions.html#temp_salinity_water_resistance_components',
+                                                                                                        'pyseatrials/general.py'),
                                      'pyseatrials.general.wind_resistance': ( 'general_functions.html#wind_resistance',
                                                                               'pyseatrials/general.py')},
+            'pyseatrials.graph': { 'pyseatrials.graph.Context': ('graph.html#context', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Context.__contains__': ('graph.html#context.__contains__', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Context.__getitem__': ('graph.html#context.__getitem__', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Context.__init__': ('graph.html#context.__init__', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Context.get': ('graph.html#context.get', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Context.update': ('graph.html#context.update', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Graph': ('graph.html#graph', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Graph.__init__': ('graph.html#graph.__init__', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Graph.add': ('graph.html#graph.add', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Graph.ancestors': ('graph.html#graph.ancestors', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Graph.context': ('graph.html#graph.context', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Graph.dependents': ('graph.html#graph.dependents', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Graph.evaluate': ('graph.html#graph.evaluate', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Graph.node': ('graph.html#graph.node', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Node': ('graph.html#node', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Node.__init__': ('graph.html#node.__init__', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.Node.__repr__': ('graph.html#node.__repr__', 'pyseatrials/graph.py'),
+                                   'pyseatrials.graph.correction_graph': ('graph.html#correction_graph', 'pyseatrials/graph.py')},
+            'pyseatrials.hull': { 'pyseatrials.hull.Hull': ('hull.html#hull', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.__delattr__': ('hull.html#hull.__delattr__', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.__eq__': ('hull.html#hull.__eq__', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.__hash__': ('hull.html#hull.__hash__', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.__init__': ('hull.html#hull.__init__', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.__reduce__': ('hull.html#hull.__reduce__', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.__repr__': ('hull.html#hull.__repr__', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.__setattr__': ('hull.html#hull.__setattr__', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull._require': ('hull.html#hull._require', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull._values': ('hull.html#hull._values', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.a_1': ('hull.html#hull.a_1', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.asdict': ('hull.html#hull.asdict', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.beam_length_ratio': ('hull.html#hull.beam_length_ratio', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.d_1': ('hull.html#hull.d_1', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.form_factor': ('hull.html#hull.form_factor', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.replace': ('hull.html#hull.replace', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.roughness_constant': ('hull.html#hull.roughness_constant', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.sqrt_beam_bow_ratio': ( 'hull.html#hull.sqrt_beam_bow_ratio',
+                                                                                 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull.Hull.wetted_surface_area': ( 'hull.html#hull.wetted_surface_area',
+                                                                                 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull._cached': ('hull.html#_cached', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull._cached.__get__': ('hull.html#_cached.__get__', 'pyseatrials/hull.py'),
+                                  'pyseatrials.hull._cached.__init__': ('hull.html#_cached.__init__', 'pyseatrials/hull.py')},
+            'pyseatrials.instrument': { 'pyseatrials.instrument._Record': ('instrument.html#_record', 'pyseatrials/instrument.py'),
+                                        'pyseatrials.instrument._Record.__init__': ( 'instrument.html#_record.__init__',
+                                                                                     'pyseatrials/instrument.py'),
+                                        'pyseatrials.instrument._Record.asdict': ( 'instrument.html#_record.asdict',
+                                                                                   'pyseatrials/instrument.py'),
+                                        'pyseatrials.instrument._call': ('instrument.html#_call', 'pyseatrials/instrument.py'),
+                                        'pyseatrials.instrument._input_size': ('instrument.html#_input_size', 'pyseatrials/instrument.py'),
+                                        'pyseatrials.instrument.disable': ('instrument.html#disable', 'pyseatrials/instrument.py'),
+                                        'pyseatrials.instrument.dump_stats': ('instrument.html#dump_stats', 'pyseatrials/instrument.py'),
+                                        'pyseatrials.instrument.enable': ('instrument.html#enable', 'pyseatrials/instrument.py'),
+                                        'pyseatrials.instrument.instrumentation': ( 'instrument.html#instrumentation',
+                                                                                    'pyseatrials/instrument.py'),
+                                        'pyseatrials.instrument.instrumented': ( 'instrument.html#instrumented',
+                                                                                 'pyseatrials/instrument.py'),
+                                        'pyseatrials.instrument.is_enabled': ('instrument.html#is_enabled', 'pyseatrials/instrument.py'),
+                                        'pyseatrials.instrument.report': ('instrument.html#report', 'pyseatrials/instrument.py'),
+                                        'pyseatrials.instrument.reset': ('instrument.html#reset', 'pyseatrials/instrument.py'),
+                                        'pyseatrials.instrument.save_json': ('instrument.html#save_json', 'pyseatrials/instrument.py')},
+            'pyseatrials.live': { 'pyseatrials.live.JsonDecoder': ('live.html#jsondecoder', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.JsonDecoder.__call__': ('live.html#jsondecoder.__call__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.JsonDecoder.__init__': ('live.html#jsondecoder.__init__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.LiveMonitor': ('live.html#livemonitor', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.LiveMonitor.__init__': ('live.html#livemonitor.__init__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.LiveMonitor._new_run': ('live.html#livemonitor._new_run', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.LiveMonitor.estimate': ('live.html#livemonitor.estimate', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.LiveMonitor.estimates': ('live.html#livemonitor.estimates', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.LiveMonitor.reset': ('live.html#livemonitor.reset', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.LiveMonitor.update': ('live.html#livemonitor.update', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.NmeaDecoder': ('live.html#nmeadecoder', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.NmeaDecoder.__call__': ('live.html#nmeadecoder.__call__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.NmeaDecoder.__init__': ('live.html#nmeadecoder.__init__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.RingBuffer': ('live.html#ringbuffer', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.RingBuffer.__init__': ('live.html#ringbuffer.__init__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.RingBuffer.__len__': ('live.html#ringbuffer.__len__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.RingBuffer.clear': ('live.html#ringbuffer.clear', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.RingBuffer.extend': ('live.html#ringbuffer.extend', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.RingBuffer.values': ('live.html#ringbuffer.values', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.TcpFeed': ('live.html#tcpfeed', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.TcpFeed.__aenter__': ('live.html#tcpfeed.__aenter__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.TcpFeed.__aexit__': ('live.html#tcpfeed.__aexit__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.TcpFeed.__aiter__': ('live.html#tcpfeed.__aiter__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.TcpFeed.__anext__': ('live.html#tcpfeed.__anext__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.TcpFeed.__init__': ('live.html#tcpfeed.__init__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.TcpFeed.close': ('live.html#tcpfeed.close', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.TcpFeed.start': ('live.html#tcpfeed.start', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.UdpFeed': ('live.html#udpfeed', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.UdpFeed.__aenter__': ('live.html#udpfeed.__aenter__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.UdpFeed.__aexit__': ('live.html#udpfeed.__aexit__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.UdpFeed.__aiter__': ('live.html#udpfeed.__aiter__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.UdpFeed.__anext__': ('live.html#udpfeed.__anext__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.UdpFeed.__init__': ('live.html#udpfeed.__init__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.UdpFeed._put': ('live.html#udpfeed._put', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.UdpFeed.close': ('live.html#udpfeed.close', 'pyseatrials/live.py'),
+                                  'pyseatrials.live.UdpFeed.start': ('live.html#udpfeed.start', 'pyseatrials/live.py'),
+                                  'pyseatrials.live._Datagrams': ('live.html#_datagrams', 'pyseatrials/live.py'),
+                                  'pyseatrials.live._Datagrams.__init__': ('live.html#_datagrams.__init__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live._Datagrams.datagram_received': ( 'live.html#_datagrams.datagram_received',
+                                                                                     'pyseatrials/live.py'),
+                                  'pyseatrials.live._Decoder': ('live.html#_decoder', 'pyseatrials/live.py'),
+                                  'pyseatrials.live._Decoder.__init__': ('live.html#_decoder.__init__', 'pyseatrials/live.py'),
+                                  'pyseatrials.live._Decoder._held': ('live.html#_decoder._held', 'pyseatrials/live.py'),
+                                  'pyseatrials.live._hold': ('live.html#_hold', 'pyseatrials/live.py'),
+                                  'pyseatrials.live._number': ('live.html#_number', 'pyseatrials/live.py')},
+            'pyseatrials.nmea': { 'pyseatrials.nmea._Clock': ('nmea.html#_clock', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._Clock.__call__': ('nmea.html#_clock.__call__', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._Clock.__init__': ('nmea.html#_clock.__init__', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._Fields': ('nmea.html#_fields', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._Fields.__init__': ('nmea.html#_fields.__init__', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._Fields.__len__': ('nmea.html#_fields.__len__', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._Fields.bounds': ('nmea.html#_fields.bounds', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._Fields.char': ('nmea.html#_fields.char', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._Fields.number': ('nmea.html#_fields.number', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._Fields.text': ('nmea.html#_fields.text', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._addresses': ('nmea.html#_addresses', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._blocks': ('nmea.html#_blocks', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._degrees': ('nmea.html#_degrees', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._float': ('nmea.html#_float', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._gga': ('nmea.html#_gga', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._hdt': ('nmea.html#_hdt', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._kinds': ('nmea.html#_kinds', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._mwv': ('nmea.html#_mwv', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._mwv_relative': ('nmea.html#_mwv_relative', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._mwv_true': ('nmea.html#_mwv_true', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._proprietary': ('nmea.html#_proprietary', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._sentences': ('nmea.html#_sentences', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._speed': ('nmea.html#_speed', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._time_of_day': ('nmea.html#_time_of_day', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._vhw': ('nmea.html#_vhw', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea._vtg': ('nmea.html#_vtg', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea.iter_nmea': ('nmea.html#iter_nmea', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea.nmea_checksum': ('nmea.html#nmea_checksum', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea.parse_nmea': ('nmea.html#parse_nmea', 'pyseatrials/nmea.py'),
+                                  'pyseatrials.nmea.read_nmea': ('nmea.html#read_nmea', 'pyseatrials/nmea.py')},
             'pyseatrials.power': { 'pyseatrials.power.calculate_all_values_from_ideal_phase': ( 'power.html#calculate_all_values_from_ideal_phase',
                                                                                                 'pyseatrials/power.py'),
                                    'pyseatrials.power.calculate_all_values_from_trial_phase': ( 'power.html#calculate_all_values_from_trial_phase',
@@ -75,13 +401,159 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'pyseatrials/power.py'),
                                    'pyseatrials.power.torque_coef': ('power.html#torque_coef', 'pyseatrials/power.py'),
                                    'pyseatrials.power.total_resistance': ('power.html#total_resistance', 'pyseatrials/power.py')},
+            'pyseatrials.precision': { 'pyseatrials.precision._cast': ('precision.html#_cast', 'pyseatrials/precision.py'),
+                                       'pyseatrials.precision._check_dtype': ('precision.html#_check_dtype', 'pyseatrials/precision.py'),
+                                       'pyseatrials.precision._is_float32': ('precision.html#_is_float32', 'pyseatrials/precision.py'),
+                                       'pyseatrials.precision.as_compute': ('precision.html#as_compute', 'pyseatrials/precision.py'),
+                                       'pyseatrials.precision.compute_dtype': ('precision.html#compute_dtype', 'pyseatrials/precision.py'),
+                                       'pyseatrials.precision.demote': ('precision.html#demote', 'pyseatrials/precision.py'),
+                                       'pyseatrials.precision.float32_error': ('precision.html#float32_error', 'pyseatrials/precision.py'),
+                                       'pyseatrials.precision.get_dtype': ('precision.html#get_dtype', 'pyseatrials/precision.py'),
+                                       'pyseatrials.precision.promote': ('precision.html#promote', 'pyseatrials/precision.py'),
+                                       'pyseatrials.precision.record_dtype': ('precision.html#record_dtype', 'pyseatrials/precision.py'),
+                                       'pyseatrials.precision.resolve_dtype': ('precision.html#resolve_dtype', 'pyseatrials/precision.py'),
+                                       'pyseatrials.precision.set_dtype': ('precision.html#set_dtype', 'pyseatrials/precision.py')},
+            'pyseatrials.registry': { 'pyseatrials.registry.Ship': ('registry.html#ship', 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.Ship.__init__': ('registry.html#ship.__init__', 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.Ship.__repr__': ('registry.html#ship.__repr__', 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.Ship.added_wave_resistance': ( 'registry.html#ship.added_wave_resistance',
+                                                                                           'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.Ship.propeller': ('registry.html#ship.propeller', 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.Ship.reference_power': ( 'registry.html#ship.reference_power',
+                                                                                     'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.Ship.reference_speed': ( 'registry.html#ship.reference_speed',
+                                                                                     'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry': ('registry.html#shipregistry', 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry.__contains__': ( 'registry.html#shipregistry.__contains__',
+                                                                                          'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry.__enter__': ( 'registry.html#shipregistry.__enter__',
+                                                                                       'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry.__exit__': ( 'registry.html#shipregistry.__exit__',
+                                                                                      'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry.__init__': ( 'registry.html#shipregistry.__init__',
+                                                                                      'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry.__len__': ( 'registry.html#shipregistry.__len__',
+                                                                                     'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry.__repr__': ( 'registry.html#shipregistry.__repr__',
+                                                                                      'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry.analyses': ( 'registry.html#shipregistry.analyses',
+                                                                                      'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry.close': ( 'registry.html#shipregistry.close',
+                                                                                   'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry.definition': ( 'registry.html#shipregistry.definition',
+                                                                                        'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry.delete': ( 'registry.html#shipregistry.delete',
+                                                                                    'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry.get': ( 'registry.html#shipregistry.get',
+                                                                                 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry.names': ( 'registry.html#shipregistry.names',
+                                                                                   'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.ShipRegistry.put': ( 'registry.html#shipregistry.put',
+                                                                                 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.WindTable': ('registry.html#windtable', 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.WindTable.__call__': ( 'registry.html#windtable.__call__',
+                                                                                   'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.WindTable.__init__': ( 'registry.html#windtable.__init__',
+                                                                                   'pyseatrials/registry.py'),
+                                      'pyseatrials.registry._pack': ('registry.html#_pack', 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry._propeller': ('registry.html#_propeller', 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry._reference_curve': ( 'registry.html#_reference_curve',
+                                                                                 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry._unpack': ('registry.html#_unpack', 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry._wave_transfer': ('registry.html#_wave_transfer', 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry._wind_table': ('registry.html#_wind_table', 'pyseatrials/registry.py'),
+                                      'pyseatrials.registry.compile_ship': ('registry.html#compile_ship', 'pyseatrials/registry.py')},
+            'pyseatrials.segment': { 'pyseatrials.segment._run_means': ('segment.html#_run_means', 'pyseatrials/segment.py'),
+                                     'pyseatrials.segment._spread': ('segment.html#_spread', 'pyseatrials/segment.py'),
+                                     'pyseatrials.segment.find_runs': ('segment.html#find_runs', 'pyseatrials/segment.py'),
+                                     'pyseatrials.segment.reciprocal_pairs': ('segment.html#reciprocal_pairs', 'pyseatrials/segment.py'),
+                                     'pyseatrials.segment.rolling_stats': ('segment.html#rolling_stats', 'pyseatrials/segment.py'),
+                                     'pyseatrials.segment.run_table': ('segment.html#run_table', 'pyseatrials/segment.py'),
+                                     'pyseatrials.segment.steady_samples': ('segment.html#steady_samples', 'pyseatrials/segment.py')},
+            'pyseatrials.service': { 'pyseatrials.service.AnalysisService': ('service.html#analysisservice', 'pyseatrials/service.py'),
+                                     'pyseatrials.service.AnalysisService.__init__': ( 'service.html#analysisservice.__init__',
+                                                                                       'pyseatrials/service.py'),
+                                     'pyseatrials.service.AnalysisService._batcher': ( 'service.html#analysisservice._batcher',
+                                                                                       'pyseatrials/service.py'),
+                                     'pyseatrials.service.AnalysisService._handle_connection': ( 'service.html#analysisservice._handle_connection',
+                                                                                                 'pyseatrials/service.py'),
+                                     'pyseatrials.service.AnalysisService._put_ship': ( 'service.html#analysisservice._put_ship',
+                                                                                        'pyseatrials/service.py'),
+                                     'pyseatrials.service.AnalysisService.add_ship': ( 'service.html#analysisservice.add_ship',
+                                                                                       'pyseatrials/service.py'),
+                                     'pyseatrials.service.AnalysisService.handle': ( 'service.html#analysisservice.handle',
+                                                                                     'pyseatrials/service.py'),
+                                     'pyseatrials.service.AnalysisService.start': ( 'service.html#analysisservice.start',
+                                                                                    'pyseatrials/service.py'),
+                                     'pyseatrials.service.Metrics': ('service.html#metrics', 'pyseatrials/service.py'),
+                                     'pyseatrials.service.Metrics.__init__': ('service.html#metrics.__init__', 'pyseatrials/service.py'),
+                                     'pyseatrials.service.Metrics.batch': ('service.html#metrics.batch', 'pyseatrials/service.py'),
+                                     'pyseatrials.service.Metrics.request': ('service.html#metrics.request', 'pyseatrials/service.py'),
+                                     'pyseatrials.service.Metrics.snapshot': ('service.html#metrics.snapshot', 'pyseatrials/service.py'),
+                                     'pyseatrials.service.MicroBatcher': ('service.html#microbatcher', 'pyseatrials/service.py'),
+                                     'pyseatrials.service.MicroBatcher.__call__': ( 'service.html#microbatcher.__call__',
+                                                                                    'pyseatrials/service.py'),
+                                     'pyseatrials.service.MicroBatcher.__init__': ( 'service.html#microbatcher.__init__',
+                                                                                    'pyseatrials/service.py'),
+                                     'pyseatrials.service.MicroBatcher._flush': ( 'service.html#microbatcher._flush',
+                                                                                  'pyseatrials/service.py'),
+                                     'pyseatrials.service.MicroBatcher._run': ('service.html#microbatcher._run', 'pyseatrials/service.py'),
+                                     'pyseatrials.service._HTTPError': ('service.html#_httperror', 'pyseatrials/service.py'),
+                                     'pyseatrials.service._HTTPError.__init__': ( 'service.html#_httperror.__init__',
+                                                                                  'pyseatrials/service.py'),
+                                     'pyseatrials.service._columns': ('service.html#_columns', 'pyseatrials/service.py'),
+                                     'pyseatrials.service._json': ('service.html#_json', 'pyseatrials/service.py'),
+                                     'pyseatrials.service._read_request': ('service.html#_read_request', 'pyseatrials/service.py'),
+                                     'pyseatrials.service.apply_stages': ('service.html#apply_stages', 'pyseatrials/service.py'),
+                                     'pyseatrials.service.serve': ('service.html#serve', 'pyseatrials/service.py')},
             'pyseatrials.shallow': { 'pyseatrials.shallow.shallow_water_correction': ( 'shallow_water.html#shallow_water_correction',
                                                                                        'pyseatrials/shallow.py')},
-            'pyseatrials.trig': { 'pyseatrials.trig.adjacent_magnitude_fn': ('trig.html#adjacent_magnitude_fn', 'pyseatrials/trig.py'),
+            'pyseatrials.stream': { 'pyseatrials.stream.RollingCircularMean': ('stream.html#rollingcircularmean', 'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.RollingCircularMean.__call__': ( 'stream.html#rollingcircularmean.__call__',
+                                                                                         'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.RollingCircularMean._values': ( 'stream.html#rollingcircularmean._values',
+                                                                                        'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.RollingCircularMean.reset': ( 'stream.html#rollingcircularmean.reset',
+                                                                                      'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.RollingCurrent': ('stream.html#rollingcurrent', 'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.RollingCurrent.__call__': ( 'stream.html#rollingcurrent.__call__',
+                                                                                    'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.RollingCurrent.__init__': ( 'stream.html#rollingcurrent.__init__',
+                                                                                    'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.RollingCurrent._values': ( 'stream.html#rollingcurrent._values',
+                                                                                   'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.RollingMean': ('stream.html#rollingmean', 'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.RollingMean.__call__': ( 'stream.html#rollingmean.__call__',
+                                                                                 'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.RollingMean.__init__': ( 'stream.html#rollingmean.__init__',
+                                                                                 'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.RollingMean._mean': ('stream.html#rollingmean._mean', 'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.RollingMean._values': ('stream.html#rollingmean._values', 'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.RollingMean.reset': ('stream.html#rollingmean.reset', 'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.StreamingAnalysis': ('stream.html#streaminganalysis', 'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.StreamingAnalysis.__init__': ( 'stream.html#streaminganalysis.__init__',
+                                                                                       'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.StreamingAnalysis.process': ( 'stream.html#streaminganalysis.process',
+                                                                                      'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.StreamingAnalysis.process_chunk': ( 'stream.html#streaminganalysis.process_chunk',
+                                                                                            'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.StreamingAnalysis.reset': ( 'stream.html#streaminganalysis.reset',
+                                                                                    'pyseatrials/stream.py'),
+                                    'pyseatrials.stream._join': ('stream.html#_join', 'pyseatrials/stream.py'),
+                                    'pyseatrials.stream._trailing_mean': ('stream.html#_trailing_mean', 'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.batch_columns': ('stream.html#batch_columns', 'pyseatrials/stream.py'),
+                                    'pyseatrials.stream.rechunk': ('stream.html#rechunk', 'pyseatrials/stream.py')},
+            'pyseatrials.trig': { 'pyseatrials.trig._mean_resultant': ('trig.html#_mean_resultant', 'pyseatrials/trig.py'),
+                                  'pyseatrials.trig.adjacent_magnitude_fn': ('trig.html#adjacent_magnitude_fn', 'pyseatrials/trig.py'),
+                                  'pyseatrials.trig.angle_difference': ('trig.html#angle_difference', 'pyseatrials/trig.py'),
+                                  'pyseatrials.trig.circular_mean': ('trig.html#circular_mean', 'pyseatrials/trig.py'),
+                                  'pyseatrials.trig.circular_variance': ('trig.html#circular_variance', 'pyseatrials/trig.py'),
                                   'pyseatrials.trig.combine_vectors': ('trig.html#combine_vectors', 'pyseatrials/trig.py'),
                                   'pyseatrials.trig.find_gamma_fn': ('trig.html#find_gamma_fn', 'pyseatrials/trig.py'),
                                   'pyseatrials.trig.law_of_cosines': ('trig.html#law_of_cosines', 'pyseatrials/trig.py'),
-                                  'pyseatrials.trig.opposite_magnitude_fn': ('trig.html#opposite_magnitude_fn', 'pyseatrials/trig.py')},
+                                  'pyseatrials.trig.opposite_magnitude_fn': ('trig.html#opposite_magnitude_fn', 'pyseatrials/trig.py'),
+                                  'pyseatrials.trig.rolling_circular_stats': ('trig.html#rolling_circular_stats', 'pyseatrials/trig.py'),
+                                  'pyseatrials.trig.weighted_circular_mean': ('trig.html#weighted_circular_mean', 'pyseatrials/trig.py')},
             'pyseatrials.wave': { 'pyseatrials.wave.R_AWL': ('wave_resistance.html#r_awl', 'pyseatrials/wave.py'),
                                   'pyseatrials.wave._R_AWML': ('wave_resistance.html#_r_awml', 'pyseatrials/wave.py'),
                                   'pyseatrials.wave._R_AWRL': ('wave_resistance.html#_r_awrl', 'pyseatrials/wave.py'),
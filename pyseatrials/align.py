@@ -0,0 +1,196 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/21_align.ipynb.
+
+# %% auto 0
+__all__ = ['METHODS', 'ANGLE_COLUMNS', 'align', 'align_tables', 'StreamAligner']
+
+# %% ../nbs/21_align.ipynb 4
+import numpy as np
+
+# %% ../nbs/21_align.ipynb 6
+METHODS = ('nearest', 'linear', 'mean')
+#the columns of the run table and of `read_nmea` that are directions [rad]
+ANGLE_COLUMNS = ('heading', 'cog', 'relative_wind_direction', 'true_wind_direction')
+
+def _seconds(times) -> np.ndarray: #float seconds, since the epoch for datetime64
+    "Timestamps as seconds"
+    times = np.asarray(times)
+    if np.issubdtype(times.dtype, np.datetime64):
+        return times.astype('datetime64[ns]').astype(np.int64)/1e9
+    return times.astype(np.float64)
+
+def _window_mean(times, values, target, window):
+    "The mean of the finite values in the window centred on each target time"
+    finite = np.isfinite(values)
+    total = np.concatenate(([0], np.cumsum(np.where(finite, values, 0))))
+    count = np.concatenate(([0], np.cumsum(finite)))
+    lo = np.searchsorted(times, target - window/2, side = 'left')
+    hi = np.searchsorted(times, target + window/2, side = 'left')
+    n = count[hi] - count[lo]
+    return np.divide(total[hi] - total[lo], n, out = np.full(len(target), np.nan), where = n > 0)
+
+# %% ../nbs/21_align.ipynb 7
+def align(times, #The sorted timestamps of the samples, seconds or datetime64
+          values, #The samples
+          target, #The times to resample to, in the same units as `times`
+          method:str = 'nearest', #One of `METHODS`
+          tolerance:float = np.inf, #The furthest a sample used by `nearest` or `linear` can be from the target time [s]
+          window:float = None, #The width of the window of `mean` [s]
+          angle:bool = False #Whether the values are directions [rad]
+         ) -> np.ndarray: #The values at the target times, NaN where there is no sample
+    "Resample one stream onto the target times"
+
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, not {method!r}")
+    if method == 'mean' and window is None:
+        raise ValueError("the mean method needs a window")
+    times, target, values = _seconds(times), _seconds(target), np.asarray(values, np.float64)
+
+    if angle:
+        #directions are resampled as unit vectors
+        cos = align(times, np.cos(values), target, method, tolerance, window)
+        sin = align(times, np.sin(values), target, method, tolerance, window)
+        return np.mod(np.arctan2(sin, cos), 2*np.pi)
+    if method == 'mean':
+        return _window_mean(times, values, target, window)
+    if len(times) == 0:
+        return np.full(len(target), np.nan)
+
+    #the samples at or before and after each target time
+    after = np.searchsorted(times, target, side = 'right')
+    has_left, has_right = after > 0, after < len(times)
+    left, right = np.maximum(after - 1, 0), np.minimum(after, len(times) - 1)
+    to_left, to_right = target - times[left], times[right] - target
+
+    if method == 'nearest':
+        use_right = has_right & (~has_left | (to_right < to_left))
+        distance = np.where(use_right, to_right, to_left)
+        return np.where(distance <= tolerance, values[np.where(use_right, right, left)], np.nan)
+
+    exact = has_left & (to_left == 0)
+    between = has_left & has_right & (to_left <= tolerance) & (to_right <= tolerance)
+    weight = np.divide(to_left, times[right] - times[left], out = np.zeros(len(target)), where = between)
+    return np.where(exact | between, values[left] + weight*(values[right] - values[left]), np.nan)
+
+# %% ../nbs/21_align.ipynb 11
+def _sorted(table:dict) -> tuple: #The seconds and the columns, sorted by time and without the missing times
+    "The samples of a table with a `timestamp` column"
+    seconds = _seconds(table['timestamp'])
+    keep = ~np.isnan(seconds)
+    order = np.argsort(seconds[keep], kind = 'stable')
+    columns = {name: np.asarray(values)[keep][order] for name, values in table.items() if name not in ('timestamp', 'line')}
+    return seconds[keep][order], columns
+
+def align_tables(target, #The times to resample to, seconds or datetime64
+                 tables:dict, #Tables with a `timestamp` column in the units of `target`, by name
+                 methods = 'nearest', #One of `METHODS` for every table, or a dictionary with a method for each
+                 tolerance:float = np.inf, #The furthest a sample used by `nearest` or `linear` can be from the target time [s]
+                 window:float = None, #The width of the window of `mean` [s]
+                 angles = ANGLE_COLUMNS #The columns that are directions [rad]
+                ) -> dict: #A table with the `timestamp` and every column of the tables
+    "Resample every table onto the target times and merge them"
+
+    res = {'timestamp': np.asarray(target)}
+    target = _seconds(target)
+    for name, table in tables.items():
+        method = methods if isinstance(methods, str) else methods[name]
+        times, columns = table if isinstance(table, tuple) else _sorted(table)
+        for column, values in columns.items():
+            if column in res:
+                raise ValueError(f"The column {column!r} is in more than one table")
+            res[column] = align(times, values, target, method, tolerance, window, column in angles)
+    return res
+
+# %% ../nbs/21_align.ipynb 16
+class StreamAligner:
+    "Align chunks of several timestamped streams onto a regular time base, holding only the samples still needed"
+
+    def __init__(self,
+                 methods:dict, #The method of each stream, one of `METHODS`
+                 period:float, #The time between the target times [s]
+                 tolerance:float = np.inf, #The furthest a sample used by `nearest` or `linear` can be from the target time [s]
+                 window:float = None, #The width of the window of `mean` [s], `period` if None
+                 angles = ANGLE_COLUMNS, #The columns that are directions [rad]
+                 max_lag:float = np.inf #Streams behind the most recent by more than this are not waited for [s]
+                ):
+        for method in methods.values():
+            if method not in METHODS:
+                raise ValueError(f"method must be one of {METHODS}, not {method!r}")
+        self.methods, self.period, self.tolerance = dict(methods), period, tolerance
+        self.window = period if window is None else window
+        self.angles, self.max_lag = angles, max_lag
+        self.reset()
+
+    def reset(self):
+        "Forget the samples held, ready for a new voyage"
+        self.buffers = {name: None for name in self.methods}
+        self.start, self.step, self.datetime = None, 0, False
+
+    def _lookahead(self, name:str) -> float:
+        return self.window/2 if self.methods[name] == 'mean' else 0.0
+
+    def push(self,
+             name:str, #The stream of the chunk
+             table:dict #A chunk of the stream with a `timestamp` column
+            ) -> dict: #The aligned rows now complete, possibly none
+        "Add a chunk of a stream"
+        self.datetime |= np.issubdtype(np.asarray(table['timestamp']).dtype, np.datetime64)
+        times, columns = _sorted(table)
+        if self.buffers[name] is not None:
+            held, held_columns = self.buffers[name]
+            times = np.concatenate((held, times))
+            columns = {column: np.concatenate((held_columns[column], values)) for column, values in columns.items()}
+        self.buffers[name] = (times, columns)
+        return self._emit(final = False)
+
+    def flush(self) -> dict: #The remaining aligned rows
+        "The rows up to the last sample of any stream, at the end of the voyage"
+        return self._emit(final = True)
+
+    def _emit(self, final:bool) -> dict:
+        buffers = {name: buffer for name, buffer in self.buffers.items() if buffer is not None and len(buffer[0])}
+        if not buffers or (not final and len(buffers) < len(self.buffers)):
+            return {}
+        if self.start is None:
+            self.start = np.ceil(min(times[0] for times, _ in buffers.values())/self.period)*self.period
+
+        last = {name: times[-1] for name, (times, _) in buffers.items()}
+        if final:
+            until = max(last.values())
+        else:
+            newest = max(last.values())
+            until = min(last[name] - self._lookahead(name) for name in buffers if newest - last[name] <= self.max_lag)
+        n = max(int(np.floor((until - self.start)/self.period)) - self.step + 1, 0)
+        target = self.start + self.period*(self.step + np.arange(n))
+        self.step += n
+
+        res = align_tables(target, buffers, {name: self.methods[name] for name in buffers}, self.tolerance, self.window, self.angles)
+        if self.datetime:
+            res['timestamp'] = np.round(target*1e9).astype(np.int64).astype('datetime64[ns]')
+        self._trim()
+        return res
+
+    def _trim(self):
+        "Drop the samples the next target times do not need"
+        following = self.start + self.period*self.step
+        for name, buffer in self.buffers.items():
+            if buffer is None:
+                continue
+            times, columns = buffer
+            if self.methods[name] == 'mean':
+                cut = np.searchsorted(times, following - self.window/2, side = 'left')
+            else:
+                #the last sample before the next target time
+                cut = max(np.searchsorted(times, following, side = 'right') - 1, 0)
+            self.buffers[name] = (times[cut:], {column: values[cut:] for column, values in columns.items()})
+
+    def align(self,
+              chunks #An iterable of (stream name, table) pairs
+             ): #yields the aligned rows as they are complete
+        "Align a sequence of chunks, then flush"
+        for name, table in chunks:
+            res = self.push(name, table)
+            if len(res.get('timestamp', ())):
+                yield res
+        res = self.flush()
+        if len(res.get('timestamp', ())):
+            yield res
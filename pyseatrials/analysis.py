@@ -0,0 +1,204 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/11_analysis.ipynb.
+
+# %% auto 0
+__all__ = ['RUN_COLUMNS', 'WEATHER_COLUMNS', 'SHALLOW_WATER_COLUMNS', 'CURRENT_METHODS', 'SeaTrialAnalysis']
+
+# %% ../nbs/11_analysis.ipynb 4
+import numpy as np
+from .hull import Hull
+from .general import power_correction, shaft_speed_correction, wind_resistance, temp_salinity_water_resistance_components, displacement_correction
+from .basic import frictional_resistance_coefs, moist_air_density, calculate_total_resistance_coef
+from .wind import rel2true_speed, rel2true_dir, true2rel_speed, true2rel_dir, vertical_position_anemometer
+from .wind_res import interpolate_cx
+from .wave import stawave1_fn
+from .current import current_mean_of_means
+from .shallow import shallow_water_correction
+from .instrument import instrumented
+from .precision import as_compute
+
+# %% ../nbs/11_analysis.ipynb 6
+RUN_COLUMNS = ('sog', 'heading', 'relative_wind_speed', 'relative_wind_direction', 'power', 'shaft_speed')
+WEATHER_COLUMNS = ('air_pressure', 'air_temperature', 'relative_humidity')
+SHALLOW_WATER_COLUMNS = ('water_depth', 'displacement', 'waterplane_area')
+CURRENT_METHODS = ('mean_of_means', 'double_run', 'none')
+
+# %% ../nbs/11_analysis.ipynb 8
+class SeaTrialAnalysis:
+    "The ITTC 7.5-04-01-01.1 speed/power analysis of a table of trial runs"
+
+    stages = ('wind', 'waves', 'current', 'water', 'power', 'displacement', 'shallow_water')
+
+    def __init__(self, 
+                 hull:Hull, #The hull particulars of the ship
+                 transverse_area:float, #The maximum transverse area of the ship exposed to the wind [m^2]
+                 etaD_id:float, #propulsion efficiency coefficient in ideal conditions (from model test) [-]
+                 shaft_power_overload:float, #overload factor of the power from load variation model test [-]
+                 shaft_speed_overload:float, #overload factor of the shaft speed from load variation model test [-]
+                 wind_coefficients = None, #table from `load_wind_coefficients` or a function of the relative wind direction [rad]
+                 ship_state:str = 'average', #The column of the wind coefficient table to use
+                 CT0:float = None, #total resistance coefficient in reference conditions, estimated from the trial if None
+                 reference_displacement:float = None, #displacement of the model tests [m^3], no correction if None
+                 anemometer_height:float = None, #height of the anemometer above the waterline [m], no correction if None
+                 reference_height:float = 10, #reference height of the wind speed [m]
+                 air_density:float = 1.225, #air density used when the run table has no weather data [kg/m^3]
+                 reference_temperature:float = 15, #reference water temperature [degC]
+                 reference_salinity:float = 35e-3, #reference water salinity [kg/kg]
+                 reference_density:float = 1026, #reference water density [kg/m^3]
+                 current_method:str = 'mean_of_means' #One of `CURRENT_METHODS`
+                ):
+        if current_method not in CURRENT_METHODS:
+            raise ValueError(f"current_method must be one of {CURRENT_METHODS}, not {current_method!r}")
+        self.hull, self.transverse_area, self.etaD_id = hull, transverse_area, etaD_id
+        self.shaft_power_overload, self.shaft_speed_overload = shaft_power_overload, shaft_speed_overload
+        self.wind_coefficients, self.ship_state, self.CT0 = wind_coefficients, ship_state, CT0
+        self.reference_displacement, self.anemometer_height, self.reference_height = reference_displacement, anemometer_height, reference_height
+        self.air_density = air_density
+        self.reference_temperature, self.reference_salinity, self.reference_density = reference_temperature, reference_salinity, reference_density
+        self.current_method = current_method
+
+    @instrumented
+    def run(self, 
+            runs #The run table, a DataFrame or dictionary of arrays
+           ) -> 'pd.DataFrame': #The run table with the corrections and corrected speed and power added
+        "Apply every correction stage to the run table"
+        import pandas as pd
+
+        #timestamps and other columns that are not numbers keep their types
+        res = {name: as_compute(runs[name]) if np.asarray(runs[name]).dtype.kind in 'fiu' else np.asarray(runs[name]) for name in runs.keys()}
+        missing = [name for name in RUN_COLUMNS if name not in res]
+        if missing:
+            raise ValueError(f"The run table is missing the columns {missing}")
+
+        for stage in self.stages:
+            res.update(getattr(self, stage)(res))
+
+        return pd.DataFrame(res)
+
+    def _wind_coefficient(self, relative_wind_direction):
+        "C_X from the table or function, symmetric about the centre line"
+        direction = np.abs(np.arctan2(np.sin(relative_wind_direction), np.cos(relative_wind_direction)))
+        if callable(self.wind_coefficients):
+            return self.wind_coefficients(direction)
+        return interpolate_cx(self.wind_coefficients, direction, self.ship_state)
+
+    @instrumented
+    def wind(self, res:dict) -> dict:
+        "The true wind, the relative wind at the reference height and the wind resistance"
+
+        sog, heading = res['sog'], res['heading']
+        true_wind_speed = rel2true_speed(res['relative_wind_speed'], sog, res['relative_wind_direction'])
+        true_wind_direction = rel2true_dir(res['relative_wind_speed'], sog, res['relative_wind_direction'], heading)
+
+        if self.anemometer_height is not None:
+            true_wind_speed = vertical_position_anemometer(true_wind_speed, self.reference_height, self.anemometer_height)
+        relative_wind_speed_ref = true2rel_speed(true_wind_speed, sog, true_wind_direction, heading)
+        relative_wind_direction_ref = true2rel_dir(true_wind_speed, sog, true_wind_direction, heading)
+
+        weather = [name for name in WEATHER_COLUMNS if name in res]
+        if len(weather) == len(WEATHER_COLUMNS):
+            air_density = moist_air_density(res['air_pressure'], res['air_temperature'], res['relative_humidity'])
+        elif weather:
+            missing = [name for name in WEATHER_COLUMNS if name not in res]
+            raise ValueError(f"The air density needs all of the weather columns {WEATHER_COLUMNS}, the run table is missing {missing}")
+        else:
+            air_density = np.full_like(sog, self.air_density)
+
+        if self.wind_coefficients is None:
+            R_AA = np.zeros_like(sog)
+        else:
+            R_AA = wind_resistance(air_density, -self._wind_coefficient(relative_wind_direction_ref), -float(self._wind_coefficient(0.0)), 
+                                   self.transverse_area, relative_wind_speed_ref, sog)
+
+        return {'true_wind_speed':true_wind_speed, 'true_wind_direction':true_wind_direction, 
+                'relative_wind_speed_ref':relative_wind_speed_ref, 'relative_wind_direction_ref':relative_wind_direction_ref, 
+                'air_density':air_density, 'R_AA':R_AA}
+
+    @instrumented
+    def waves(self, res:dict) -> dict:
+        "The added resistance due to waves using STAWAVE-1"
+
+        if 'wave_height' not in res:
+            return {'R_AW': np.zeros_like(res['sog'])}
+        water_density = res.get('water_density', self.reference_density)
+
+        return {'R_AW': stawave1_fn(wave_height = res['wave_height'], water_density = water_density, hull = self.hull)}
+
+    @instrumented
+    def water(self, res:dict) -> dict:
+        "The resistance due to the water temperature and salinity differing from the reference values"
+
+        stw = res['stw']
+        temperature = res.get('water_temperature', self.reference_temperature)
+        salinity = res.get('salinity', self.reference_salinity)
+        water_density = res.get('water_density', np.full_like(stw, self.reference_density))
+
+        coefs = frictional_resistance_coefs(stw, temperature = temperature, salinity = salinity, water_density = water_density, hull = self.hull)
+        coefs_0 = frictional_resistance_coefs(stw, temperature = self.reference_temperature, salinity = self.reference_salinity, 
+                                              water_density = self.reference_density, hull = self.hull)
+        S = self.hull.wetted_surface_area
+
+        CT0 = self.CT0
+        if CT0 is None:
+            #approximate, R_AS itself depends on CT0 so only the wind and wave resistance are removed
+            CT0 = calculate_total_resistance_coef(res['power'] * self.etaD_id / stw - res['R_AA'] - res['R_AW'], stw, S, self.reference_density)
+
+        components = temp_salinity_water_resistance_components(coefs['C_F'], coefs_0['C_F'], coefs['delta_C_F'], coefs_0['delta_C_F'], 
+                                                               CT0, S, stw, water_density, self.reference_density)
+
+        return {'water_density':water_density, 'C_V':coefs['C_V'], 'R_AS':components['RAS'], 
+                'delta_R':res['R_AA'] + res['R_AW'] + components['RAS']}
+
+    @instrumented
+    def current(self, res:dict) -> dict:
+        "The speed through water corrected for the current"
+
+        sog = res['sog']
+        if self.current_method == 'mean_of_means':
+            if len(sog) != 4 or 'time' not in res:
+                raise ValueError("The mean_of_means current correction needs exactly four runs and a 'time' column")
+            stw, current, _ = current_mean_of_means(sog, res['time'][0], res['time'][1] - res['time'][0])
+        elif self.current_method == 'double_run':
+            if len(sog) % 2:
+                raise ValueError("The double_run current correction needs the runs in pairs")
+            stw = np.repeat(sog.reshape(-1, 2).mean(axis = 1), 2)
+            current = stw - sog
+        else:
+            stw = res.get('stw', sog)
+            current = stw - sog
+
+        return {'stw':stw, 'current':current}
+
+    @instrumented
+    def power(self, res:dict) -> dict:
+        "The delivered power and shaft speed in ideal conditions"
+
+        P_id = power_correction(res['power'], res['delta_R'], res['stw'], self.etaD_id, self.shaft_power_overload)
+        n_id = shaft_speed_correction(res['shaft_speed'], self.shaft_speed_overload, res['power'], P_id)
+
+        return {'P_id':P_id, 'n_id':n_id, 'P_corrected':P_id}
+
+    @instrumented
+    def displacement(self, res:dict) -> dict:
+        "The power corrected to the reference displacement"
+
+        if self.reference_displacement is None or 'displacement' not in res:
+            return {}
+
+        return {'P_corrected': displacement_correction(res['P_corrected'], res['displacement'], self.reference_displacement)}
+
+    @instrumented
+    def shallow_water(self, res:dict) -> dict:
+        "The power corrected to deep water"
+
+        if 'water_depth' not in res:
+            return {}
+        missing = [name for name in SHALLOW_WATER_COLUMNS if name not in res]
+        if missing:
+            raise ValueError(f"The shallow water correction needs all of the columns {SHALLOW_WATER_COLUMNS}, the run table is missing {missing}")
+
+        P_D_deep, sinkage, R_V = shallow_water_correction(res['C_V'], res['stw'], displacement = res['displacement'], 
+                                                          waterplane_area = res['waterplane_area'], power = res['P_corrected'], 
+                                                          etad = self.etaD_id, water_density = res['water_density'], 
+                                                          water_depth = res['water_depth'], hull = self.hull)
+
+        return {'sinkage':sinkage, 'R_V_shallow':R_V, 'P_corrected':P_D_deep}
@@ -1,32 +1,54 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/98_basic_hydro_functions.ipynb.
 
 # %% auto 0
-__all__ = ['load_water_properties', 'calc_salinity', 'dynamic_viscosity', 'kinematic_viscosity_fn', 'reynolds_number_fn',
-           'froude_number_fn', 'CF_fn', 'roughness_resistance_fn', 'calculate_form_factor',
-           'calculate_viscous_resistance_coef', 'calculate_total_resistance_coef', 'wetted_surface_area', 'air_density']
+__all__ = ['FRICTION_DTYPE', 'ESW_COEFFICIENTS', 'HUMIDITY_TYPES', 'load_water_properties', 'calc_salinity', 'dynamic_viscosity',
+           'kinematic_viscosity_fn', 'reynolds_number_fn', 'froude_number_fn', 'CF_fn', 'roughness_resistance_fn',
+           'calculate_form_factor', 'calculate_viscous_resistance_coef', 'frictional_resistance_coefs',
+           'calculate_total_resistance_coef', 'wetted_surface_area', 'saturation_vapour_pressure', 'air_density',
+           'moist_air_density']
 
 # %% ../nbs/98_basic_hydro_functions.ipynb 4
 import numpy as np
-import pandas as pd
-from fastcore.test import *
+from .instrument import instrumented
+from .precision import resolve_dtype, promote, demote, record_dtype
 import pkgutil
 from io import BytesIO
-from seawater import dens
-from seawater.library import T90conv
 
-# %% ../nbs/98_basic_hydro_functions.ipynb 6
-def load_water_properties() -> pd.DataFrame:
+# %% ../nbs/98_basic_hydro_functions.ipynb 5
+def _require(**values):
+    "ValueError naming the arguments which were not given"
+    missing = [name for name, value in values.items() if value is None]
+    if missing:
+        raise ValueError(f"The arguments {missing} are needed")
+
+def _from_hull(hull, #The `Hull` or None
+               names:dict, #The hull attribute of each argument named differently
+               **values #The hull particulars, None if not given
+              ) -> list: #The values in order
+    "Each particular as given, otherwise the attribute of `hull`, ValueError naming those still missing"
+    if hull is not None:
+        values = {name: getattr(hull, names.get(name, name)) if value is None else value for name, value in values.items()}
+    missing = [name for name, value in values.items() if value is None]
+    if missing:
+        raise ValueError(f"The arguments {missing} are needed, as arguments or from the `hull`")
+    return list(values.values())
+
+# %% ../nbs/98_basic_hydro_functions.ipynb 7
+@instrumented
+def load_water_properties() -> 'pd.DataFrame':
     """loads a 2D lookup table of water dynamic viscosity
 
     Returns:
         pd.DataFrame: dataframe of water properties
     """    
+    import pandas as pd
     water_properties = pkgutil.get_data('pyseatrials', 'water_properties/dyn_visc.parquet')
     water_properties_df = pd.read_parquet(BytesIO(water_properties))
     
     return water_properties_df
 
-# %% ../nbs/98_basic_hydro_functions.ipynb 8
+# %% ../nbs/98_basic_hydro_functions.ipynb 9
+@instrumented
 def calc_salinity(measured_density:float, #measured water density [kg/m3]
                   measured_temperature:float #measured water temperature [degC]
                   ) -> float:
@@ -39,6 +61,11 @@ def calc_salinity(measured_density:float, #measured water density [kg/m3]
     Returns:
         float: water salinity
     """    
+    #imported here as seawater and pandas are slow to import and only needed by this function
+    import pandas as pd
+    from seawater import dens
+    from seawater.library import T90conv
+    
     s = np.arange(0, 40, 0.02) #salinity
     t = T90conv(np.ones(len(s))*measured_temperature) #temperature
     p = np.zeros(len(s)) #pressure (sea level)
@@ -49,7 +76,8 @@ def calc_salinity(measured_density:float, #measured water density [kg/m3]
     
     return out 
 
-# %% ../nbs/98_basic_hydro_functions.ipynb 10
+# %% ../nbs/98_basic_hydro_functions.ipynb 11
+@instrumented
 def dynamic_viscosity(salinity:float, #A positive value of the water salinity [g/kg]
                       temperature:float #The temperature in celsius [C]
                      )->float: #returns values in [kg/ms]
@@ -63,121 +91,270 @@ def dynamic_viscosity(salinity:float, #A positive value of the water salinity [g
     
     return mu_w * (1 + A*salinity + B*salinity**2)
 
-# %% ../nbs/98_basic_hydro_functions.ipynb 19
+# %% ../nbs/98_basic_hydro_functions.ipynb 20
+@instrumented
 def kinematic_viscosity_fn(dynamic_viscosity:float = 1.18e-3, #This value is typically 1.18e-3 [kg/(ms)]
-                          water_density:float = 1026 #The density of water under current conditions [kg/m^3]
+                          water_density:float = 1026, #The density of water under current conditions [kg/m^3]
+                          out:np.ndarray = None #optional array to write the result into
                          )-> float: #[m^2/s]
     
     "A simple wrapper calculating the ratio of dynamic viscosity and water density"
     
+    if out is not None:
+        return np.divide(dynamic_viscosity, water_density, out = out)
+    
     return dynamic_viscosity/water_density
     
 
-# %% ../nbs/98_basic_hydro_functions.ipynb 26
+# %% ../nbs/98_basic_hydro_functions.ipynb 27
+@instrumented
 def reynolds_number_fn(stw:float, #Speed through water [m/s]
                       length:float, #Length of the vessel, $L_{os}$ Length overall submerged is typically used [m]
-                      kinematic_viscosity:float # [m^2/s]
+                      kinematic_viscosity:float, # [m^2/s]
+                      out:np.ndarray = None #optional array to write the result into
                       )->float: # Reynolds number is dimensionless
     
     "The Reynolds number is a element of fluid dynamics and is often used to predict whether flow is laminar or turbulent"
     
+    if out is not None:
+        np.multiply(stw, length, out = out)
+        return np.divide(out, kinematic_viscosity, out = out)
+    
     return stw * length / kinematic_viscosity
     
     
 
-# %% ../nbs/98_basic_hydro_functions.ipynb 31
+# %% ../nbs/98_basic_hydro_functions.ipynb 32
+@instrumented
 def froude_number_fn(stw:float, #speed through water [m/s]
                     length:float,#Length of vessel, typically $L_{wl}$ Length of waterline [m]
-                    gravity:float = 9.81 #acceleration due to gravity [m/s^2]
+                    gravity:float = 9.81, #acceleration due to gravity [m/s^2]
+                    out:np.ndarray = None #optional array to write the result into
                     )-> float : #The Froude number is a dimensionless value
     
     "The Froude number is useful for calculating the water resistance"
     
+    if out is not None:
+        return np.divide(stw, np.sqrt(gravity * length), out = out)
+    
     return stw/np.sqrt(gravity * length)
 
-# %% ../nbs/98_basic_hydro_functions.ipynb 36
+# %% ../nbs/98_basic_hydro_functions.ipynb 37
+@instrumented
 def CF_fn(reynolds_number:float, #indicating the type of flow of the water
           c1:float = 0.075, # An adjustment value dault from ITTC-1957
-          c2:float = 0 #An adjustment value the default is 0
+          c2:float = 0, #An adjustment value the default is 0
+          out:np.ndarray = None #optional array to write the result into
       )-> float: #This is a dimensionaless value
     
     "An essential part of calculating the resistance experienced by the ship"
     
-    return c1 / (np.log10(reynolds_number) -2) ** 2   + c2
+    if out is not None:
+        #a float32 buffer is filled with the result of the promoted calculation
+        if out.dtype == np.float32:
+            out[...] = CF_fn(promote(reynolds_number), c1, c2)
+            return out
+        np.log10(reynolds_number, out = out)
+        np.subtract(out, 2, out = out)
+        np.multiply(out, out, out = out)
+        np.divide(c1, out, out = out)
+        return np.add(out, c2, out = out)
+    
+    #float32 Reynolds numbers are promoted, the small difference of the logarithm from 2 is squared
+    return demote(c1 / (np.log10(promote(reynolds_number)) -2) ** 2   + c2, reynolds_number)
     
 
-# %% ../nbs/98_basic_hydro_functions.ipynb 40
+# %% ../nbs/98_basic_hydro_functions.ipynb 41
+@instrumented
 def roughness_resistance_fn(
                           length:float, #Length of the vessel at waterline [m]
                           reynolds_number:float, # dimensionless value describing flow properties
                           surface_roughness:float = 150e-6, #The default value is outdated an modern hull covering are likely considerably less rough [m]
+                          out:np.ndarray = None #optional array to write the result into
                           )-> float: # The dimensionless friction factor representing surface roughness of the hull
     
     """ 
     The function CF_fn calculates a dimensionless value representing the resistance experienced by a ship based on the given parameters.
     """
 
+    if out is not None:
+        np.power(reynolds_number, -1/3, out = out)
+        np.multiply(10, out, out = out)
+        np.subtract((surface_roughness / length)**(1/3), out, out = out)
+        np.multiply(11/250, out, out = out)
+        return np.add(out, 1/8e3, out = out)
+    
     ratio_value = surface_roughness / length
     return (11/250)* (ratio_value**(1/3) - 10 * reynolds_number**(-1/3)) + (1/8e3)
     
 
-# %% ../nbs/98_basic_hydro_functions.ipynb 44
-def calculate_form_factor(C_B: float, # The block coefficient
-                          B: float, #Beam of the vessel [m]
-                          L_pp: float, #The length between perpendiculars [m]
-                          T_M: float #The draught at midship [m]
+# %% ../nbs/98_basic_hydro_functions.ipynb 45
+@instrumented
+def calculate_form_factor(C_B: float = None, # The block coefficient
+                          B: float = None, #Beam of the vessel [m]
+                          L_pp: float = None, #The length between perpendiculars [m]
+                          T_M: float = None, #The draught at midship [m]
+                          *,
+                          hull = None #Optional `Hull`, gives the particulars not passed, its cached form factor is returned if none are
                           ) -> float: #The dimensionless form factor for the ship
     """
     The function `calculate_form_factor` calculates the dimensionless form factor (1+k) for a ship using the Gross & Watanabe method.
     """
+    if hull is not None and C_B is None and B is None and L_pp is None and T_M is None:
+        return hull.form_factor
+    C_B, B, L_pp, T_M = _from_hull(hull, {}, C_B = C_B, B = B, L_pp = L_pp, T_M = T_M)
+
     k = 1.017 + 20 * C_B * (B / L_pp)**2 * (T_M / B)**0.5
     return k
 
 
-# %% ../nbs/98_basic_hydro_functions.ipynb 48
+# %% ../nbs/98_basic_hydro_functions.ipynb 49
+@instrumented
 def calculate_viscous_resistance_coef(C_F: float, #The frictional correlation coefficient
                                  form_factor: float, #The form factor (1+k)
-                                 delta_C_F: float #The roughness resistance coefficient
+                                 delta_C_F: float, #The roughness resistance coefficient
+                                 out:np.ndarray = None #optional array to write the result into
                                  ) -> float: #The coefficient of viscous friction
     """
     The function `calculate_viscous_resistance_coef` calculates the dimensionless viscous resistance coefficient for a vessel based on the given parameters.
     """
+    if out is not None:
+        np.multiply(1.06, C_F, out = out)
+        np.multiply(out, form_factor, out = out)
+        return np.add(out, delta_C_F, out = out)
+    
     return 1.06 * C_F * form_factor + delta_C_F
 
-# %% ../nbs/98_basic_hydro_functions.ipynb 55
+# %% ../nbs/98_basic_hydro_functions.ipynb 56
+FRICTION_DTYPE = np.dtype([('Re', float), ('C_F', float), ('delta_C_F', float), ('C_V', float)])
+
+@instrumented
+def frictional_resistance_coefs(stw:float, #Speed through water [m/s]
+                                length:float = None, #Length of the vessel at waterline [m]
+                                temperature:float = None, #Water temperature [C]
+                                salinity:float = None, #Water salinity, same units as `dynamic_viscosity`
+                                C_B:float = None, #The block coefficient
+                                B:float = None, #Beam of the vessel [m]
+                                L_pp:float = None, #The length between perpendiculars [m]
+                                T_M:float = None, #The draught at midship [m]
+                                water_density:float = 1026, #The density of water under current conditions [kg/m^3]
+                                surface_roughness:float = None, #Hull surface roughness, that of the `hull` or 150e-6 if None [m]
+                                c1:float = 0.075, #An adjustment value default from ITTC-1957
+                                c2:float = 0, #An adjustment value the default is 0
+                                out:np.ndarray = None, #Optional record array of `FRICTION_DTYPE` to write the results into
+                                *,
+                                hull = None #Optional `Hull`, gives the length, hull coefficients and surface roughness not passed
+                               ) -> np.ndarray: #Record array with fields 'Re', 'C_F', 'delta_C_F' and 'C_V'
+
+    "Calculate the Reynolds number, frictional, roughness and viscous resistance coefficients together"
+
+    _require(stw = stw, temperature = temperature, salinity = salinity)
+    kinematic_viscosity = kinematic_viscosity_fn(dynamic_viscosity(salinity, temperature), water_density)
+    if out is None:
+        out = np.empty(np.broadcast_shapes(np.shape(stw), np.shape(kinematic_viscosity)), dtype = record_dtype(FRICTION_DTYPE, stw, kinematic_viscosity))
+
+    #per-hull constants, these do not depend on the speed
+    if hull is not None and all(value is None for value in (length, C_B, B, L_pp, T_M, surface_roughness)):
+        length, form_factor, roughness_constant = hull.L_wl, hull.form_factor, hull.roughness_constant
+    else:
+        length, C_B, B, L_pp, T_M = _from_hull(hull, {'length': 'L_wl'}, length = length, C_B = C_B, B = B, L_pp = L_pp, T_M = T_M)
+        if surface_roughness is None:
+            surface_roughness = 150e-6 if hull is None else hull.surface_roughness
+        form_factor = calculate_form_factor(C_B, B, L_pp, T_M)
+        roughness_constant = (11/250) * (surface_roughness / length)**(1/3) + (1/8e3)
+
+    #the logarithm and cube root of the Reynolds number are taken in float64, a float32 record is filled at the end
+    result = out if out.dtype == FRICTION_DTYPE else np.empty(out.shape, dtype = FRICTION_DTYPE)
+    Re, C_F, delta_C_F, C_V = result['Re'], result['C_F'], result['delta_C_F'], result['C_V']
+
+    np.multiply(promote(stw), length, out = Re)
+    np.divide(Re, promote(kinematic_viscosity), out = Re)
+
+    np.log10(Re, out = C_F)
+    np.subtract(C_F, 2, out = C_F)
+    np.square(C_F, out = C_F)
+    np.divide(c1, C_F, out = C_F)
+    np.add(C_F, c2, out = C_F)
+
+    np.power(Re, -1/3, out = delta_C_F)
+    np.multiply(delta_C_F, -10 * (11/250), out = delta_C_F)
+    np.add(delta_C_F, roughness_constant, out = delta_C_F)
+
+    np.multiply(C_F, 1.06 * form_factor, out = C_V)
+    np.add(C_V, delta_C_F, out = C_V)
+
+    if result is not out:
+        out[...] = result
+    return out
+
+# %% ../nbs/98_basic_hydro_functions.ipynb 63
+@instrumented
 def calculate_total_resistance_coef(total_resistance:float, #The total resistive force experienced by the ship [N]
                                     stw:float, #The speed through water of the ship [m/s]
                                     wsa:float, #The wetted surface area of the ship [m^2]
-                                    water_density:float = 1026 #The desnity of seawater [kg/m^3]
+                                    water_density:float = 1026, #The desnity of seawater [kg/m^3]
+                                    out:np.ndarray = None #optional array to write the result into
                                     )->float: #The dimensionless coefficient of total resistance of the ship
     
     """ 
     The function `calculate_total_resistance_coef` calculates the dimensionless coefficient of total resistance for a ship based on the given parameters.
     """
 
+    if out is not None:
+        np.multiply(stw, stw, out = out)
+        np.multiply(0.5 * water_density * wsa, out, out = out)
+        return np.divide(total_resistance, out, out = out)
+    
     denominator = 0.5 * water_density * wsa * stw**2
 
     return total_resistance/denominator 
 
-# %% ../nbs/98_basic_hydro_functions.ipynb 59
-def wetted_surface_area(draft: float, #The draft of the ship [m]
-                        beam: float, # The beam of the ship [m]
-                        length: float, # The length of the ship [m]
-                        midship_section_coeff: float, # The midship section coefficient [none]
-                        block_coeff: float, #The block coefficient [none]
-                        waterplane_area_coeff: float, # The waterplane area coefficient [none]
-                        transverse_sectional_area: float #The transverse sectional area of the bulb [m^2]
+# %% ../nbs/98_basic_hydro_functions.ipynb 67
+@instrumented
+def wetted_surface_area(draft: float = None, #The draft of the ship [m]
+                        beam: float = None, # The beam of the ship [m]
+                        length: float = None, # The length of the ship [m]
+                        midship_section_coeff: float = None, # The midship section coefficient [none]
+                        block_coeff: float = None, #The block coefficient [none]
+                        waterplane_area_coeff: float = None, # The waterplane area coefficient [none]
+                        transverse_sectional_area: float = None, #The transverse sectional area of the bulb [m^2]
+                        *,
+                        hull = None #Optional `Hull`, gives the particulars not passed, its cached wetted surface area is returned if none are
                         )->float:  # The wetted surface area of the ship [m^2]
     """
     The function `wetted_surface_area` calculates the wetted surface area of a ship using the Hotropp-Mennen formula.
 
     """
+    particulars = dict(draft = draft, beam = beam, length = length, midship_section_coeff = midship_section_coeff, block_coeff = block_coeff,
+                       waterplane_area_coeff = waterplane_area_coeff, transverse_sectional_area = transverse_sectional_area)
+    if hull is not None and all(value is None for value in particulars.values()):
+        return hull.wetted_surface_area
+    draft, beam, length, midship_section_coeff, block_coeff, waterplane_area_coeff, transverse_sectional_area = _from_hull(
+        hull, {'draft': 'T_M', 'beam': 'B', 'length': 'L_wl', 'midship_section_coeff': 'C_M', 'block_coeff': 'C_B', 
+               'waterplane_area_coeff': 'C_WP', 'transverse_sectional_area': 'A_BT'}, **particulars)
 
     wetted_surface_area = length * (2 * draft + beam) * np.sqrt(midship_section_coeff) * (0.453 + 0.4425 * block_coeff - 0.2862 * midship_section_coeff - 0.003467 * (beam / draft) + 0.3696 * waterplane_area_coeff) + 2.38 * (transverse_sectional_area / block_coeff)
 
     return wetted_surface_area
 
-# %% ../nbs/98_basic_hydro_functions.ipynb 62
+# %% ../nbs/98_basic_hydro_functions.ipynb 70
+#coefficients of the saturation vapour pressure polynomial, highest order first as used by `np.polyval`
+ESW_COEFFICIENTS = np.array([-0.30994571*10**-19, 0.11112018*10**-16, -0.17892321*10**-14, 0.21874425*10**-12, -0.29883885*10**-10,
+                             0.43884187*10**-8, -0.61117958*10**-6, 0.78736169*10**-4, -0.90826951*10**-2, 0.99999683])
+
+@instrumented
+def saturation_vapour_pressure(T:float, #air temperature in degC
+                               dtype:type = None #optional floating point type of the calculation e.g. np.float32, by default the compute dtype
+                              ) -> float: #saturation vapour pressure in mbar
+    "The saturation vapour pressure over water, FUNCTION ESW(T) of https://icoads.noaa.gov/software/other/profs"
+
+    dtype = resolve_dtype(dtype)
+    T = np.asarray(T, dtype = dtype)
+    coefficients = ESW_COEFFICIENTS.astype(dtype, copy = False)
+
+    return 6.1078/(np.polyval(coefficients, T)**8)
+
+@instrumented
 def air_density(P:float, #air pressure in mbar
                 T:float, #air temperature in degC
                 RH:float #air relative humidity as %
@@ -191,26 +368,49 @@ def air_density(P:float, #air pressure in mbar
     """
     Ppa = P * 100 #convert from mbar to PA
     Tk = T + 273.15 #air temp in Kelvin
-    
+
     Rd = 287.058 #gas constant for dry air J/(kg.K)
     Rv = 461.495  #gas constant for water vapour J/(kg.K)
-    
-    Eso = 6.1078
-    c0 = 0.99999683
-    c1 = -0.90826951*10**-2
-    c2 = 0.78736169*10**-4
-    c3 = -0.61117958*10**-6
-    c4 = 0.43884187*10**-8
-    c5 = -0.29883885*10**-10
-    c6 = 0.21874425*10**-12
-    c7 = -0.17892321*10**-14
-    c8 = 0.11112018*10**-16
-    c9 = -0.30994571*10**-19
-    p = c0+T*(c1+T*(c2+T*(c3+T*(c4+T*(c5+T*(c6+T*(c7+T*(c8+T*(c9)))))))))
-    Es = Eso/(p**8)
+
+    Es = saturation_vapour_pressure(T)
 
     pv = Es * RH
     pd = Ppa - pv
     rho = (pd / (Rd * Tk)) + (pv / (Rv * Tk))
-    
+
     return rho
+
+# %% ../nbs/98_basic_hydro_functions.ipynb 73
+HUMIDITY_TYPES = ('relative_humidity', 'dew_point', 'specific_humidity', 'mixing_ratio', 'vapour_pressure')
+
+@instrumented
+def moist_air_density(P:float, #air pressure in mbar
+                      T:float, #air temperature in degC
+                      humidity:float, #air humidity, the units depend on `humidity_type`
+                      humidity_type:str = 'relative_humidity', #One of `HUMIDITY_TYPES`
+                      dtype:type = None #optional floating point type of the calculation e.g. np.float32, by default the compute dtype
+                     ) -> float: #air density [kg/m^3]
+
+    "Calculate the air density from arrays of pressure, temperature and any of the supported humidity types"
+
+    if humidity_type not in HUMIDITY_TYPES:
+        raise ValueError(f"humidity_type must be one of {HUMIDITY_TYPES}, not {humidity_type!r}")
+
+    dtype = resolve_dtype(dtype)
+    P, T, humidity = (np.asarray(x, dtype = dtype) for x in (P, T, humidity))
+
+    #vapour pressure in Pa
+    if humidity_type == 'relative_humidity':
+        pv = saturation_vapour_pressure(T, dtype) * humidity
+    elif humidity_type == 'dew_point':
+        pv = saturation_vapour_pressure(humidity, dtype) * 100
+    elif humidity_type == 'specific_humidity':
+        pv = humidity * P / (0.622 + 0.378 * humidity) * 100
+    elif humidity_type == 'mixing_ratio':
+        pv = humidity * P / (0.622 + humidity) * 100
+    else:
+        pv = humidity * 100
+
+    Tk = T + 273.15
+
+    return ((P * 100 - pv) / (287.058 * Tk)) + (pv / (461.495 * Tk))
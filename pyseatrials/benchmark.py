@@ -0,0 +1,315 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/15_benchmark.ipynb.
+
+# %% auto 0
+__all__ = ['SIZES', 'BENCHMARKS', 'HEAVY_MODULES', 'register', 'time_function', 'run_benchmarks', 'save_results', 'load_results',
+           'results_frame', 'compare', 'import_time', 'heavy_imports']
+
+# %% ../nbs/15_benchmark.ipynb 4
+import os
+import sys
+import json
+import time
+import platform
+import subprocess
+import numpy as np
+import pandas as pd
+from importlib import metadata
+from . import basic, general, wind, wind_res, wave, current, power, shallow, trig
+
+# %% ../nbs/15_benchmark.ipynb 6
+SIZES = (1, 10**3, 10**6)
+BENCHMARKS = {}
+
+def register(name:str, #The name of the benchmark, `module.function` for a single function
+             setup, #A function of the input size and a random generator returning the function to time
+             max_size:int = None #The largest input size the benchmark is run at
+            ):
+    "Add a benchmark to `BENCHMARKS`"
+    BENCHMARKS[name] = (setup, max_size)
+
+def _case(func, #The function to benchmark
+          **args #The arguments, (low, high) tuples are replaced by uniform random arrays of the input size
+         ):
+    "A setup calling `func` with random arrays of the input size"
+    def setup(n, rng):
+        kwargs = {name: rng.uniform(*value, n) if isinstance(value, tuple) else value for name, value in args.items()}
+        return lambda: func(**kwargs)
+    return setup
+
+def _kernel(module, #The module of the function
+            name:str, #The name of the function
+            max_size:int = None, #The largest input size the benchmark is run at
+            **args #The arguments, (low, high) tuples are replaced by uniform random arrays of the input size
+           ):
+    "Register a benchmark of a public function"
+    register(f'{module.__name__.split(".")[-1]}.{name}', _case(getattr(module, name), **args), max_size)
+
+# %% ../nbs/15_benchmark.ipynb 8
+_kernel(basic, 'load_water_properties', max_size = 1)
+_kernel(basic, 'calc_salinity', max_size = 1, measured_density = 1025.0, measured_temperature = 15.0)
+_kernel(basic, 'dynamic_viscosity', salinity = (0.03, 0.04), temperature = (0, 30))
+_kernel(basic, 'kinematic_viscosity_fn', dynamic_viscosity = (1e-3, 1.8e-3), water_density = (1020, 1030))
+_kernel(basic, 'reynolds_number_fn', stw = (4, 12), length = 200, kinematic_viscosity = 1.19e-6)
+_kernel(basic, 'froude_number_fn', stw = (4, 12), length = 200)
+_kernel(basic, 'CF_fn', reynolds_number = (5e8, 2e9))
+_kernel(basic, 'roughness_resistance_fn', length = 200, reynolds_number = (5e8, 2e9))
+_kernel(basic, 'calculate_form_factor', C_B = (0.6, 0.85), B = 32, L_pp = 200, T_M = 11)
+_kernel(basic, 'calculate_viscous_resistance_coef', C_F = (1.3e-3, 1.6e-3), form_factor = 0.2, delta_C_F = (1e-4, 3e-4))
+_kernel(basic, 'frictional_resistance_coefs', stw = (4, 12), length = 200, temperature = (0, 30), salinity = 0.035, 
+        C_B = 0.8, B = 32, L_pp = 200, T_M = 11)
+_kernel(basic, 'calculate_total_resistance_coef', total_resistance = (5e5, 2e6), stw = (4, 12), wsa = 9000)
+_kernel(basic, 'wetted_surface_area', draft = (9, 12), beam = 32, length = 200, midship_section_coeff = 0.99, block_coeff = 0.8, 
+        waterplane_area_coeff = 0.9, transverse_sectional_area = 20)
+_kernel(basic, 'saturation_vapour_pressure', T = (-10, 35))
+_kernel(basic, 'air_density', P = (980, 1040), T = (-10, 35), RH = (20, 100))
+_kernel(basic, 'moist_air_density', P = (980, 1040), T = (-10, 35), humidity = (20, 100))
+
+_kernel(general, 'knots_to_ms', knots = (8, 24))
+_kernel(general, 'ms_to_knots', ms = (4, 12))
+_kernel(general, 'power_correction', pd_meas = (5e6, 2e7), delta_R = (-1e5, 3e5), stw = (4, 12), etaD_id = 0.75, 
+        shaft_power_overload = -0.1)
+_kernel(general, 'shaft_speed_correction', n_ms = (1, 2), shaft_speed_overload = 0.3, pd_meas = (5e6, 2e7), pd_id = (5e6, 2e7))
+_kernel(general, 'wind_resistance', air_density = (1.15, 1.3), wind_resistance_coef_rel = (-0.8, 0.9), wind_resistance_coef_zero = 0.8, 
+        area = 1000, relative_wind_speed = (0, 25), sog = (4, 12))
+register('general.met_wind_resistance', 
+         lambda n, rng: (lambda met = pd.DataFrame({'air_pressure': rng.uniform(980, 1040, n), 'air_temperature': rng.uniform(-10, 35, n), 
+                                                    'relative_humidity': rng.uniform(20, 100, n)}), 
+                                coef = rng.uniform(-0.8, 0.9, n), wind_speed = rng.uniform(0, 25, n), sog = rng.uniform(4, 12, n): 
+                         general.met_wind_resistance(met, coef, 0.8, 1000, wind_speed, sog)))
+_kernel(general, 'temp_salinity_water_resistance', CF = (1.3e-3, 1.6e-3), CF0 = (1.3e-3, 1.6e-3), delta_CF = (1e-4, 3e-4), 
+        delta_CF0 = (1e-4, 3e-4), CT0 = (2e-3, 3e-3), S = 9000, stw = (4, 12), rho_S = (1020, 1030))
+_kernel(general, 'temp_salinity_water_resistance_components', CF = (1.3e-3, 1.6e-3), CF0 = (1.3e-3, 1.6e-3), delta_CF = (1e-4, 3e-4), 
+        delta_CF0 = (1e-4, 3e-4), CT0 = (2e-3, 3e-3), S = 9000, stw = (4, 12), rho_S = (1020, 1030))
+_kernel(general, 'displacement_correction', power = (5e6, 2e7), trial_displacement = (5e4, 6e4), reference_displacement = 55000)
+_kernel(general, 'load_datasets', max_size = 1, dataset = 'propeller_advance_lookup')
+
+_kernel(wind, 'rel2true_speed', relative_windspeed = (0, 25), sog = (4, 12), relative_wind_direction = (0, 2*np.pi))
+_kernel(wind, 'rel2true_dir', relative_wind_speed = (0, 25), sog = (4, 12), relative_wind_direction = (0, 2*np.pi), 
+        vessel_heading = (0, 2*np.pi))
+_kernel(wind, 'true2rel_speed', true_wind_speed = (0, 25), sog = (4, 12), true_wind_direction = (0, 2*np.pi), vessel_heading = (0, 2*np.pi))
+_kernel(wind, 'true2rel_dir', true_wind_speed = (0, 25), sog = (4, 12), true_wind_direction = (0, 2*np.pi), vessel_heading = (0, 2*np.pi))
+_kernel(wind, 'double_run_average', a = (0, 25), b = (0, 25), alpha = (0, 2*np.pi), beta = (0, 2*np.pi))
+_kernel(wind, 'vertical_position_anemometer', true_wind_speed = (0, 25), reference_height = 10, measured_height = (20, 50))
+
+_kernel(wind_res, 'load_wind_coefficients', max_size = 1, vessel_type = 'GENERAL_CARGO')
+register('wind_res.interpolate_cx', lambda n, rng: (lambda df = wind_res.load_wind_coefficients('GENERAL_CARGO'), 
+                                                      x = rng.uniform(0, np.pi, n): wind_res.interpolate_cx(df, x, 'average')))
+_kernel(wind_res, 'fujiwara', max_size = 10**3, aod = 1000, axv = 1000, alv = 4000, cmc = 0, hc = 15, hbr = 40, loa = 200, b = 32, 
+        wind_dir = (0, 180))
+
+_kernel(wave, 'stawave1_fn', beam = 32, wave_height = (0.5, 2.2), length = 20)
+_kernel(wave, 'modified_pierson_moskowitz_spectrum', omega = (0.2, 3), H_W1_3 = 2)
+_kernel(wave, 'calculate_R_wave', omega = (0.2, 3), C_B = 0.8, L_pp = 200, k_yy = 0.25, Fr = 0.15, zeta_A = 1, B = 32, 
+        k = (0.01, 0.9), T_M = 11, V_s = 7)
+_kernel(wave, 'R_AWL', max_size = 1, zeta_A = 1, B = 32, L_pp = 200, V_s = 7, T_M = 11, C_B = 0.8, k_yy = 0.25, Fr = 0.15, k = 0.1, 
+        S_eta = lambda omega: wave.modified_pierson_moskowitz_spectrum(omega, 2))
+
+register('current.estimate_speed_through_water', 
+         lambda n, rng: (lambda t = np.linspace(0, 12, max(n, 8)): 
+                         (lambda sog = 7 + 0.3*np.cos(2*np.pi*t/12.42): 
+                          lambda: current.estimate_speed_through_water(1e5*(sog + 0.1)**3, sog, t, 12.42, max_iter = 10))())(), 
+         max_size = 10**3)
+_kernel(current, 'current_mean_of_means', max_size = 1, sog = np.array([7.1, 6.8, 7.2, 6.9]), start_time = 0, time_between_runs = 1)
+
+_kernel(power, 'correction_delivered_power', p_dms = (5e6, 2e7), resistance_increase = (-1e5, 3e5), stw = (4, 12), eta_id = 0.7, 
+        eta_ms = (0.65, 0.75))
+_kernel(power, 'propulsive_efficiency_corr', n_o = (0.5, 0.7), n_r = 1.0, t = 0.2, w_s = (0.2, 0.4))
+_kernel(power, 'full_scale_wake_fraction', wake_fraction_model = (0.2, 0.4), scale_correlation_factor = 1.1)
+_kernel(power, 'full_scale_wake_speed', flow_speed = (3, 9), stw = (4, 12))
+_kernel(power, 'scale_correlation_factor', trial = (0.2, 0.4), model = (0.2, 0.4))
+_kernel(power, 'self_propulsion_factors', x_ideal = (0.2, 0.4), delta_x = 0.1, delta_r = (1, 1.2))
+register('power.get_curve_coefficient', lambda n, rng: (lambda y = rng.uniform(0.1, 0.4, max(n, 3)), x = rng.uniform(0.1, 1, max(n, 3)): 
+                                                         power.get_curve_coefficient(y, x)))
+_kernel(power, 'quadratic_method', coefs = np.array([-0.3, -0.1, 0.4]), propeller_advance_coef = (0.1, 1))
+_kernel(power, 'torque_coef', power = (5e6, 2e7), shaft_speed = (1, 2), diameter = 7, efficiency = 1)
+_kernel(power, 'load_factor', thrust_coefficient = (0.1, 0.3), propeller_advance = (0.3, 0.8))
+_kernel(power, 'load_factor_resistance', resistance = (5e5, 2e6), thrust_deduction = 0.2, wake_fraction = (0.2, 0.4), stw = (4, 12), 
+        diameter = 7)
+_kernel(power, 'propeller_advance_coefficient', propeller_value = (0.02, 0.04), a = -0.03, b = -0.02, c = 0.05, mode = 'torque')
+_kernel(power, 'open_water_efficiency', propeller_advance_coef = (0.3, 0.8), thrust_coef = (0.1, 0.3), torque_coef = (0.02, 0.04))
+_kernel(power, 'propeller_flow', propeller_advance_coef = (0.3, 0.8), rotations_sec = (1, 2), diameter = 7)
+_kernel(power, 'total_resistance', load_factor = (0.5, 1.5), thrust_deduction = 0.2, wake_fraction = (0.2, 0.4), stw = (4, 12), 
+        diameter = 7)
+_kernel(power, 'propeller_speed', propeller_advance_coef = (0.3, 0.8), stw = (4, 12), diameter = 7, wake_fraction = (0.2, 0.4))
+_trial_phase = dict(V_s = (6, 8), P_dms = (8e6, 1e7), eta_ms = (0.65, 0.75), delta_R = (1e4, 1e5), delta_eta = 0.0, delta_t = 0.0, 
+                    delta_w = 0.0, shaft_speed = (1.4, 1.6), diameter = 7, t_Rid = 0.2, w_Mid = 0.3, number_shafts = 1, 
+                    **{c: v.values for c, v in general.load_datasets('propeller_advance_lookup').items()})
+_kernel(power, 'calculate_all_values_from_trial_phase', **_trial_phase)
+_kernel(power, 'calculate_all_values_from_ideal_phase', V_s = (6, 8), P_dms = (8e6, 1e7), delta_R = (1e4, 1e5), diameter = 7, 
+        number_shafts = 1, t_Rid = 0.2, R_id = (5e5, 7e5), eta_Rms = 1.0, eta_Dms = (0.65, 0.75), w_Sid = 0.3, 
+        K_T_coeffs = np.array([-0.3, -0.1, 0.4]), K_Q_coeffs = np.array([-0.03, -0.02, 0.05]))
+_kernel(power, 'delivered_power_ideal_condition', **_trial_phase)
+
+_kernel(shallow, 'shallow_water_correction', coef_visc_frict = (1.5e-3, 2e-3), stw = (4, 12), L_pp = 200, beam = 32, draught = 11, 
+        C_B = 0.8, displacement = 55000, wetted_surface_area = 9000, waterplane_area = 5700, power = (5e6, 2e7), etad = 0.75, 
+        water_density = 1026, water_depth = (30, 80))
+
+_kernel(trig, 'opposite_magnitude_fn', magnitude = (0, 25), angle = (0, 2*np.pi))
+_kernel(trig, 'adjacent_magnitude_fn', magnitude = (0, 25), angle = (0, 2*np.pi))
+_kernel(trig, 'combine_vectors', a = (0, 25), b = (0, 25), alpha = (0, 2*np.pi), beta = (0, 2*np.pi))
+_kernel(trig, 'law_of_cosines', a = (0, 25), b = (0, 25), theta = (0, 2*np.pi))
+_kernel(trig, 'find_gamma_fn', a = (0, 25), b = (0, 25), alpha = (0, 2*np.pi))
+_kernel(trig, 'weighted_circular_mean', angles = (0, 2*np.pi), weights = (0, 1))
+_kernel(trig, 'circular_mean', angles = (0, 2*np.pi))
+_kernel(trig, 'circular_variance', angles = (0, 2*np.pi))
+_kernel(trig, 'angle_difference', a = (0, 2*np.pi), b = (0, 2*np.pi))
+register('trig.rolling_circular_stats', lambda n, rng: (lambda x = rng.uniform(0, 2*np.pi, n): trig.rolling_circular_stats(x, min(n, 60))))
+
+# %% ../nbs/15_benchmark.ipynb 10
+def _scenario_inputs(n, rng):
+    "A hull, an analysis and a run table of n rows for the full chain benchmarks"
+    from pyseatrials.hull import Hull
+    from pyseatrials.analysis import SeaTrialAnalysis
+    hull = Hull(L_pp = 200, B = 32, T_M = 11, C_B = 0.8, C_M = 0.99, C_WP = 0.9, A_BT = 20, L_BWL = 20, k_yy = 0.25)
+    analysis = SeaTrialAnalysis(hull, transverse_area = 1000, etaD_id = 0.75, shaft_power_overload = -0.1, shaft_speed_overload = 0.3, 
+                                wind_coefficients = wind_res.load_wind_coefficients('GENERAL_CARGO'), current_method = 'none')
+    runs = {'sog': rng.uniform(4, 12, n), 'heading': rng.uniform(0, 2*np.pi, n), 'relative_wind_speed': rng.uniform(0, 25, n), 
+            'relative_wind_direction': rng.uniform(0, 2*np.pi, n), 'power': rng.uniform(5e6, 2e7, n), 'shaft_speed': rng.uniform(1, 2, n),
+            'wave_height': rng.uniform(0.5, 2.2, n), 'water_temperature': rng.uniform(0, 30, n), 'salinity': np.full(n, 0.035), 
+            'water_density': np.full(n, 1025.0)}
+    return hull, analysis, runs
+
+def _analysis_setup(n, rng):
+    _, analysis, runs = _scenario_inputs(n, rng)
+    return lambda: analysis.run(runs)
+
+def _stream_setup(n, rng):
+    from pyseatrials.stream import StreamingAnalysis, RollingMean
+    _, analysis, runs = _scenario_inputs(n, rng)
+    stream = StreamingAnalysis(analysis, chunk_size = 10**5, smoothing = [RollingMean(['relative_wind_speed'], 60)])
+    return lambda: [chunk for chunk in stream.process([runs])]
+
+def _graph_setup(n, rng):
+    from pyseatrials.graph import correction_graph
+    hull, _, runs = _scenario_inputs(n, rng)
+    graph = correction_graph()
+    values = dict(runs, stw = runs['sog'], air_density = 1.225, wind_resistance_coef_rel = rng.uniform(-0.8, 0.9, n), 
+                  wind_resistance_coef_zero = 0.8, area = 1000, reference_temperature = 15, reference_salinity = 0.035, 
+                  reference_density = 1026, hull = hull, CT0 = 2.5e-3, etaD_id = 0.75, shaft_power_overload = -0.1)
+    return lambda: graph.evaluate('P_id', **values)
+
+register('chain.analysis', _analysis_setup)
+register('chain.stream', _stream_setup)
+register('chain.graph', _graph_setup)
+
+# %% ../nbs/15_benchmark.ipynb 12
+def time_function(func, #The function to time, called without arguments
+                  min_time:float = 0.05, #The least time spent on each repeat [s]
+                  repeat:int = 3 #The number of repeats
+                 ) -> dict: #The best and mean time per call [s], the number of calls per repeat and the number of repeats
+    "Time a function in the style of `timeit`"
+
+    number, elapsed = 1, 0.0
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time/10 else 2
+    times = [elapsed/number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start)/number)
+    return {'best': min(times), 'mean': sum(times)/len(times), 'number': number, 'repeat': repeat}
+
+# %% ../nbs/15_benchmark.ipynb 13
+def _metadata() -> dict:
+    "The versions and commit the benchmarks were run with"
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output = True, text = True, timeout = 10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    try:
+        version = metadata.version('pyseatrials')
+    except metadata.PackageNotFoundError:
+        version = None
+    return {'pyseatrials': version, 'numpy': np.__version__, 'pandas': pd.__version__, 
+            'python': platform.python_version(), 'machine': platform.machine(), 'platform': platform.platform(), 
+            'commit': commit, 'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+
+def run_benchmarks(names = None, #The names of the benchmarks to run, or prefixes such as `'trig.'`, all if None
+                   sizes = SIZES, #The input sizes
+                   min_time:float = 0.05, #The least time spent on each repeat [s]
+                   repeat:int = 3, #The number of repeats
+                   seed:int = 0 #The seed of the random inputs
+                  ) -> dict: #The metadata and a list of results, one for each benchmark and size
+    "Run the benchmarks"
+
+    selected = [name for name in BENCHMARKS if names is None or any(name == n or name.startswith(n) for n in names)]
+    results = []
+    for name in selected:
+        setup, max_size = BENCHMARKS[name]
+        for size in sizes:
+            result = {'name': name, 'size': size}
+            if max_size is not None and size > max_size:
+                result['status'] = 'skipped'
+            else:
+                try:
+                    result.update(time_function(setup(size, np.random.default_rng(seed)), min_time, repeat), status = 'ok')
+                except Exception as e:
+                    result.update(status = 'error', error = f'{type(e).__name__}: {e}')
+            results.append(result)
+    return {'metadata': _metadata(), 'results': results}
+
+# %% ../nbs/15_benchmark.ipynb 15
+def save_results(results:dict, #The output of `run_benchmarks`
+                 path:str #The JSON file to write
+                ):
+    "Save benchmark results as JSON"
+    with open(path, 'w') as f:
+        json.dump(results, f, indent = 1)
+
+def load_results(path:str #A JSON file written by `save_results`
+                ) -> dict:
+    "Load saved benchmark results"
+    with open(path) as f:
+        return json.load(f)
+
+def results_frame(results:dict #The output of `run_benchmarks` or `load_results`
+                 ) -> pd.DataFrame: #One row per benchmark and size
+    "The benchmark results as a table"
+    return pd.DataFrame(results['results']).set_index(['name', 'size'])
+
+# %% ../nbs/15_benchmark.ipynb 16
+def compare(baseline:dict, #The results of the baseline, for example the main branch
+            contender:dict, #The results to compare against the baseline
+            threshold:float = 1.2 #The ratio of the best times above which a benchmark has regressed
+           ) -> pd.DataFrame: #The best times, their ratio and whether the benchmark regressed or improved, for the benchmarks run by both
+    "Compare two sets of benchmark results"
+
+    old = results_frame(baseline).query("status == 'ok'")['best']
+    new = results_frame(contender).query("status == 'ok'")['best']
+    res = pd.concat({'baseline': old, 'contender': new}, axis = 1, join = 'inner')
+    res['ratio'] = res.contender/res.baseline
+    res['change'] = np.select([res.ratio > threshold, res.ratio < 1/threshold], ['slower', 'faster'], 'same')
+    return res
+
+# %% ../nbs/15_benchmark.ipynb 20
+HEAVY_MODULES = ('scipy', 'pandas', 'pyarrow', 'matplotlib', 'seawater', 'fastcore')
+
+def import_time(module:str = 'pyseatrials.general' #The module to import
+               ) -> dict: #The cumulative import time of every package loaded [s]
+    "The time taken to import a module and each package it loads, measured in a new interpreter"
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(basic.__file__)))
+    env = dict(os.environ, PYTHONPATH = os.pathsep.join(filter(None, [root, os.environ.get('PYTHONPATH')])))
+    res = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output = True, text = True, env = env)
+    if res.returncode:
+        raise ImportError(res.stderr.strip().splitlines()[-1])
+
+    times = {}
+    for line in res.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)/1e6
+    return times
+
+def heavy_imports(module:str = 'pyseatrials.general' #The module to import
+                 ) -> list: #The packages of `HEAVY_MODULES` which are loaded
+    "The slow dependencies loaded when a module is imported"
+    return [name for name in import_time(module) if name in HEAVY_MODULES]
@@ -0,0 +1,295 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/18_cache.ipynb.
+
+# %% auto 0
+__all__ = ['input_key', 'package_version', 'code_digest', 'default_directory', 'DiskCache', 'enable', 'disable', 'is_enabled',
+           'current', 'caching', 'cached']
+
+# %% ../nbs/18_cache.ipynb 4
+import os
+import pickle
+import shutil
+import hashlib
+import inspect
+import tempfile
+import functools
+from contextlib import contextmanager
+from importlib import metadata
+import numpy as np
+
+# %% ../nbs/18_cache.ipynb 6
+#values a function reads from its module which are part of its result
+_DATA = (bool, int, float, complex, str, bytes, np.ndarray, np.generic)
+
+def _global_names(code) -> set: #The global names read by `code` and the code nested in it
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _global_names(const)
+    return names
+
+def _update_code(h, code):
+    "Feed the bytecode, names and constants of a code object into the hash `h`"
+    h.update(b'code;')
+    h.update(code.co_code)
+    _update(h, code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            _update_code(h, const)
+        else:
+            _update(h, const)
+
+def _update_function(h, func, seen = ()):
+    "Feed what a Python function calculates into the hash `h`: its code, defaults, closure and the data it reads from its module"
+    h.update(f'function:{func.__module__}.{func.__qualname__};'.encode())
+    if func in seen:
+        return
+    seen = (*seen, func)
+    _update_code(h, func.__code__)
+    _update(h, [func.__defaults__, func.__kwdefaults__])
+    for cell in func.__closure__ or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            h.update(b'empty;')
+            continue
+        if inspect.isfunction(contents):
+            _update_function(h, contents, seen)
+        else:
+            _update(h, contents)
+    for name in sorted(_global_names(func.__code__)):
+        if name in func.__globals__ and (func.__globals__[name] is None or isinstance(func.__globals__[name], _DATA)):
+            _update(h, [name, func.__globals__[name]])
+
+def _update(h, value):
+    "Feed the contents of `value` into the hash `h`"
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        h.update(f'{type(value).__name__}:{value!r};'.encode())
+    elif isinstance(value, np.ndarray) and not value.dtype.hasobject:
+        h.update(f'ndarray:{value.dtype.str}:{value.shape};'.encode())
+        h.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, np.generic):
+        _update(h, np.asarray(value))
+    elif isinstance(value, (list, tuple)):
+        h.update(f'{type(value).__name__}:{len(value)};'.encode())
+        for item in value:
+            _update(h, item)
+    elif isinstance(value, dict):
+        h.update(f'dict:{len(value)};'.encode())
+        for name in sorted(value, key = repr):
+            _update(h, name)
+            _update(h, value[name])
+    elif hasattr(value, 'to_numpy') and hasattr(value, 'index'):
+        #pandas series and data frames, column by column so each column keeps its dtype
+        columns = value.items() if hasattr(value, 'columns') else [(value.name, value)]
+        _update(h, [type(value).__name__, value.index.to_numpy()] + [[name, column.to_numpy()] for name, column in columns])
+    elif inspect.isfunction(value):
+        _update_function(h, value)
+    elif inspect.ismethod(value):
+        _update(h, [value.__func__, value.__self__])
+    else:
+        #built in functions pickle by reference, objects such as `Hull` by their contents
+        h.update(pickle.dumps(value, protocol = 4))
+
+def input_key(*args, **kwargs) -> str: #A hexadecimal hash of the arguments
+    "The content hash of the arguments, TypeError or PicklingError if an argument has no stable content"
+    h = hashlib.blake2b(digest_size = 20)
+    _update(h, (args, kwargs))
+    return h.hexdigest()
+
+# %% ../nbs/18_cache.ipynb 11
+def package_version() -> str: #The installed version, 'dev' when the package is not installed
+    "The version of pyseatrials the cached results belong to"
+    try:
+        return metadata.version('pyseatrials')
+    except metadata.PackageNotFoundError:
+        return 'dev'
+
+@functools.lru_cache(maxsize = None)
+def code_digest() -> str: #A hexadecimal hash of the package source
+    "The digest of the source files of pyseatrials, results are not reused after editing the package"
+    h = hashlib.blake2b(digest_size = 16)
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.py'):
+            h.update(name.encode())
+            with open(os.path.join(directory, name), 'rb') as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+def default_directory() -> str: #The cache directory
+    "`PYSEATRIALS_CACHE` if it is a directory, otherwise pyseatrials in the user's cache directory"
+    directory = os.environ.get('PYSEATRIALS_CACHE', '')
+    if directory.lower() not in ('', '0', '1', 'false', 'true'):
+        return directory
+    return os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'pyseatrials')
+
+# %% ../nbs/18_cache.ipynb 12
+class DiskCache:
+    "Pickled results in a directory, named by the key of their inputs"
+
+    marker = '.pyseatrials-cache'
+
+    def __init__(self, 
+                 directory:str = None, #The cache directory, `default_directory()` if None
+                 max_size:int = 2**30, #The most bytes kept, the least recently used results are removed beyond it
+                 version:str = None #The version the results belong to, `package_version()` if None
+                ):
+        self.root = default_directory() if directory is None else directory
+        self.version = package_version() if version is None else version
+        self.directory = os.path.join(self.root, self.version)
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok = True)
+        open(os.path.join(self.directory, self.marker), 'a').close()
+
+        #results of other versions are out of date, only the directories marked as caches are removed
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name != self.version and os.path.isfile(os.path.join(path, self.marker)):
+                shutil.rmtree(path, ignore_errors = True)
+
+    def _path(self, key:str) -> str:
+        return os.path.join(self.directory, key + '.pkl')
+
+    def __contains__(self, key:str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def __getitem__(self, key:str):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            raise KeyError(key) from None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            #a damaged or unreadable result is removed and calculated again
+            self._remove(path)
+            raise KeyError(key) from None
+        #the modification time marks when the result was last used
+        os.utime(path)
+        return value
+
+    def __setitem__(self, key:str, value):
+        fd, temporary = tempfile.mkstemp(dir = self.directory, suffix = '.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol = pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            self._remove(temporary)
+            raise
+        self.evict()
+
+    def _remove(self, path:str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _entries(self) -> list: #The path, size and last use of each result, the least recently used first
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pkl'):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    @property
+    def size(self) -> int: #The bytes used by the results
+        "The total size of the cached results"
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        "Remove the least recently used results until the cache fits in `max_size`"
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        "Remove every cached result"
+        for _, _, path in self._entries():
+            self._remove(path)
+
+    def __repr__(self):
+        return f'DiskCache({self.directory!r}, max_size={self.max_size})'
+
+# %% ../nbs/18_cache.ipynb 15
+_cache = None
+
+def enable(directory:str = None, #The cache directory, `default_directory()` if None
+           max_size:int = 2**30 #The most bytes kept
+          ) -> DiskCache: #The cache in use
+    "Look up and store the results of the cached functions"
+    global _cache
+    _cache = DiskCache(directory, max_size)
+    return _cache
+
+def disable():
+    "Calculate every result again, the stored results are kept"
+    global _cache
+    _cache = None
+
+def is_enabled() -> bool:
+    "Whether the cached functions are looking up their results"
+    return _cache is not None
+
+def current() -> DiskCache: #The cache in use, None when caching is off
+    "The cache the cached functions are using"
+    return _cache
+
+@contextmanager
+def caching(directory:str = None, #The cache directory, `default_directory()` if None
+            max_size:int = 2**30 #The most bytes kept
+           ):
+    "Cache the results inside the `with` block"
+    global _cache
+    previous = _cache
+    try:
+        yield enable(directory, max_size)
+    finally:
+        _cache = previous
+
+# %% ../nbs/18_cache.ipynb 16
+if os.environ.get('PYSEATRIALS_CACHE', '').lower() not in ('', '0', 'false'):
+    enable()
+
+# %% ../nbs/18_cache.ipynb 17
+def cached(func):
+    "Keep the results of `func` in the disk cache while caching is enabled"
+
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _cache
+        if cache is None:
+            return func(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        try:
+            #a change to the function or to anything in the package it calls changes the key
+            key = input_key(code_digest(), func, bound.arguments)
+        except (TypeError, pickle.PicklingError, AttributeError):
+            #arguments such as lambdas have no content to hash
+            return func(*args, **kwargs)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        result = func(*args, **kwargs)
+        try:
+            cache[key] = result
+        except (TypeError, pickle.PicklingError, AttributeError, OSError):
+            pass
+        return result
+
+    return wrapper
@@ -0,0 +1,203 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/25_catalog.ipynb.
+
+# %% auto 0
+__all__ = ['GROUPS', 'tables', 'load_table', 'load_frame', 'describe', 'source_digest', 'bundle_path', 'build_bundle', 'Bundle',
+           'open_bundle', 'close_bundle']
+
+# %% ../nbs/25_catalog.ipynb 4
+import os
+import json
+import hashlib
+import tempfile
+from io import BytesIO
+from importlib import resources
+import numpy as np
+from .cache import default_directory, package_version
+
+# %% ../nbs/25_catalog.ipynb 6
+#the directories of bundled tables and what they hold
+GROUPS = {'datasets': 'Example data',
+          'wind_coef_data': 'Wind resistance coefficients of generic ship classes from ITTC'}
+
+def _files(group:str) -> list: #The CSV files of the group, sorted by name
+    directory = resources.files('pyseatrials').joinpath(group)
+    return sorted((entry for entry in directory.iterdir() if entry.name.endswith('.csv')), key = lambda entry: entry.name)
+
+def tables(group:str = None #One of `GROUPS`, every group if None
+          ) -> list: #The names of the tables
+    "The names of the bundled tables"
+    groups = GROUPS if group is None else [group]
+    return [f'{group}/{entry.name[:-4]}' for group in groups for entry in _files(group)]
+
+# %% ../nbs/25_catalog.ipynb 10
+_loaded = {}
+_bundle = None
+
+def _column(name:str, #The name of the table
+            values #A column of the parsed table
+           ) -> np.ndarray:
+    "The numbers of a column, or its values if none of them are numbers"
+    import pandas as pd
+    if values.dtype.kind in 'biuf':
+        return values.to_numpy()
+    #cells of spaces are blank
+    values = values.mask(values.map(lambda cell: isinstance(cell, str) and not cell.strip()))
+    numbers = pd.to_numeric(values, errors = 'coerce')
+    bad = numbers.isna() & values.notna()
+    if not numbers.notna().any():
+        return values.to_numpy()
+    if bad.any():
+        raise ValueError(f"The column {values.name!r} of {name!r} has cells which are not numbers in the rows {list(values.index[bad][:5])}: "
+                         f"{list(values[bad][:5])}")
+    return numbers.to_numpy()
+
+def _read_csv(name:str) -> dict: #The columns of the table as NumPy arrays
+    "Parse a bundled table"
+    import pandas as pd
+    group, table = name.split('/', 1)
+    df = pd.read_csv(BytesIO(resources.files('pyseatrials').joinpath(group, table + '.csv').read_bytes()))
+    return {column: _column(name, df[column]) for column in df.columns}
+
+def load_table(name:str #The name of the table, from `tables`
+              ) -> dict: #The read-only columns of the table
+    "The columns of a bundled table, parsed on the first call only"
+    if name not in _loaded:
+        if _bundle is None and os.environ.get('PYSEATRIALS_BUNDLE', '').lower() not in ('', '0', 'false'):
+            open_bundle()
+        if _bundle is not None and name in _bundle.layout:
+            columns = _bundle.table(name)
+        elif name in tables(name.split('/')[0] if name.split('/')[0] in GROUPS else None):
+            columns = _read_csv(name)
+        else:
+            raise KeyError(f"there is no table {name!r}, the tables are {tables()}")
+        for values in columns.values():
+            values.flags.writeable = False
+        _loaded[name] = columns
+    return _loaded[name]
+
+def load_frame(name:str #The name of the table, from `tables`
+              ): #returns a DataFrame of the table
+    "A bundled table as a new DataFrame, which can be changed without changing the cached table"
+    import pandas as pd
+    return pd.DataFrame({column: np.array(values) for column, values in load_table(name).items()})
+
+def describe(): #returns a DataFrame of the table, group, description, number of rows and columns of each table
+    "The bundled tables"
+    import pandas as pd
+    rows = []
+    for name in tables():
+        columns = load_table(name)
+        group = name.split('/')[0]
+        rows.append({'table': name, 'group': group, 'description': GROUPS[group],
+                     'rows': len(next(iter(columns.values()))), 'columns': list(columns)})
+    return pd.DataFrame(rows)
+
+# %% ../nbs/25_catalog.ipynb 15
+_MAGIC = b'PYSTBNDL'
+_ALIGNMENT = 64
+
+def source_digest() -> str: #A hexadecimal hash of the bundled CSV files
+    "The digest of the raw bytes of every bundled table"
+    h = hashlib.blake2b(digest_size = 16)
+    for group in GROUPS:
+        for entry in _files(group):
+            h.update(f'{group}/{entry.name}'.encode())
+            h.update(entry.read_bytes())
+    return h.hexdigest()
+
+def bundle_path() -> str: #The default path of the bundle
+    "`PYSEATRIALS_BUNDLE` if it is a path, otherwise next to the cached results of this version"
+    path = os.environ.get('PYSEATRIALS_BUNDLE', '')
+    if path.lower() not in ('', '0', '1', 'false', 'true'):
+        return path
+    return os.path.join(default_directory(), package_version(), 'tables.bundle')
+
+def build_bundle(path:str = None #The file written, `bundle_path()` if None
+                ) -> str: #The path of the bundle
+    "Parse every bundled table and write them all to a single binary file"
+    path = bundle_path() if path is None else path
+    columns = {name: _read_csv(name) for name in tables()}
+
+    #the offsets are from the start of the data, moved past the header below
+    layout, size = {}, 0
+    for name, table in columns.items():
+        layout[name] = []
+        for column, values in table.items():
+            #text columns cannot be mapped so are kept in the header
+            if values.dtype == object:
+                layout[name].append([column, None, values.tolist(), values.dtype.str])
+                continue
+            layout[name].append([column, size, list(values.shape), values.dtype.str])
+            size += -(-values.nbytes//_ALIGNMENT)*_ALIGNMENT
+    header = json.dumps({'source': source_digest(), 'tables': layout}).encode()
+    start = -(-(16 + len(header))//_ALIGNMENT)*_ALIGNMENT
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok = True)
+    fd, temporary = tempfile.mkstemp(dir = os.path.dirname(os.path.abspath(path)), suffix = '.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_MAGIC + np.uint64(len(header)).tobytes() + header)
+            for name, table in columns.items():
+                for (column, offset, _, _), values in zip(layout[name], table.values()):
+                    if offset is None:
+                        continue
+                    f.seek(start + offset)
+                    f.write(np.ascontiguousarray(values).tobytes())
+            f.truncate(start + size)
+        #readers never see a partly written bundle
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+    return path
+
+# %% ../nbs/25_catalog.ipynb 16
+class Bundle:
+    "The tables of a bundle file, memory-mapped read-only"
+
+    def __init__(self,
+                 path:str #The bundle file
+                ):
+        self.path = path
+        with open(path, 'rb') as f:
+            if f.read(8) != _MAGIC:
+                raise ValueError(f"{path} is not a bundle of tables")
+            length = int(np.frombuffer(f.read(8), np.uint64)[0])
+            header = json.loads(f.read(length))
+        self.source, self.layout = header['source'], header['tables']
+        self.start = -(-(16 + length)//_ALIGNMENT)*_ALIGNMENT
+        self._map = np.memmap(path, dtype = np.uint8, mode = 'r')
+
+    def table(self,
+              name:str #The name of the table
+             ) -> dict: #The columns of the table, views of the file apart from any text columns
+        return {column: np.array(shape, dtype = object) if offset is None else 
+                        np.ndarray(shape, dtype, buffer = self._map, offset = self.start + offset)
+                for column, offset, shape, dtype in self.layout[name]}
+
+    def __repr__(self):
+        return f'Bundle({self.path!r}, tables={len(self.layout)})'
+
+def open_bundle(path:str = None, #The bundle file, `bundle_path()` if None
+                build:bool = True #Build the bundle if it is missing or out of date, otherwise raise an error
+               ) -> Bundle: #The bundle now in use
+    "Read the tables from a memory-mapped bundle from now on"
+    global _bundle
+    path = bundle_path() if path is None else path
+    try:
+        bundle = Bundle(path)
+        if bundle.source != source_digest():
+            raise ValueError(f"{path} is out of date")
+    except (OSError, ValueError):
+        if not build:
+            raise
+        bundle = Bundle(build_bundle(path))
+    _bundle = bundle
+    _loaded.clear()
+    return bundle
+
+def close_bundle():
+    "Parse the CSV files again from now on"
+    global _bundle
+    _bundle = None
+    _loaded.clear()
@@ -0,0 +1,150 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/23_clean.ipynb.
+
+# %% auto 0
+__all__ = ['MAD_SCALE', 'CHANNELS', 'rolling_median', 'hampel', 'OutlierFilter']
+
+# %% ../nbs/23_clean.ipynb 4
+import numpy as np
+from .align import ANGLE_COLUMNS, _seconds
+
+# %% ../nbs/23_clean.ipynb 6
+def rolling_median(values:float, #1D array ordered in time
+                   window:int #the number of samples in the window
+                  ) -> np.ndarray: #the median of the finite values of the trailing window
+    "The median over a trailing window of samples, over fewer samples at the start"
+    #pandas keeps the window in a skip list, O(n log w)
+    import pandas as pd
+    return pd.Series(np.asarray(values, dtype = float)).rolling(window, min_periods = 1).median().to_numpy()
+
+# %% ../nbs/23_clean.ipynb 9
+#the MAD of normally distributed data times this is its standard deviation
+MAD_SCALE = 1.4826
+
+def _unwrap(angles, last_angle:float = np.nan, last_unwrapped:float = np.nan) -> np.ndarray:
+    "Directions [rad] made continuous, carrying on from the last of an earlier chunk"
+    angles = np.asarray(angles, dtype = float)
+    #the step from the last finite direction, across missing ones
+    filled = np.concatenate(([last_angle], angles))
+    index = np.maximum.accumulate(np.where(np.isnan(filled), 0, np.arange(len(filled))))
+    previous = filled[index][:-1]
+    step = np.mod(angles - previous + np.pi, 2*np.pi) - np.pi
+    start = angles[0] if np.isnan(last_unwrapped) and len(angles) else last_unwrapped
+    #missing directions do not break the continuity of the others
+    step = np.where(np.isnan(step), 0.0, step)
+    if np.isnan(last_unwrapped) and len(angles):
+        step[0] = 0.0
+    return np.where(np.isnan(angles), np.nan, start + np.cumsum(step))
+
+def _hampel(values, window, threshold, min_scale, deviation_tail = ()):
+    "Whether each value is a spike, and the absolute deviations from the rolling median"
+    deviation = np.abs(values - rolling_median(values, window))
+    n = len(deviation_tail)
+    mad = rolling_median(np.concatenate((deviation_tail, deviation[n:])), window)
+    return deviation > np.maximum(threshold*MAD_SCALE*mad, min_scale), deviation
+
+def hampel(values:float, #1D array ordered in time
+           window:int = 31, #the number of samples in the trailing window
+           threshold:float = 3, #the number of scaled MADs from the median that is a spike
+           min_scale:float = 0, #the smallest deviation that is a spike, for channels that are often constant
+           angle:bool = False #whether the values are directions [rad]
+          ) -> np.ndarray: #True for the spikes
+    "The spikes of a channel by the Hampel filter"
+    values = _unwrap(values) if angle else np.asarray(values, dtype = float)
+    return _hampel(values, window, threshold, min_scale)[0]
+
+# %% ../nbs/23_clean.ipynb 14
+CHANNELS = {'sog': {'bounds': (0, 20), 'max_rate': 0.5},
+            'stw': {'bounds': (0, 20), 'max_rate': 0.5},
+            'heading': {'max_rate': np.deg2rad(10), 'min_scale': np.deg2rad(1)},
+            'relative_wind_speed': {'bounds': (0, 60)},
+            'relative_wind_direction': {'min_scale': np.deg2rad(5)},
+            'power': {'bounds': (0, 1e8)},
+            'shaft_speed': {'bounds': (0, 10)}}
+
+class OutlierFilter:
+    "Replace the spikes, out of bound values and jumps of the channels, carried across chunks"
+
+    def __init__(self,
+                 channels:dict = None, #The checks of each channel, `CHANNELS` if None
+                 window:int = 31, #The samples in the trailing window of the Hampel filter, unless a channel has its own
+                 threshold:float = 3, #The scaled MADs from the median that is a spike, unless a channel has its own
+                 fill:str = 'nan', #Replace the rejected values with NaN, or 'hold' the last good value
+                 mask:str = 'valid', #The name of the mask column
+                 time:str = 'timestamp' #The time column for the rate of change, one sample a second if it is missing
+                ):
+        if fill not in ('nan', 'hold'):
+            raise ValueError(f"fill must be 'nan' or 'hold', not {fill!r}")
+        self.channels = CHANNELS if channels is None else channels
+        self.window, self.threshold, self.fill, self.mask, self.time = window, threshold, fill, mask, time
+        self.reset()
+
+    def reset(self):
+        "Forget the samples of the earlier chunks"
+        self.state = {}
+
+    def _check(self, name:str, values:np.ndarray, seconds:np.ndarray) -> np.ndarray:
+        "Whether each value passes the checks of the channel"
+        checks = self.channels[name]
+        window = checks.get('window', self.window)
+        angle = name in ANGLE_COLUMNS
+        state = self.state.get(name, {'values': np.zeros(0), 'deviations': np.zeros(0), 'angle': np.nan, 'unwrapped': np.nan,
+                                      'good': np.nan, 'time': np.nan})
+
+        good = np.isfinite(values)
+        low, high = checks.get('bounds', (-np.inf, np.inf))
+        good &= (values >= low) & (values <= high)
+
+        series = _unwrap(values, state['angle'], state['unwrapped']) if angle else values
+        tail = len(state['values'])
+        spikes, deviations = _hampel(np.concatenate((state['values'], series)), window, checks.get('threshold', self.threshold),
+                                     checks.get('min_scale', 0), state['deviations'])
+        good &= ~spikes[tail:]
+
+        if 'max_rate' in checks:
+            #the change from the last value that passed the other checks
+            index = np.arange(len(values))
+            last = np.maximum.accumulate(np.where(good, index, -1))
+            before = np.concatenate(([-1], last[:-1]))
+            previous = np.where(before >= 0, series[np.maximum(before, 0)], state['good'])
+            previous_time = np.where(before >= 0, seconds[np.maximum(before, 0)], state['time'])
+            change, elapsed = np.abs(series - previous), seconds - previous_time
+            #a repeated or earlier timestamp leaves no time for a change, so any change is too fast
+            rate = np.divide(change, elapsed, out = np.where(change > 0, np.inf, 0.0), where = elapsed > 0)
+            #NaN rates, with no good value before, pass
+            good &= ~(rate > checks['max_rate'])
+
+        keep = window - 1
+        state['values'] = np.concatenate((state['values'], series))[-keep:] if keep else np.zeros(0)
+        state['deviations'] = np.concatenate((state['deviations'], deviations[tail:]))[-keep:] if keep else np.zeros(0)
+        if len(values):
+            finite = np.flatnonzero(np.isfinite(values))
+            if len(finite):
+                state['angle'], state['unwrapped'] = values[finite[-1]], series[finite[-1]]
+            passed = np.flatnonzero(good)
+            if len(passed):
+                state['good'], state['time'] = series[passed[-1]], seconds[passed[-1]]
+        self.state[name] = state
+        return good
+
+    def __call__(self, res:dict) -> dict:
+        names = [name for name in self.channels if name in res]
+        n = len(next(iter(res.values()), ()))
+        seconds = _seconds(res[self.time]) if self.time in res else self.state.get('_samples', 0) + np.arange(n, dtype = float)
+        self.state['_samples'] = self.state.get('_samples', 0) + n
+
+        valid = np.asarray(res[self.mask], bool).copy() if self.mask in res else np.ones(n, bool)
+        out = {}
+        for name in names:
+            values = np.asarray(res[name], dtype = float)
+            good = self._check(name, values, seconds)
+            valid &= good
+            if self.fill == 'hold':
+                index = np.maximum.accumulate(np.where(good, np.arange(n), -1))
+                held = self.state.get('_held', {}).get(name, np.nan)
+                out[name] = np.where(index >= 0, values[np.maximum(index, 0)], held)
+                if len(out[name]):
+                    self.state.setdefault('_held', {})[name] = out[name][-1]
+            else:
+                out[name] = np.where(good, values, np.nan)
+        out[self.mask] = valid
+        return out
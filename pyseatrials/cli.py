@@ -0,0 +1,219 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/26_cli.ipynb.
+
+# %% auto 0
+__all__ = ['load_config', 'trial_settings', 'build_analysis', 'analyse_file', 'analyse', 'serve', 'bundle', 'parser', 'main']
+
+# %% ../nbs/26_cli.ipynb 4
+import os
+import sys
+import json
+import time
+import argparse
+from contextlib import nullcontext
+from pathlib import Path
+from .hull import Hull
+from .analysis import SeaTrialAnalysis
+from .wind_res import load_wind_coefficients
+from . import instrument
+
+# %% ../nbs/26_cli.ipynb 7
+def load_config(path:str #The JSON trial configuration
+               ) -> dict: #The configuration with `trials` and absolute file paths
+    "Read a trial configuration, checking it has what an analysis needs"
+    path = Path(path)
+    with open(path) as f:
+        config = json.load(f)
+    for key in ('hull', 'analysis'):
+        if not isinstance(config.get(key), dict):
+            raise ValueError(f"{path} must have a {key!r} object")
+    trials = config.get('trials', {})
+    for name, trial in trials.items():
+        trial['files'] = [str(path.parent/file) for file in trial.get('files', [])]
+    config['trials'] = trials
+    config['name'] = path.stem
+    return config
+
+def trial_settings(config:dict, #A configuration from `load_config`
+                   trial:str = None #The name of a trial, overriding the settings of the configuration
+                  ) -> tuple: #The hull and analysis arguments
+    "The arguments of the hull and the analysis of a trial"
+    overrides = config['trials'].get(trial, {})
+    return {**config['hull'], **overrides.get('hull', {})}, {**config['analysis'], **overrides.get('analysis', {})}
+
+def build_analysis(hull:dict, #The arguments of `Hull`
+                   analysis:dict, #The arguments of `SeaTrialAnalysis` other than the hull
+                   shared:bool = False #Interpolate the wind coefficients from the shared tables of a `FleetExecutor`
+                  ) -> SeaTrialAnalysis:
+    "The analysis described by a configuration"
+    analysis = dict(analysis)
+    vessel_type = analysis.get('wind_coefficients')
+    if isinstance(vessel_type, str):
+        if shared:
+            from pyseatrials.fleet import SharedWindCoefficients
+            analysis['wind_coefficients'] = SharedWindCoefficients(vessel_type, analysis.get('ship_state', 'average'))
+        else:
+            analysis['wind_coefficients'] = load_wind_coefficients(vessel_type)
+    return SeaTrialAnalysis(Hull(**hull), **analysis)
+
+# %% ../nbs/26_cli.ipynb 11
+def _read(path:str, #A data file
+          chunk_size:int = None #Yield chunks of at most this many rows, the whole table if None
+         ):
+    "The table of a CSV, Parquet, Feather or Arrow file, or an iterable of its chunks"
+    import pandas as pd
+    if Path(path).suffix.lower() == '.csv':
+        return pd.read_csv(path) if chunk_size is None else pd.read_csv(path, chunksize = chunk_size)
+    from pyseatrials.columnar import iter_batches, read_columns
+    return read_columns(path) if chunk_size is None else iter_batches(path, batch_size = chunk_size)
+
+def _write(chunks, #An iterable of corrected DataFrames
+           path:Path #The file written, CSV or Parquet by its extension
+          ) -> int: #The number of rows written
+    "Write each chunk as it is produced"
+    path.parent.mkdir(parents = True, exist_ok = True)
+    if path.suffix == '.parquet':
+        from pyseatrials.columnar import write_results
+        return write_results(path, chunks)
+    rows = 0
+    for chunk in chunks:
+        chunk.to_csv(path, mode = 'a' if rows else 'w', header = not rows, index = False)
+        rows += len(chunk)
+    return rows
+
+def analyse_file(task:dict #The trial, hull, analysis, data file, output file, chunk size and whether to profile
+                ) -> dict: #The trial, file, output, rows, seconds and the profile if recorded
+    "Analyse a data file and write the corrected table, the task function of the `analyse` command"
+    start = time.perf_counter()
+    analysis = build_analysis(task['hull'], task['analysis'], shared = task.get('shared', False))
+    with instrument.instrumentation() if task.get('profile') else nullcontext():
+        if task.get('chunk_size'):
+            from pyseatrials.stream import StreamingAnalysis
+            stream = StreamingAnalysis(analysis, task['chunk_size'])
+            rows = _write(stream.process(_read(task['file'], task['chunk_size'])), Path(task['output']))
+        else:
+            rows = _write([analysis.run(_read(task['file']))], Path(task['output']))
+        profile = instrument.report() if task.get('profile') else None
+    return {'trial': task['trial'], 'file': task['file'], 'output': task['output'], 'rows': rows,
+            'seconds': time.perf_counter() - start, 'profile': profile}
+
+# %% ../nbs/26_cli.ipynb 14
+def _tasks(args) -> list:
+    "A task for each data file of each configuration"
+    tasks, inputs = [], {}
+    for path in args.config:
+        config = load_config(path)
+        trials = {name: trial['files'] for name, trial in config['trials'].items()}
+        if args.files:
+            trials = {config['name']: args.files} if len(args.config) == 1 and not trials else {**trials, config['name']: args.files}
+        for trial, files in trials.items():
+            hull, analysis = trial_settings(config, trial)
+            for file in files:
+                output = Path(args.output)/trial/(Path(file).stem + '.' + args.format)
+                if output in inputs:
+                    raise ValueError(f"{inputs[output]} and {file} would both be written to {output}, the data files of a trial need different names")
+                inputs[output] = file
+                tasks.append({'trial': trial, 'hull': hull, 'analysis': analysis, 'file': file, 'output': str(output),
+                              'chunk_size': args.chunk_size, 'profile': bool(args.profile), 'shared': args.workers != 0})
+    return tasks
+
+def _merge(profiles) -> dict: #The records of every function summed over the tasks, the most time consuming first
+    "Sum the instrumentation records of several tasks"
+    total = {}
+    for profile in profiles:
+        for name, record in (profile or {}).items():
+            if name not in total:
+                total[name] = dict(record)
+                continue
+            for key, value in record.items():
+                if value is not None:
+                    total[name][key] = (total[name][key] or 0) + value
+    return dict(sorted(total.items(), key = lambda item: item[1]['total_time'], reverse = True))
+
+def analyse(args) -> int:
+    "The `analyse` command"
+    #pandas and the process pool are only imported by the commands which use them
+    from pyseatrials.fleet import SharedTables, FleetExecutor, fleet_tables
+    tasks = _tasks(args)
+    if not tasks:
+        raise ValueError("there are no data files, give them on the command line or in the trials of the configuration")
+    with SharedTables.create(fleet_tables()) as tables:
+        results = FleetExecutor(tables, workers = args.workers).map(analyse_file, tasks, cost = lambda task: os.path.getsize(task['file']))
+    for result in results:
+        print(f"{result['trial']}\t{result['file']}\t{result['rows']} rows\t{result['seconds']:.2f} s\t{result['output']}")
+    if args.profile:
+        with open(args.profile, 'w') as f:
+            json.dump(_merge(result['profile'] for result in results), f, indent = 1)
+    return 0
+
+def serve(args) -> int:
+    "The `serve` command"
+    from pyseatrials import service
+    ships = {}
+    if args.registry is not None:
+        from pyseatrials.registry import ShipRegistry
+        with ShipRegistry(args.registry) as registry:
+            ships.update(registry.analyses())
+    for path in args.config:
+        config = load_config(path)
+        for trial in config['trials'] or [config['name']]:
+            ships[trial] = build_analysis(*trial_settings(config, trial))
+    print(f"serving {', '.join(sorted(ships))} on http://{args.host}:{args.port}", file = sys.stderr)
+    service.serve(service.AnalysisService(ships, window = args.window), args.host, args.port)
+    return 0
+
+def bundle(args) -> int:
+    "The `bundle` command"
+    from pyseatrials.catalog import build_bundle
+    print(build_bundle(args.path))
+    return 0
+
+# %% ../nbs/26_cli.ipynb 15
+def parser() -> argparse.ArgumentParser:
+    "The arguments of the `pyseatrials` command"
+    parser = argparse.ArgumentParser(prog = 'pyseatrials', description = 'Speed/power analysis of sea trial data')
+    commands = parser.add_subparsers(dest = 'command', required = True)
+
+    command = commands.add_parser('analyse', help = 'apply the correction chain to data files and write the corrected tables')
+    command.add_argument('config', nargs = '+', type = str, help = 'JSON trial configurations, a file name ending .json')
+    command.add_argument('files', nargs = '*', default = [], help = 'data files, CSV, Parquet, Feather or Arrow')
+    command.add_argument('-o', '--output', default = 'results', help = 'the directory of the corrected tables (default: %(default)s)')
+    command.add_argument('-f', '--format', choices = ('csv', 'parquet'), default = 'csv', help = 'the format of the corrected tables (default: %(default)s)')
+    command.add_argument('-w', '--workers', type = int, default = 0, help = 'the number of files analysed at once, 0 analyses them in this process (default: %(default)s)')
+    command.add_argument('-c', '--chunk-size', type = int, default = None, help = 'stream the files this many rows at a time, otherwise each file is a run table analysed whole')
+    command.add_argument('-p', '--profile', default = None, help = 'write the time spent in each stage and function to this JSON file')
+    command.set_defaults(run = analyse)
+
+    command = commands.add_parser('serve', help = 'serve the corrections of the ships of the configurations over HTTP')
+    command.add_argument('config', nargs = '*', help = 'JSON trial configurations')
+    command.add_argument('-r', '--registry', default = None, help = 'also serve the ships of this ship registry file')
+    command.add_argument('--host', default = '127.0.0.1', help = 'the address to listen on (default: %(default)s)')
+    command.add_argument('--port', type = int, default = 8080, help = 'the port to listen on (default: %(default)s)')
+    command.add_argument('--window', type = float, default = 0.002, help = 'the longest a request waits to be batched with others [s] (default: %(default)s)')
+    command.set_defaults(run = serve)
+
+    command = commands.add_parser('bundle', help = 'build the memory-mapped bundle of the package tables')
+    command.add_argument('path', nargs = '?', default = None, help = 'the bundle file (default: next to the cached results)')
+    command.set_defaults(run = bundle)
+    return parser
+
+def main(argv:list = None #The arguments, those of the command line if None
+        ) -> int: #The exit status
+    "The `pyseatrials` command"
+    parser_ = parser()
+    args = parser_.parse_args(argv)
+    if args.command == 'analyse':
+        #argparse cannot tell where the configurations end, the data files are those not ending .json
+        paths = args.config + args.files
+        args.config = [path for path in paths if path.lower().endswith('.json')]
+        args.files = [path for path in paths if not path.lower().endswith('.json')]
+        if not args.config:
+            parser_.error('give a JSON trial configuration')
+        if args.chunk_size is not None and args.chunk_size < 1:
+            parser_.error('--chunk-size must be at least 1')
+    if args.command == 'serve' and not args.config and args.registry is None:
+        parser_.error('give a JSON trial configuration or a --registry')
+    try:
+        return args.run(args)
+    except (OSError, ValueError, KeyError) as error:
+        print(f'pyseatrials: error: {error}', file = sys.stderr)
+        return 1
@@ -0,0 +1,128 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/24_columnar.ipynb.
+
+# %% auto 0
+__all__ = ['FORMATS', 'open_dataset', 'iter_batches', 'read_columns', 'ResultWriter', 'write_results']
+
+# %% ../nbs/24_columnar.ipynb 4
+from pathlib import Path
+import numpy as np
+from .stream import batch_columns
+
+# %% ../nbs/24_columnar.ipynb 6
+FORMATS = {'.parquet': 'parquet', '.pq': 'parquet', '.feather': 'feather', '.arrow': 'ipc', '.ipc': 'ipc'}
+
+def _pyarrow():
+    "The pyarrow modules used here, imported on first use"
+    try:
+        import pyarrow, pyarrow.dataset, pyarrow.parquet
+    except ImportError as error:
+        raise ImportError("reading and writing columnar files needs pyarrow, install it with `pip install pyarrow`") from error
+    return pyarrow
+
+def _format(source, format:str = None) -> str:
+    "The file format of `source`, from its extension unless given"
+    if format is not None:
+        return format
+    path = Path(source)
+    if path.is_dir():
+        #a directory of files, named by the extension of the first
+        path = next((file for file in sorted(path.rglob('*')) if file.suffix in FORMATS), path)
+    try:
+        return FORMATS[path.suffix.lower()]
+    except KeyError:
+        raise ValueError(f"cannot tell the format of {source}, give one of {sorted(set(FORMATS.values()))}") from None
+
+def open_dataset(source, #A file, or a directory of files, of trial data
+                 format:str = None #'parquet', 'feather' or 'ipc', from the extension if None
+                ): #returns a `pyarrow.dataset.Dataset`
+    "The columnar file or directory of files as an Arrow dataset, nothing is read until it is scanned"
+    pa = _pyarrow()
+    return pa.dataset.dataset(source, format = _format(source, format))
+
+# %% ../nbs/24_columnar.ipynb 7
+def iter_batches(source, #A file, or a directory of files, of trial data
+                 columns:list = None, #The columns to read, all if None
+                 batch_size:int = 2**16, #The maximum number of rows of each batch
+                 filter = None, #A `pyarrow.dataset` expression selecting the rows
+                 format:str = None #'parquet', 'feather' or 'ipc', from the extension if None
+                ): #yields Arrow record batches
+    "Read the columns of a columnar file a batch at a time"
+    for batch in open_dataset(source, format).to_batches(columns = columns, filter = filter, batch_size = batch_size):
+        if batch.num_rows:
+            yield batch
+
+def read_columns(source, #A file, or a directory of files, of trial data
+                 columns:list = None, #The columns to read, all if None
+                 filter = None, #A `pyarrow.dataset` expression selecting the rows
+                 format:str = None #'parquet', 'feather' or 'ipc', from the extension if None
+                ) -> dict: #the columns as NumPy arrays
+    "Read the columns of a columnar file whole"
+    return batch_columns(open_dataset(source, format).to_table(columns = columns, filter = filter))
+
+# %% ../nbs/24_columnar.ipynb 9
+class ResultWriter:
+    "Append chunks of corrected data to a Parquet file, one or more row groups for each"
+
+    def __init__(self,
+                 path, #The Parquet file written, replaced once closed if it exists
+                 compression:str = 'zstd', #The compression of the column chunks
+                 row_group_size:int = None #The maximum number of rows of a row group, a row group for each chunk if None
+                ):
+        self.path, self.compression, self.row_group_size = Path(path), compression, row_group_size
+        #chunks go to a partial file renamed when closed, so a failed run leaves no truncated file
+        self.partial = self.path.with_name(self.path.name + '.part')
+        self.writer, self.rows = None, 0
+
+    def _table(self, chunk):
+        "The chunk as an Arrow table"
+        pa = _pyarrow()
+        if isinstance(chunk, pa.Table):
+            return chunk
+        if isinstance(chunk, pa.RecordBatch):
+            return pa.Table.from_batches([chunk])
+        return pa.table(batch_columns(chunk))
+
+    def write(self,
+              chunk #A DataFrame, dictionary of arrays, NumPy structured array or Arrow batch
+             ):
+        "Append a chunk, the columns of the first set those of the file"
+        pa = _pyarrow()
+        table = self._table(chunk)
+        if self.writer is None:
+            self.path.parent.mkdir(parents = True, exist_ok = True)
+            self.writer = pa.parquet.ParquetWriter(self.partial, table.schema, compression = self.compression)
+        elif table.schema != self.writer.schema:
+            #the same columns, in the order and types of the first chunk
+            missing = set(self.writer.schema.names) - set(table.column_names)
+            if missing:
+                raise ValueError(f"the chunk is missing the columns {sorted(missing)}")
+            table = table.select(self.writer.schema.names).cast(self.writer.schema)
+        self.writer.write_table(table, row_group_size = self.row_group_size)
+        self.rows += table.num_rows
+
+    def close(self):
+        "Write the footer of the file and move it to the path, it cannot be read until closed"
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+            self.partial.replace(self.path)
+
+    def abort(self):
+        "Drop the chunks written, leaving any earlier file at the path as it was"
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+            self.partial.unlink(missing_ok = True)
+
+    def __enter__(self): return self
+    def __exit__(self, exc_type, *exc): self.abort() if exc_type is not None else self.close()
+
+def write_results(path, #The Parquet file written, replaced once every chunk is written if it exists
+                  chunks, #An iterable of chunks, such as `StreamingAnalysis.process`
+                  **kwargs #Passed to `ResultWriter`
+                 ) -> int: #the number of rows written
+    "Write every chunk to a Parquet file as it is produced"
+    with ResultWriter(path, **kwargs) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    return writer.rows
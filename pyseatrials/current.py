@@ -5,11 +5,13 @@ __all__ = ['estimate_speed_through_water', 'current_mean_of_means']
 
 # %% ../nbs/06_current.ipynb 2
 import numpy as np
-import pandas as pd
-from scipy.optimize import curve_fit
-import matplotlib.pyplot as plt
+from .instrument import instrumented
+from .cache import cached
+from .precision import promote, demote
 
 # %% ../nbs/06_current.ipynb 9
+@instrumented
+@cached
 def estimate_speed_through_water(power:float, #The engine power, typically the 'ideal condition' is used [W]
                                  sog:float, #Speed over ground of the vessel [m/s] 
                                  t:float, #Time difference from current run to first run [hours]
@@ -20,6 +22,14 @@ def estimate_speed_through_water(power:float, #The engine power, typically the '
                                  bounds:tuple = ([0, 0, 2.5], [5000, 20, 3.5]) #Bounds the power law equation to within realistic values
                                  )-> tuple: # Outputs a tuple of the stw, current, current coefficients, and speed power coefficints that minimised the error. Also returns a dataframe or the error per iteration
     
+    #scipy and pandas are imported on first use as they are slow to import
+    import pandas as pd
+    from scipy.optimize import curve_fit
+    
+    #the fits are done in float64, float32 data is promoted and the speeds returned in float32
+    inputs = (power, sog, t)
+    power, sog, t = (promote(x) for x in inputs)
+    
 # Function to calculate current speed
     def current_speed(t, V_c_C, V_c_S, V_c_T, V_c_0, T_c):
         # Calculation using trigonometric functions and linear trend
@@ -86,9 +96,10 @@ def estimate_speed_through_water(power:float, #The engine power, typically the '
     # Convert iteration results into a DataFrame
     df = pd.DataFrame(iteration_results, columns=["Iteration", "Power_Error"])
 
-    return best_V_s, best_V_c, best_popt_v, best_popt, df
+    return demote(best_V_s, *inputs), demote(best_V_c, *inputs), best_popt_v, best_popt, df
 
 # %% ../nbs/06_current.ipynb 17
+@instrumented
 def current_mean_of_means(sog: np.ndarray,  # The mean speed over ground across a double run,
                           start_time: float,  # Time in decimal hours when the first run took place,
                           time_between_runs: float  # Time in decimal hours between each run. Note the time difference must be consistent between all runs
@@ -0,0 +1,251 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/14_fleet.ipynb.
+
+# %% auto 0
+__all__ = ['WIND_COEFFICIENT_TYPES', 'SharedTables', 'fleet_tables', 'table', 'SharedWindCoefficients', 'FleetExecutor',
+           'run_analysis']
+
+# %% ../nbs/14_fleet.ipynb 4
+import os
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from .catalog import load_table
+from .power import get_curve_coefficient
+
+# %% ../nbs/14_fleet.ipynb 6
+def _shared_directory():
+    "The RAM backed /dev/shm if available, otherwise the default temporary directory"
+    return '/dev/shm' if os.access('/dev/shm', os.W_OK) else None
+
+class SharedTables:
+    "Read-only NumPy arrays in a single memory-mapped file which every process can map without copying"
+
+    _alignment = 64
+
+    def __init__(self, 
+                 path:str, #The path of the file holding the arrays
+                 layout:dict #The offset, shape and dtype of each array in the file
+                ):
+        self.path, self.layout, self.owner = path, layout, False
+        self._map = np.memmap(path, dtype = np.uint8, mode = 'r') if os.path.getsize(path) else None
+
+    @classmethod
+    def create(cls, 
+               arrays:dict, #The numeric arrays to share
+               directory:str = None #The directory of the file, /dev/shm if available
+              ):
+        "Write `arrays` to a new file and open it"
+        arrays = {name: np.ascontiguousarray(values) for name, values in arrays.items()}
+        layout, size = {}, 0
+        for name, values in arrays.items():
+            if values.dtype.hasobject:
+                raise ValueError(f"Only numeric arrays can be shared, {name!r} has dtype {values.dtype}")
+            layout[name] = (size, values.shape, values.dtype.str)
+            size += -(-values.nbytes//cls._alignment)*cls._alignment
+
+        fd, path = tempfile.mkstemp(prefix = 'pyseatrials-', suffix = '.tables', dir = directory or _shared_directory())
+        os.close(fd)
+        if size:
+            data = np.memmap(path, dtype = np.uint8, mode = 'w+', shape = (size,))
+            for name, values in arrays.items():
+                offset = layout[name][0]
+                data[offset:offset + values.nbytes] = values.reshape(-1).view(np.uint8)
+            data.flush()
+            del data
+        tables = cls(path, layout)
+        tables.owner = True
+        return tables
+
+    @property
+    def spec(self) -> tuple:
+        "The arguments which open these tables in another process"
+        return self.path, self.layout
+
+    def keys(self):
+        return self.layout.keys()
+
+    def __contains__(self, name):
+        return name in self.layout
+
+    def __getitem__(self, name):
+        offset, shape, dtype = self.layout[name]
+        if self._map is None:
+            return np.empty(shape, dtype)
+        return np.ndarray(shape, dtype, buffer = self._map, offset = offset)
+
+    def close(self):
+        "Release the mapping, removing the file if these tables created it"
+        self._map = None
+        if self.owner and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+# %% ../nbs/14_fleet.ipynb 9
+WIND_COEFFICIENT_TYPES = ('280_KDWT_TANKER', '6800_TEU_CONTAINERSHIP', 'CAR_CARRIER', 'CRUISE_FERRY', 'GENERAL_CARGO', 
+                          'HANDY_SIZE_BULK_CARRIER', 'LNG_CARRIER', 'LNG_CARRIER_INT', 'MULTI_PURPOSE_CARRIER')
+
+def fleet_tables(ships:dict = None #Arrays of each ship, {ship: {name: array}}
+                ) -> dict: #The arrays to place in `SharedTables`
+    "The constant tables of the package and the precomputed arrays of each ship"
+
+    arrays = {}
+    for vessel_type in WIND_COEFFICIENT_TYPES:
+        for column, values in load_table('wind_coef_data/' + vessel_type).items():
+            arrays[f'wind/{vessel_type}/{column}'] = np.asarray(values, dtype = float)
+
+    propeller = load_table('datasets/propeller_advance_lookup')
+    for column, values in propeller.items():
+        arrays[f'propeller/{column}'] = np.asarray(values, dtype = float)
+    arrays['propeller/K_T_coefs'] = get_curve_coefficient(propeller['K_T'], propeller['J'])
+    arrays['propeller/K_Q_coefs'] = get_curve_coefficient(propeller['K_Q'], propeller['J'])
+
+    for ship, ship_arrays in (ships or {}).items():
+        for name, values in ship_arrays.items():
+            arrays[f'ship/{ship}/{name}'] = np.asarray(values)
+    return arrays
+
+# %% ../nbs/14_fleet.ipynb 11
+_tables = None
+
+def _open_tables(spec):
+    "Open the shared tables of the process"
+    global _tables
+    _tables = SharedTables(*spec)
+
+def _close_tables():
+    "Release the shared tables of the process"
+    global _tables
+    if _tables is not None:
+        _tables.close()
+    _tables = None
+
+def table(name:str #The name of the shared array
+         ) -> np.ndarray: #The read-only array
+    "An array of the shared tables of the current `FleetExecutor`"
+    if _tables is None:
+        raise RuntimeError("There are no shared tables, tasks using them must be run by a FleetExecutor")
+    return _tables[name]
+
+# %% ../nbs/14_fleet.ipynb 12
+class SharedWindCoefficients:
+    "The wind coefficient $C_X$ of a vessel type interpolated from the shared tables"
+
+    def __init__(self, 
+                 vessel_type:str, #One of `WIND_COEFFICIENT_TYPES`
+                 ship_state:str #The column of the wind coefficient table
+                ):
+        self.vessel_type, self.ship_state = vessel_type, ship_state
+
+    def __call__(self, 
+                 relative_wind_direction:float #The angle of the wind relative to the ship [rads]
+                ) -> float:
+        return np.interp(relative_wind_direction, table(f'wind/{self.vessel_type}/angle_of_attack'), 
+                         table(f'wind/{self.vessel_type}/{self.ship_state}'))
+
+# %% ../nbs/14_fleet.ipynb 14
+def _run(func, task, directory):
+    "Run a task in a worker, returning DataFrames through a memory-mapped file"
+    import pandas as pd
+    result = func(task)
+    if isinstance(result, pd.DataFrame) and all(dtype.kind in 'biuf' for dtype in result.dtypes):
+        tables = SharedTables.create({str(i): result[column].to_numpy() for i, column in enumerate(result.columns)}, directory)
+        tables._map = None
+        return ('frame', tables.spec, list(result.columns), result.index)
+    return ('object', result)
+
+def _collect(message):
+    "The result of a task, reading it from the file written by the worker"
+    import pandas as pd
+    if message[0] == 'object':
+        return message[1]
+    _, spec, columns, index = message
+    tables = SharedTables(*spec)
+    tables.owner = True
+    try:
+        return pd.DataFrame({column: np.array(tables[str(i)]) for i, column in enumerate(columns)}, index = index)
+    finally:
+        tables.close()
+
+def _discard(message):
+    "Remove the file written by the worker for a result which will not be collected"
+    if message[0] == 'frame':
+        tables = SharedTables(*message[1])
+        tables.owner = True
+        tables.close()
+
+# %% ../nbs/14_fleet.ipynb 15
+class FleetExecutor:
+    "Run tasks for many ships in a pool of processes which share one copy of the constant tables"
+
+    def __init__(self, 
+                 tables:SharedTables, #The tables shared with the workers
+                 workers:int = None, #The number of worker processes, the number of CPUs if None, 0 runs the tasks in this process
+                 directory:str = None #The directory of the result files, /dev/shm if available
+                ):
+        self.tables, self.workers, self.directory = tables, workers, directory
+
+    def map(self, 
+            func, #A function of a single task, importable by the worker processes
+            tasks, #The tasks, for example one for each ship or voyage
+            cost = None #A function estimating the run time of a task, the longest tasks are started first
+           ) -> list: #The result of each task
+        "Run `func` on every task"
+        tasks = list(tasks)
+        order = list(range(len(tasks)))
+        if cost is not None:
+            order.sort(key = lambda i: cost(tasks[i]), reverse = True)
+
+        results = [None]*len(tasks)
+        if self.workers == 0:
+            _open_tables(self.tables.spec)
+            try:
+                for i in order:
+                    results[i] = func(tasks[i])
+            finally:
+                _close_tables()
+            return results
+
+        with ProcessPoolExecutor(self.workers, mp_context = multiprocessing.get_context(), 
+                                 initializer = _open_tables, initargs = (self.tables.spec,)) as pool:
+            futures = {pool.submit(_run, func, tasks[i], self.directory): i for i in order}
+            collected = set()
+            try:
+                for future in as_completed(futures):
+                    results[futures[future]] = _collect(future.result())
+                    collected.add(future)
+            except BaseException:
+                #the tasks already running still write their results, wait for them and remove the files
+                for future in futures:
+                    future.cancel()
+                for future in futures:
+                    if future in collected or future.cancelled():
+                        continue
+                    try:
+                        _discard(future.result())
+                    except BaseException:
+                        pass
+                raise
+        return results
+
+    def concat(self, 
+               func, #A function of a single task returning a DataFrame
+               tasks:dict, #The tasks by name, for example the ship
+               cost = None, #A function estimating the run time of a task
+               name:str = 'task' #The name of the index level holding the task names
+              ) -> 'pd.DataFrame': #The results of every task in one table
+        "Run `func` on every task and join the resulting tables"
+        import pandas as pd
+        return pd.concat(self.map(func, tasks.values(), cost), keys = list(tasks), names = [name])
+
+# %% ../nbs/14_fleet.ipynb 17
+def run_analysis(task:tuple #A SeaTrialAnalysis and the run table to analyse
+                ) -> 'pd.DataFrame':
+    "Run a `SeaTrialAnalysis`, for use as the task function of a `FleetExecutor`"
+    analysis, runs = task
+    return analysis.run(runs)
@@ -1,73 +1,143 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/01_general_functions.ipynb.
 
 # %% auto 0
-__all__ = ['knots_to_ms', 'ms_to_knots', 'power_correction', 'shaft_speed_correction', 'wind_resistance',
-           'temp_salinity_water_resistance', 'displacement_correction', 'load_datasets']
+__all__ = ['WATER_RESISTANCE_DTYPE', 'knots_to_ms', 'ms_to_knots', 'power_correction', 'shaft_speed_correction',
+           'wind_resistance', 'met_wind_resistance', 'temp_salinity_water_resistance',
+           'temp_salinity_water_resistance_components', 'displacement_correction', 'load_datasets']
 
 # %% ../nbs/01_general_functions.ipynb 4
 import numpy as np
-import pandas as pd
-from fastcore.test import *
-import pkgutil
-from io import BytesIO
+from .instrument import instrumented
+from .precision import record_dtype
+from .catalog import load_frame
+from .basic import moist_air_density
 
 # %% ../nbs/01_general_functions.ipynb 6
-def knots_to_ms(knots:float #the speed in knots
+@instrumented
+def knots_to_ms(knots:float, #the speed in knots
+                out:np.ndarray = None #optional array to write the result into
                ) -> float: #speed in m/s
     
     "convert knots to m/s"
     
+    if out is not None:
+        return np.divide(knots, 1.943844, out = out)
+    
     return knots/1.943844
 
 # %% ../nbs/01_general_functions.ipynb 7
-def ms_to_knots(ms:float #the speed in m/s
+@instrumented
+def ms_to_knots(ms:float, #the speed in m/s
+                out:np.ndarray = None #optional array to write the result into
                ) -> float: #speed in knots
     
     "convert knots to m/s"
     
+    if out is not None:
+        return np.multiply(ms, 1.943844, out = out)
+    
     return ms * 1.943844
 
 # %% ../nbs/01_general_functions.ipynb 12
+@instrumented
 def power_correction(pd_meas:float, #measured shaft power [W]
                      delta_R:float, #increase of resistance due to wind, waves and temperature deviation [N]
                      stw:float, #speed through water [m/s]
                      etaD_id:float, #propulsion efficiency coefficienct in ideal conditions (from model test) [-]
-                     shaft_power_overload:float #overload factor from load variation model test [-]
+                     shaft_power_overload:float, #overload factor from load variation model test [-]
+                     out:np.ndarray = None, #optional array to write the result into
+                     work:np.ndarray = None #optional scratch array of shape (2, *out.shape)
                      ) -> float: #shaft power in ideal conditions [W]
     
+    if out is not None:
+        frac, diff = np.empty((2,) + out.shape) if work is None else work
+        np.multiply(delta_R, stw, out = frac)
+        np.divide(frac, etaD_id, out = frac)
+        np.subtract(pd_meas, frac, out = diff)
+        np.multiply(4, pd_meas, out = out)
+        np.multiply(out, frac, out = out)
+        np.multiply(out, shaft_power_overload, out = out)
+        np.multiply(diff, diff, out = frac)
+        np.add(frac, out, out = out)
+        np.sqrt(out, out = out)
+        np.add(diff, out, out = out)
+        return np.multiply(0.5, out, out = out)
+    
     frac = (delta_R * stw) / etaD_id
     shaft_power = 0.5 * (pd_meas - frac + np.sqrt((pd_meas - frac) **2 + 4 * pd_meas * frac * shaft_power_overload))
     
     return shaft_power
 
 # %% ../nbs/01_general_functions.ipynb 16
+@instrumented
 def shaft_speed_correction(n_ms:float, #measured propeller shaft revolution frequency [1/s]
                            shaft_speed_overload:float, #overload factor derived from load variation model test [-]
                            pd_meas:float, #measured shaft power [W]
-                           pd_id:float #shaft power in ideal conditions [W]
+                           pd_id:float, #shaft power in ideal conditions [W]
+                           out:np.ndarray = None #optional array to write the result into
                            ) -> float: #propeller shaft revolution frequency in ideal condition [1/s]
     
+    if out is not None:
+        np.subtract(pd_meas, pd_id, out = out)
+        np.divide(out, pd_id, out = out)
+        np.multiply(shaft_speed_overload, out, out = out)
+        np.add(out, 1, out = out)
+        return np.divide(n_ms, out, out = out)
+    
     frac = (pd_meas - pd_id) / pd_id
     shaft_speed = n_ms / (shaft_speed_overload * frac + 1)
     
     return shaft_speed
 
 # %% ../nbs/01_general_functions.ipynb 20
+@instrumented
 def wind_resistance(air_density:float, #Air density [kg/$m^3$]
                    wind_resistance_coef_rel:float, #the coefficient of wind resistance using the relative angle of the wind
                    wind_resistance_coef_zero:float, #the coefficient of wind resistance using angle 0 radians
                    area:float, #The maximum transverse area of the ship exposed to the wind [m^2]
                    relative_wind_speed:float, #Relative wind speed [m/s]
-                   sog:float #speed over ground [m/s]
+                   sog:float, #speed over ground [m/s]
+                   out:np.ndarray = None, #optional array to write the result into
+                   work:np.ndarray = None #optional scratch array the shape of `out`
                    
                   )->float: #Air resistance [N]
     "Calculates the air resistance. N.B. SI units must be used. Do not use knots"
     
+    if out is not None:
+        work = np.empty_like(out) if work is None else work
+        np.multiply(relative_wind_speed, relative_wind_speed, out = out)
+        np.multiply(wind_resistance_coef_rel, out, out = out)
+        np.multiply(sog, sog, out = work)
+        np.multiply(wind_resistance_coef_zero, work, out = work)
+        np.subtract(out, work, out = out)
+        np.multiply(0.5, air_density, out = work)
+        np.multiply(work, area, out = work)
+        return np.multiply(work, out, out = out)
+    
     wind_resistance_val = 0.5*air_density*area*(wind_resistance_coef_rel*relative_wind_speed**2 - wind_resistance_coef_zero*sog**2)
     
     return wind_resistance_val
 
 # %% ../nbs/01_general_functions.ipynb 25
+@instrumented
+def met_wind_resistance(met, #Table of weather data with 'air_pressure', 'air_temperature' and humidity columns
+                        wind_resistance_coef_rel:float, #the coefficient of wind resistance using the relative angle of the wind
+                        wind_resistance_coef_zero:float, #the coefficient of wind resistance using angle 0 radians
+                        area:float, #The maximum transverse area of the ship exposed to the wind [m^2]
+                        relative_wind_speed:float, #Relative wind speed [m/s]
+                        sog:float, #speed over ground [m/s]
+                        humidity_type:str = 'relative_humidity', #The humidity column of `met`, one of `HUMIDITY_TYPES`
+                        dtype:type = None #optional floating point type of the calculation e.g. np.float32
+                       )->float: #Air resistance [N]
+
+    "Calculates the air resistance directly from weather data"
+
+    rho_air = moist_air_density(met['air_pressure'], met['air_temperature'], met[humidity_type], humidity_type, dtype)
+
+    return wind_resistance(rho_air, wind_resistance_coef_rel, wind_resistance_coef_zero, area, relative_wind_speed, sog)
+
+# %% ../nbs/01_general_functions.ipynb 29
+@instrumented
 def temp_salinity_water_resistance(CF:float, #frictional resistance coefficient for actual water temperature and salinity
                                    CF0:float, #frictional resistance coefficient for reference water temperature and salinity
                                    delta_CF:float, #roughness allowance associated with Reynolds number for actual water temperature and salinity
@@ -76,13 +146,37 @@ def temp_salinity_water_resistance(CF:float, #frictional resistance coefficient
                                    S:float, #wetted surface area [m2]
                                    stw:float, #ship’s speed through the water [m/s]
                                    rho_S:float, #water density for actual water temperature and salt content [kg/m3 ]
-                                   rho_0:float = 1026 #water density for reference water temperature and salt content                                  
+                                   rho_0:float = 1026, #water density for reference water temperature and salt content                                  
+                                   out:np.ndarray = None, #optional array to write the result into
+                                   work:np.ndarray = None #optional scratch array of shape (2, *out.shape)
                                   )-> float: #resistance increase due to deviation of water temperature and water density [N]
     
     "Resistance due to water temperature and salinity corrected relative to the reference values"
     
-    #This function can be re-written into sub-parts and all the sub-parts ouputted in a results matrix. 
-    #Would this be useful?
+    if out is not None:
+        CF_total, scratch = np.empty((2,) + out.shape) if work is None else work
+        np.add(CF, delta_CF, out = CF_total)
+        #RF * ( (CF0 + delta_CF0)/(CF + delta_CF) - 1 ) with the factors of RF multiplied in one at a time
+        np.add(CF0, delta_CF0, out = scratch)
+        np.divide(scratch, CF_total, out = scratch)
+        np.subtract(scratch, 1, out = scratch)
+        np.multiply(scratch, CF_total, out = scratch)
+        np.multiply(stw, stw, out = CF_total)
+        np.multiply(0.5, rho_S, out = out)
+        np.multiply(out, S, out = out)
+        np.multiply(out, CF_total, out = out)
+        np.multiply(out, scratch, out = out)
+        #RT0 * ( rho_S/rho_0 - 1 )
+        np.multiply(0.5, rho_0, out = scratch)
+        np.multiply(scratch, S, out = scratch)
+        np.multiply(scratch, CF_total, out = scratch)
+        np.multiply(scratch, CT0, out = scratch)
+        np.divide(rho_S, rho_0, out = CF_total)
+        np.subtract(CF_total, 1, out = CF_total)
+        np.multiply(scratch, CF_total, out = scratch)
+        return np.subtract(scratch, out, out = out)
+    
+    #The sub-parts RF and RT0 are returned by `temp_salinity_water_resistance_components`
     RF = 0.5 * rho_S* S * stw**2 * (CF + delta_CF)
     RT0 = 0.5 * rho_0 * S * stw**2 * CT0
     
@@ -91,22 +185,83 @@ def temp_salinity_water_resistance(CF:float, #frictional resistance coefficient
     return RAS
     
 
-# %% ../nbs/01_general_functions.ipynb 30
+# %% ../nbs/01_general_functions.ipynb 34
+WATER_RESISTANCE_DTYPE = np.dtype([('RF', float), ('RT0', float), ('RAS', float)])
+
+@instrumented
+def temp_salinity_water_resistance_components(CF:float, #frictional resistance coefficient for actual water temperature and salinity
+                                              CF0:float, #frictional resistance coefficient for reference water temperature and salinity
+                                              delta_CF:float, #roughness allowance associated with Reynolds number for actual water temperature and salinity
+                                              delta_CF0:float,#roughness allowance associated with Reynolds number for reference water temperature and salinity
+                                              CT0:float, #total resistance coefficient for reference water temperature and salinity
+                                              S:float, #wetted surface area [m2]
+                                              stw:float, #ship’s speed through the water [m/s], may be None if `dynamic_pressure` is given
+                                              rho_S:float, #water density for actual water temperature and salt content [kg/m3 ]
+                                              rho_0:float = 1026, #water density for reference water temperature and salt content
+                                              dynamic_pressure:float = None, #optional pre-calculated 0.5 * rho_0 * stw**2 [Pa]
+                                              out:np.ndarray = None, #optional record array of `WATER_RESISTANCE_DTYPE` to write the results into
+                                              work:np.ndarray = None #optional scratch array of the shape of `out`
+                                             )-> np.ndarray: #record array with the fields 'RF', 'RT0' and 'RAS' [N]
+
+    "The frictional resistance, reference total resistance and the temperature and salinity resistance correction together"
+
+    if dynamic_pressure is None and stw is None:
+        raise ValueError("Either stw or dynamic_pressure is needed")
+
+    if out is None:
+        inputs = (CF, CF0, delta_CF, delta_CF0, CT0, S, stw if dynamic_pressure is None else dynamic_pressure, rho_S, rho_0)
+        out = np.empty(np.broadcast_shapes(*(np.shape(x) for x in inputs)), dtype = record_dtype(WATER_RESISTANCE_DTYPE, *inputs))
+    RF, RT0, RAS = out['RF'], out['RT0'], out['RAS']
+    scratch = np.empty(out.shape, dtype = RF.dtype) if work is None else work
+
+    #0.5 * rho_0 * S * stw**2 is shared by both resistances
+    if dynamic_pressure is None:
+        np.multiply(stw, stw, out = RT0)
+        np.multiply(RT0, rho_0, out = RT0)
+        np.multiply(RT0, 0.5, out = RT0)
+    else:
+        np.copyto(RT0, dynamic_pressure)
+    np.multiply(RT0, S, out = RT0)
+    np.divide(rho_S, rho_0, out = scratch)
+    np.multiply(RT0, scratch, out = RF)
+    np.add(CF, delta_CF, out = scratch)
+    np.multiply(RF, scratch, out = RF)
+    np.multiply(RT0, CT0, out = RT0)
+
+    #RT0 * ( rho_S/rho_0 - 1 ) - RF * ( (CF0 + delta_CF0)/(CF + delta_CF) - 1 )
+    np.add(CF0, delta_CF0, out = RAS)
+    np.divide(RAS, scratch, out = RAS)
+    np.subtract(RAS, 1, out = RAS)
+    np.multiply(RAS, RF, out = RAS)
+    np.divide(rho_S, rho_0, out = scratch)
+    np.subtract(scratch, 1, out = scratch)
+    np.multiply(scratch, RT0, out = scratch)
+    np.subtract(scratch, RAS, out = RAS)
+
+    return out
+
+# %% ../nbs/01_general_functions.ipynb 39
+@instrumented
 def displacement_correction(power:float, #The total ideal power during the trial [kWh],
                             trial_displacement:float, #diplacement of the ship during the trial [m^3]
                             reference_displacement:float, #diplacement of the ship during the tank test [m^3]
+                            out:np.ndarray = None #optional array to write the result into
                             )->float: #The power corrected for the difference in displacement between the trial and the tank test
     
     """Corrects the power needed by the vessel when trial displacement differs from reference displacement"""
+    if out is not None:
+        np.divide(reference_displacement, trial_displacement, out = out)
+        np.power(out, 2/3, out = out)
+        return np.multiply(power, out, out = out)
+    
     return power * (reference_displacement/trial_displacement)**(2/3)
 
-# %% ../nbs/01_general_functions.ipynb 35
+# %% ../nbs/01_general_functions.ipynb 44
+@instrumented
 def load_datasets(dataset:str #The name of the dataset to load
                      ): #returns a dataframe containing example data
         
         "Load example datasets to try out the pyseatrials functions"
         
-        #This needs to be adapted so that the paths work on any system, using pathlib.path would be a better choice
-        res = pkgutil.get_data('pyseatrials', 'datasets/'+dataset+'.csv')
-        
-        return pd.read_csv(BytesIO(res))
+        #parsed once by the catalog, a new frame each call
+        return load_frame('datasets/'+dataset)
@@ -0,0 +1,182 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/12_graph.ipynb.
+
+# %% auto 0
+__all__ = ['Node', 'Graph', 'Context', 'correction_graph']
+
+# %% ../nbs/12_graph.ipynb 4
+import inspect
+from .general import wind_resistance, temp_salinity_water_resistance, power_correction, shaft_speed_correction, displacement_correction
+from .basic import frictional_resistance_coefs
+from .wind import rel2true_speed, rel2true_dir
+from .wave import stawave1_fn, R_AWL
+
+# %% ../nbs/12_graph.ipynb 6
+class Node:
+    "A quantity of the graph, calculated by calling `func` with the values named by `inputs`"
+
+    def __init__(self, 
+                 name:str, #The name of the quantity
+                 func, #The function calculating it
+                 **inputs #Mapping from the parameters of `func` to the names of their values when these differ
+                ):
+        params = [p for p in inspect.signature(func).parameters.values() if p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)]
+        unknown = set(inputs) - {p.name for p in params}
+        if unknown:
+            raise ValueError(f"{sorted(unknown)} are not parameters of the function of node {name!r}")
+        self.name, self.func = name, func
+        self.inputs = {p.name: inputs.get(p.name, p.name) for p in params}
+        self.optional = {p.name for p in params if p.default is not p.empty}
+
+    def __repr__(self):
+        return f"Node({self.name!r}, inputs = {list(self.inputs.values())})"
+
+# %% ../nbs/12_graph.ipynb 8
+class Graph:
+    "A set of `Node`s which are evaluated lazily in a `Context`"
+
+    def __init__(self, 
+                 nodes = () #The initial nodes
+                ):
+        self.nodes = {}
+        for node in nodes:
+            self.nodes[node.name] = node
+
+    def add(self, 
+            name:str, #The name of the quantity
+            func, #The function calculating it
+            **inputs #Mapping from the parameters of `func` to the names of their values when these differ
+           ) -> Node:
+        "Add a node to the graph, replacing any node with the same name"
+        self.nodes[name] = node = Node(name, func, **inputs)
+        return node
+
+    def node(self, 
+             name:str = None, #The name of the quantity, defaults to the name of the function
+             **inputs #Mapping from the parameters of the function to the names of their values when these differ
+            ):
+        "Decorator adding a function to the graph"
+        def _add(func):
+            self.add(name or func.__name__, func, **inputs)
+            return func
+        return _add
+
+    def ancestors(self, 
+                  *names:str #The requested quantities
+                 ) -> list: #The nodes needed to calculate them, each after its own ancestors
+        "The nodes which must be evaluated to find `names`, in the order they are evaluated"
+        order, seen = [], set()
+        def _visit(name, active):
+            if name in seen or name not in self.nodes:
+                return
+            if name in active:
+                raise ValueError(f"The graph has a cycle through {name!r}")
+            for source in self.nodes[name].inputs.values():
+                _visit(source, active | {name})
+            seen.add(name)
+            order.append(name)
+        for name in names:
+            _visit(name, frozenset())
+        return order
+
+    def dependents(self, 
+                   *names:str #Inputs or nodes of the graph
+                  ) -> set: #Every node whose value depends on them
+        "The nodes which are affected by a change of `names`"
+        found, frontier = set(), set(names)
+        while frontier:
+            frontier = {node.name for node in self.nodes.values() 
+                        if node.name not in found and frontier.intersection(node.inputs.values())}
+            found |= frontier
+        return found
+
+    def context(self, 
+                **values #The input values
+               ):
+        "A new `Context` evaluating this graph"
+        return Context(self, **values)
+
+    def evaluate(self, 
+                 *names:str, #The requested quantities
+                 **values #The input values
+                ):
+        "Calculate `names` from `values`, a single value if one name is requested otherwise a tuple"
+        return self.context(**values).get(*names)
+
+# %% ../nbs/12_graph.ipynb 10
+class Context:
+    "The inputs and memoized node values of one evaluation of a `Graph`"
+
+    def __init__(self, 
+                 graph:Graph, #The graph to evaluate
+                 **values #The input values
+                ):
+        self.graph, self.inputs, self.computed = graph, dict(values), {}
+
+    def __contains__(self, name):
+        return name in self.inputs or name in self.graph.nodes
+
+    def __getitem__(self, name):
+        if name in self.inputs:
+            return self.inputs[name]
+        if name in self.computed:
+            return self.computed[name]
+        if name not in self.graph.nodes:
+            raise KeyError(f"{name!r} is neither an input nor a node of the graph")
+
+        for node_name in self.graph.ancestors(name):
+            if node_name in self.inputs or node_name in self.computed:
+                continue
+            node = self.graph.nodes[node_name]
+            kwargs = {}
+            for param, source in node.inputs.items():
+                if source in self.inputs:
+                    kwargs[param] = self.inputs[source]
+                elif source in self.computed:
+                    kwargs[param] = self.computed[source]
+                elif param not in node.optional:
+                    raise KeyError(f"Node {node_name!r} needs the input {source!r}")
+            self.computed[node_name] = node.func(**kwargs)
+        return self.computed[name]
+
+    def get(self, 
+            *names:str #The requested quantities
+           ):
+        "The values of `names`, a single value if one name is requested otherwise a tuple"
+        values = tuple(self[name] for name in names)
+        return values[0] if len(values) == 1 else values
+
+    def update(self, 
+               **values #The changed input values
+              ):
+        "Change inputs, forgetting only the memoized nodes which depend on them"
+        for name in self.graph.dependents(*values):
+            self.computed.pop(name, None)
+        self.inputs.update(values)
+
+# %% ../nbs/12_graph.ipynb 15
+def correction_graph() -> Graph: #A new graph of the ITTC correction quantities
+    "The ITTC 7.5-04-01-01.1 corrections as a lazy graph"
+
+    g = Graph()
+    g.add('true_wind_speed', rel2true_speed, relative_windspeed = 'relative_wind_speed')
+    g.add('true_wind_direction', rel2true_dir, vessel_heading = 'heading')
+    g.add('R_AA', wind_resistance)
+
+    g.add('R_AW', stawave1_fn, length = 'bow_length')
+    g.add('R_AWL', R_AWL, V_s = 'stw', rho_s = 'water_density')
+
+    g.add('friction', frictional_resistance_coefs, temperature = 'water_temperature')
+    g.add('friction_0', frictional_resistance_coefs, temperature = 'reference_temperature', salinity = 'reference_salinity', 
+          water_density = 'reference_density')
+    g.add('CF', lambda friction: friction['C_F'])
+    g.add('delta_CF', lambda friction: friction['delta_C_F'])
+    g.add('CF0', lambda friction_0: friction_0['C_F'])
+    g.add('delta_CF0', lambda friction_0: friction_0['delta_C_F'])
+    g.add('S', lambda hull: hull.wetted_surface_area)
+    g.add('R_AS', temp_salinity_water_resistance, rho_S = 'water_density', rho_0 = 'reference_density')
+
+    g.add('delta_R', lambda R_AA, R_AW, R_AS: R_AA + R_AW + R_AS)
+    g.add('P_id', power_correction, pd_meas = 'power')
+    g.add('n_id', shaft_speed_correction, n_ms = 'shaft_speed', pd_meas = 'power', pd_id = 'P_id')
+    g.add('P_corrected', displacement_correction, power = 'P_id', trial_displacement = 'displacement')
+    return g
@@ -0,0 +1,125 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/10_hull.ipynb.
+
+# %% auto 0
+__all__ = ['Hull']
+
+# %% ../nbs/10_hull.ipynb 4
+import numpy as np
+from .basic import wetted_surface_area, calculate_form_factor
+from .wave import _a_1
+
+# %% ../nbs/10_hull.ipynb 6
+class _cached:
+    "A read-only property which is calculated on first access and then stored in the `_cache` of the instance"
+
+    def __init__(self, fn):
+        self.fn, self.name, self.__doc__ = fn, fn.__name__, fn.__doc__
+
+    def __get__(self, obj, owner = None):
+        if obj is None:
+            return self
+        if self.name not in obj._cache:
+            value = self.fn(obj)
+            #numpy float64 scalars would turn float32 arrays into float64, Python floats keep their dtype
+            obj._cache[self.name] = float(value) if isinstance(value, np.floating) else value
+        return obj._cache[self.name]
+
+# %% ../nbs/10_hull.ipynb 8
+class Hull:
+    "The immutable particulars of a ship's hull, derived geometry is computed once on first use"
+
+    __slots__ = ('L_pp', 'B', 'T_M', 'C_B', 'L_wl', 'C_M', 'C_WP', 'A_BT', 'L_BWL', 'k_yy', 'S', 'surface_roughness', '_cache')
+
+    def __init__(self, 
+                 L_pp:float, #The length between perpendiculars [m]
+                 B:float, #Beam of the vessel [m]
+                 T_M:float, #The draught at midship [m]
+                 C_B:float, #The block coefficient
+                 L_wl:float = None, #The length of the waterline, defaults to L_pp [m]
+                 C_M:float = None, #The midship section coefficient
+                 C_WP:float = None, #The waterplane area coefficient
+                 A_BT:float = 0, #The transverse sectional area of the bulb [m^2]
+                 L_BWL:float = None, #The length of the bow on the water line [m]
+                 k_yy:float = None, #Non-dimensional radius of gyration in the lateral direction
+                 S:float = None, #The wetted surface area, if not given it is estimated from the other particulars [m^2]
+                 surface_roughness:float = 150e-6 #Hull surface roughness [m]
+                ):
+        L_wl = L_pp if L_wl is None else L_wl
+        values = (L_pp, B, T_M, C_B, L_wl, C_M, C_WP, A_BT, L_BWL, k_yy, S, surface_roughness)
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, '_cache', {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Hull is immutable, use `replace` to create a hull with a different {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError("Hull is immutable")
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.__slots__[:-1])
+
+    def __reduce__(self):
+        return (self.__class__, self._values())
+
+    def __eq__(self, other):
+        return isinstance(other, Hull) and self._values() == other._values()
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __repr__(self):
+        args = ', '.join(f'{name}={value!r}' for name, value in zip(self.__slots__, self._values()) if value is not None)
+        return f'Hull({args})'
+
+    def asdict(self) -> dict: #The particulars of the hull
+        "The particulars of the hull as a dictionary"
+        return dict(zip(self.__slots__, self._values()))
+
+    def replace(self, **changes) -> 'Hull': #A new hull with the changed particulars
+        "Create a new hull with some of the particulars changed"
+        return Hull(**{**self.asdict(), **changes})
+
+    def _require(self, *names):
+        missing = [name for name in names if getattr(self, name) is None]
+        if missing:
+            raise ValueError(f"The hull particulars {missing} are needed for this calculation")
+
+    @_cached
+    def beam_length_ratio(self):
+        "The ratio of the beam to the length between perpendiculars, $B/L_{pp}$"
+        return self.B / self.L_pp
+
+    @_cached
+    def sqrt_beam_bow_ratio(self):
+        "$\\sqrt{B/L_{BWL}}$ as used by STAWAVE-1"
+        self._require('L_BWL')
+        return np.sqrt(self.B / self.L_BWL)
+
+    @_cached
+    def wetted_surface_area(self):
+        "The wetted surface area, estimated using Holtrop-Mennen when `S` is not given [m^2]"
+        if self.S is not None:
+            return self.S
+        self._require('C_M', 'C_WP')
+        return wetted_surface_area(self.T_M, self.B, self.L_wl, self.C_M, self.C_B, self.C_WP, self.A_BT)
+
+    @_cached
+    def form_factor(self):
+        "The form factor (1+k) using the Gross & Watanabe method"
+        return calculate_form_factor(self.C_B, self.B, self.L_pp, self.T_M)
+
+    @_cached
+    def roughness_constant(self):
+        "The part of the roughness allowance that does not depend on the Reynolds number"
+        return (11/250) * (self.surface_roughness / self.L_wl)**(1/3) + (1/8e3)
+
+    @_cached
+    def a_1(self):
+        "The STAWAVE-2 coefficient $a_1$"
+        return _a_1(self.C_B)
+
+    @_cached
+    def d_1(self):
+        "The STAWAVE-2 coefficient $d_1$ for $\\bar{\\omega} \\geq 1$"
+        return -566 * (self.L_pp / self.B)**(-2.66)
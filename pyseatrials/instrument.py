@@ -0,0 +1,157 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/16_instrument.ipynb.
+
+# %% auto 0
+__all__ = ['instrumented', 'enable', 'disable', 'reset', 'is_enabled', 'instrumentation', 'report', 'save_json', 'dump_stats']
+
+# %% ../nbs/16_instrument.ipynb 4
+import os
+import json
+import time
+import marshal
+import threading
+import functools
+import tracemalloc
+from contextlib import contextmanager
+
+# %% ../nbs/16_instrument.ipynb 6
+_enabled = False
+_allocations = False
+_records = {}
+_local = threading.local()
+
+class _Record:
+    "The accumulated measurements of one function"
+
+    __slots__ = ('key', 'calls', 'total_time', 'own_time', 'input_size', 'allocated', 'callers')
+
+    def __init__(self, key):
+        self.key, self.calls, self.total_time, self.own_time, self.input_size, self.allocated = key, 0, 0, 0, 0, 0
+        self.callers = {}
+
+    def asdict(self):
+        return {'calls': self.calls, 'total_time': self.total_time/1e9, 'own_time': self.own_time/1e9, 
+                'input_size': self.input_size, 'allocated': self.allocated if _allocations or self.allocated else None}
+
+# %% ../nbs/16_instrument.ipynb 7
+def _input_size(args, kwargs) -> int:
+    "The largest number of elements of the array arguments, 1 if there are none"
+    return max([getattr(value, 'size', 1) for value in args] + [getattr(value, 'size', 1) for value in kwargs.values()] + [1])
+
+def _call(name, key, func, args, kwargs):
+    "Call `func`, recording its time, input size and allocations"
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    record = _records.get(name)
+    if record is None:
+        record = _records[name] = _Record(key)
+
+    #each frame holds the name of the function, the time spent in the functions it called and the peak memory they reached
+    frame = [name, 0, 0]
+    track = _allocations and tracemalloc.is_tracing()
+    if track:
+        start_memory, outer_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+    stack.append(frame)
+    start = time.perf_counter_ns()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        elapsed = time.perf_counter_ns() - start
+        stack.pop()
+        caller = stack[-1] if stack else [None, 0, 0]
+        record.calls += 1
+        record.total_time += elapsed
+        record.own_time += elapsed - frame[1]
+        record.input_size += _input_size(args, kwargs)
+        caller[1] += elapsed
+        if track:
+            peak = max(tracemalloc.get_traced_memory()[1], frame[2])
+            record.allocated += peak - start_memory
+            caller[2] = max(caller[2], peak, outer_peak)
+        calls, total = record.callers.get(caller[0], (0, 0))
+        record.callers[caller[0]] = (calls + 1, total + elapsed)
+
+# %% ../nbs/16_instrument.ipynb 9
+def instrumented(func):
+    "Record the calls of `func` while instrumentation is enabled"
+
+    name = f'{func.__module__.split(".")[-1]}.{func.__qualname__}'
+    code = getattr(func, '__code__', None)
+    key = (code.co_filename, code.co_firstlineno, func.__qualname__) if code else ('~', 0, name)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        return _call(name, key, func, args, kwargs)
+    return wrapper
+
+# %% ../nbs/16_instrument.ipynb 11
+def enable(allocations:bool = False #Also measure the memory allocated by each call, this slows every call
+          ):
+    "Start recording the calls of instrumented functions"
+    global _enabled, _allocations
+    _enabled, _allocations = True, allocations
+    if allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def disable():
+    "Stop recording, the records are kept until `reset`"
+    global _enabled, _allocations
+    if _allocations and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _enabled, _allocations = False, False
+
+def reset():
+    "Forget all records"
+    _records.clear()
+
+def is_enabled() -> bool:
+    return _enabled
+
+# %% ../nbs/16_instrument.ipynb 12
+@contextmanager
+def instrumentation(allocations:bool = False, #Also measure the memory allocated by each call
+                    reset_records:bool = True #Forget the earlier records first
+                   ):
+    "Record the calls of instrumented functions within a block, restoring the previous state afterwards"
+    previous = _enabled, _allocations
+    if reset_records:
+        reset()
+    enable(allocations)
+    try:
+        yield _records
+    finally:
+        disable()
+        if previous[0]:
+            enable(previous[1])
+
+# %% ../nbs/16_instrument.ipynb 13
+if os.environ.get('PYSEATRIALS_INSTRUMENT', '').lower() not in ('', '0', 'false'):
+    enable(allocations = os.environ['PYSEATRIALS_INSTRUMENT'].lower() == 'alloc')
+
+# %% ../nbs/16_instrument.ipynb 15
+def report() -> dict: #The records of each function, the most time consuming first
+    "The recorded calls of every instrumented function"
+    records = sorted(_records.items(), key = lambda item: item[1].total_time, reverse = True)
+    return {name: record.asdict() for name, record in records}
+
+def save_json(path:str #The file to write
+             ):
+    "Save the records as JSON"
+    with open(path, 'w') as f:
+        json.dump(report(), f, indent = 1)
+
+def dump_stats(path:str #The file to write, readable with `pstats.Stats`
+              ):
+    "Save the records in the format written by `cProfile`"
+    stats = {}
+    for record in _records.values():
+        callers = {}
+        for caller_name, (calls, total) in record.callers.items():
+            caller = _records[caller_name].key if caller_name in _records else ('~', 0, '<caller>')
+            callers[caller] = (calls, calls, 0.0, total/1e9)
+        stats[record.key] = (record.calls, record.calls, record.own_time/1e9, record.total_time/1e9, callers)
+    with open(path, 'wb') as f:
+        marshal.dump(stats, f)
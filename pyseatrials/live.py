@@ -0,0 +1,355 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/20_live.ipynb.
+
+# %% auto 0
+__all__ = ['ESTIMATE_COLUMNS', 'RingBuffer', 'NmeaDecoder', 'JsonDecoder', 'UdpFeed', 'TcpFeed', 'LiveMonitor']
+
+# %% ../nbs/20_live.ipynb 4
+import json
+import asyncio
+import numpy as np
+from .analysis import SeaTrialAnalysis, RUN_COLUMNS
+from .nmea import parse_nmea
+from .stream import StreamingAnalysis
+from .trig import angle_difference
+
+# %% ../nbs/20_live.ipynb 6
+class RingBuffer:
+    "The last `capacity` rows of `columns`, in arrays allocated once"
+
+    def __init__(self,
+                 columns, #The names of the columns
+                 capacity:int, #The number of rows kept
+                 dtype = np.float64 #The type of the values
+                ):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.columns, self.capacity = tuple(columns), capacity
+        self.data = np.empty((capacity, len(self.columns)), dtype)
+        self.clear()
+
+    def clear(self):
+        "Remove every row"
+        self.end, self.count = 0, 0
+
+    def __len__(self):
+        return self.count
+
+    def extend(self, res:dict):
+        "Add the rows of the columns in `res`, replacing the oldest rows when the buffer is full"
+        new = np.stack([np.asarray(res[name], self.data.dtype) for name in self.columns], axis = -1)[-self.capacity:]
+        self.data[(self.end + np.arange(len(new))) % self.capacity] = new
+        self.end = (self.end + len(new)) % self.capacity
+        self.count = min(self.count + len(new), self.capacity)
+
+    def values(self) -> dict: #The columns, oldest row first
+        "The rows held"
+        rows = self.data[(self.end - self.count + np.arange(self.count)) % self.capacity]
+        return {name: rows[:, i] for i, name in enumerate(self.columns)}
+
+# %% ../nbs/20_live.ipynb 9
+def _hold(values, #The new values, NaN where there is no new value
+          last:float #The value before the first
+         ) -> np.ndarray: #The values with each NaN replaced by the value before it
+    "Hold the last value over the samples without a value"
+    known = ~np.isnan(values)
+    index = np.maximum.accumulate(np.where(known, np.arange(len(values)), -1)) if len(values) else np.zeros(0, int)
+    return np.where(index >= 0, values[np.maximum(index, 0)], last)
+
+class _Decoder:
+    "Rows of the latest value of every column"
+
+    def __init__(self):
+        self.latest = {}
+
+    def _held(self, res:dict) -> dict:
+        res = {name: _hold(np.asarray(values, float), self.latest.get(name, np.nan)) for name, values in res.items()}
+        for name, values in res.items():
+            if len(values):
+                self.latest[name] = values[-1]
+        #columns seen before keep their value in rows without them
+        n = len(next(iter(res.values()), ()))
+        return {**{name: np.full(n, value) for name, value in self.latest.items()}, **res}
+
+# %% ../nbs/20_live.ipynb 10
+class NmeaDecoder(_Decoder):
+    "Rows of the latest value of every column from an NMEA 0183 feed, one row for each `trigger` sentence"
+
+    def __init__(self,
+                 proprietary:dict = None, #Proprietary sentences, the address and its columns, see `read_nmea`
+                 trigger:str = 'VTG', #The table whose sentences make the rows
+                 require_checksum:bool = True #Skip the sentences without a checksum
+                ):
+        super().__init__()
+        self.proprietary, self.trigger, self.require_checksum = proprietary, trigger, require_checksum
+        self.rest, self.line = b'', 0
+
+    def __call__(self, data:bytes) -> dict: #The rows of the whole sentences received so far
+        "Decode the next bytes of the feed"
+        data = self.rest + data
+        end = data.rfind(b'\n') + 1
+        self.rest = data[end:]
+        tables = parse_nmea(data[:end], self.proprietary, self.require_checksum, self.line)
+        self.line += data.count(b'\n', 0, end)
+        tables['GGA'].pop('time_of_day')
+
+        rows = tables[self.trigger]['line']
+        res = {}
+        for table in tables.values():
+            #the value of each column at a row is the last one at or before it
+            after = np.searchsorted(table['line'], rows, side = 'right') - 1
+            for name, values in table.items():
+                if name != 'line':
+                    res[name] = np.where(after >= 0, values[np.maximum(after, 0)] if len(values) else np.nan, np.nan)
+        res = self._held(res)
+
+        #the sentences after the last row hold their values for the rows of the next read
+        for table in tables.values():
+            for name, values in table.items():
+                if name != 'line' and len(values):
+                    self.latest[name] = _hold(np.asarray(values, float), self.latest.get(name, np.nan))[-1]
+        return res
+
+# %% ../nbs/20_live.ipynb 12
+class JsonDecoder(_Decoder):
+    "Rows of the latest value of every column from a feed of JSON objects, one per line"
+
+    def __init__(self):
+        super().__init__()
+        self.rest = b''
+
+    def __call__(self, data:bytes) -> dict: #The rows of the whole lines received so far
+        "Decode the next bytes of the feed"
+        lines = (self.rest + data).split(b'\n')
+        self.rest = lines.pop()
+        samples = []
+        for line in lines:
+            try:
+                sample = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(sample, dict):
+                samples.append(sample)
+        names = {name for sample in samples for name in sample}
+        return self._held({name: [_number(sample.get(name)) for sample in samples] for name in names})
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+# %% ../nbs/20_live.ipynb 15
+class _Datagrams(asyncio.DatagramProtocol):
+    def __init__(self, feed):
+        self.feed = feed
+
+    def datagram_received(self, data, addr):
+        self.feed._put(data if data.endswith(b'\n') else data + b'\n')
+
+class UdpFeed:
+    "The datagrams received on a UDP port"
+
+    def __init__(self,
+                 host:str = '0.0.0.0', #The address to listen on
+                 port:int = 10110, #The port to listen on, 0 for any free port
+                 max_queue:int = 4096 #The most datagrams waiting to be read, the oldest are dropped beyond it
+                ):
+        self.host, self.port = host, port
+        self.queue = asyncio.Queue(max_queue)
+        self.transport, self.dropped = None, 0
+
+    async def start(self):
+        "Start listening, `port` is then the port listened on"
+        loop = asyncio.get_running_loop()
+        self.transport, _ = await loop.create_datagram_endpoint(lambda: _Datagrams(self), local_addr = (self.host, self.port))
+        self.port = self.transport.get_extra_info('sockname')[1]
+        return self
+
+    def _put(self, data):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(data)
+
+    def close(self):
+        "Stop listening, the iteration ends after the datagrams already received"
+        if self.transport is not None:
+            self.transport.close()
+        self._put(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        if self.transport is None:
+            await self.start()
+        data = await self.queue.get()
+        if data is None:
+            raise StopAsyncIteration
+        return data
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *args):
+        self.close()
+
+# %% ../nbs/20_live.ipynb 16
+class TcpFeed:
+    "The bytes sent by a TCP server"
+
+    def __init__(self,
+                 host:str, #The address of the server
+                 port:int, #The port of the server
+                 read_size:int = 2**16 #The most bytes read at once
+                ):
+        self.host, self.port, self.read_size = host, port, read_size
+        self.reader = self.writer = None
+
+    async def start(self):
+        "Connect to the server"
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        return self
+
+    def close(self):
+        "Close the connection"
+        if self.writer is not None:
+            self.writer.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        if self.reader is None:
+            await self.start()
+        data = await self.reader.read(self.read_size)
+        if not data:
+            self.close()
+            raise StopAsyncIteration
+        return data
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *args):
+        self.close()
+
+# %% ../nbs/20_live.ipynb 18
+ESTIMATE_COLUMNS = ('sog', 'stw', 'P_id', 'n_id', 'P_corrected')
+
+class LiveMonitor:
+    "Running estimates of the corrected speed and power of the current run from a live sensor feed"
+
+    def __init__(self,
+                 analysis:SeaTrialAnalysis, #The analysis applied to each update
+                 decoder = None, #Turns the bytes of the feed into rows, an `NmeaDecoder` if None
+                 interval:float = 1.0, #The most time between a sample arriving and its estimate [s]
+                 capacity:int = 3600, #The most samples of a run in an estimate
+                 smoothing = (), #Stateful stages applied before the analysis, see `StreamingAnalysis`
+                 current = None, #Stateful stage replacing the current stage of the analysis
+                 turn:float = np.deg2rad(10) #The change of heading that starts a new run [rad]
+                ):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.stream = StreamingAnalysis(analysis, capacity, smoothing, current)
+        self.decoder = NmeaDecoder() if decoder is None else decoder
+        self.interval, self.turn = interval, turn
+        self.samples = RingBuffer(ESTIMATE_COLUMNS + ('cos_heading', 'sin_heading'), capacity)
+        self.reset()
+
+    def reset(self):
+        "Start again from the first run"
+        self.stream.reset()
+        self.samples.clear()
+        self.run, self.count, self.run_cos, self.run_sin = -1, 0, 0.0, 0.0
+
+    def estimate(self, complete:bool = False) -> dict:
+        "The estimate of the current run"
+        values = self.samples.values()
+        res = {'run': self.run, 'samples': self.count, 'complete': complete}
+        res.update({name: float(np.mean(values[name])) for name in ESTIMATE_COLUMNS})
+        res['heading'] = float(np.mod(np.arctan2(values['sin_heading'].mean(), values['cos_heading'].mean()), 2*np.pi))
+        return res
+
+    def _new_run(self):
+        self.run, self.count, self.run_cos, self.run_sin = self.run + 1, 0, 0.0, 0.0
+        self.samples.clear()
+
+    def update(self,
+               rows:dict #Columns of the rows received since the last update
+              ) -> list: #The estimates of the runs that ended and of the current run
+        "Correct the new rows and update the estimate of the current run"
+
+        complete = np.ones(len(next(iter(rows.values()), ())), bool)
+        for name in RUN_COLUMNS:
+            complete &= np.isfinite(rows[name]) if name in rows else False
+        if not complete.any():
+            return []
+        corrected = self.stream.process_chunk({name: np.asarray(values)[complete] for name, values in rows.items()})
+        res = {name: corrected[name].to_numpy() for name in ESTIMATE_COLUMNS}
+        heading = corrected['heading'].to_numpy()
+        res['cos_heading'], res['sin_heading'] = np.cos(heading), np.sin(heading)
+
+        estimates, start = [], 0
+        while start < len(heading):
+            if self.run < 0:
+                self._new_run()
+            #the circular mean heading of the run before each sample, from the sums of the unit vectors of the run so far
+            cos_sum = self.run_cos + np.cumsum(res['cos_heading'][start:]) - res['cos_heading'][start:]
+            sin_sum = self.run_sin + np.cumsum(res['sin_heading'][start:]) - res['sin_heading'][start:]
+            before = self.count + np.arange(len(heading) - start)
+            turned = np.flatnonzero((before > 0) & (np.abs(angle_difference(heading[start:], np.arctan2(sin_sum, cos_sum))) > self.turn))
+            stop = start + turned[0] if len(turned) else len(heading)
+            if stop > start:
+                self.samples.extend({name: values[start:stop] for name, values in res.items()})
+                self.count += stop - start
+                self.run_cos += res['cos_heading'][start:stop].sum()
+                self.run_sin += res['sin_heading'][start:stop].sum()
+            if len(turned):
+                estimates.append(self.estimate(complete = True))
+                self._new_run()
+            start = stop
+        return estimates + [self.estimate()]
+
+    async def estimates(self,
+                        feed #An async iterable of the bytes of the feed, such as `UdpFeed` or `TcpFeed`
+                       ): #yields the estimates of each update
+        "Read the feed and yield the estimates at most `interval` seconds after each sample arrives"
+
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+
+        async def read():
+            try:
+                async for data in feed:
+                    queue.put_nowait(data)
+            finally:
+                queue.put_nowait(None)
+
+        reader = asyncio.create_task(read())
+        pending, first, done = [], None, False
+        try:
+            while not done:
+                timeout = None if first is None else max(first + self.interval - loop.time(), 0)
+                try:
+                    data = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    data = b''
+                if data is None:
+                    done = True
+                elif data:
+                    rows = self.decoder(data)
+                    if len(next(iter(rows.values()), ())):
+                        pending.append(rows)
+                        first = loop.time() if first is None else first
+                    if first is None or loop.time() < first + self.interval:
+                        continue
+                if pending:
+                    names = set.intersection(*(set(rows) for rows in pending))
+                    estimates = self.update({name: np.concatenate([rows[name] for rows in pending]) for name in names})
+                    for estimate in estimates:
+                        estimate['latency'] = loop.time() - first
+                        yield estimate
+                pending, first = [], None
+        finally:
+            reader.cancel()
@@ -0,0 +1,305 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/19_nmea.ipynb.
+
+# %% auto 0
+__all__ = ['SENTENCES', 'nmea_checksum', 'parse_nmea', 'iter_nmea', 'read_nmea']
+
+# %% ../nbs/19_nmea.ipynb 4
+import os
+import numpy as np
+from .general import knots_to_ms
+
+# %% ../nbs/19_nmea.ipynb 6
+def nmea_checksum(sentence:str #A sentence with or without the leading `$` and the checksum
+                 ) -> int: #The XOR of the characters between the `$` and the `*`
+    "The checksum of a single NMEA sentence"
+    body = sentence.lstrip('$!').split('*')[0]
+    checksum = 0
+    for character in body.encode('ascii'):
+        checksum ^= character
+    return checksum
+
+# %% ../nbs/19_nmea.ipynb 10
+#the value of each hexadecimal digit, -1 for the other bytes
+_HEX = np.full(256, -1, dtype = np.int16)
+_HEX[np.frombuffer(b'0123456789ABCDEF', np.uint8)] = np.arange(16)
+_HEX[np.frombuffer(b'abcdef', np.uint8)] = np.arange(10, 16)
+
+class _Fields:
+    "The fields of a group of sentences in the byte array `buf`, each stopping at `stop`"
+
+    def __init__(self, buf, commas, first, count, stop):
+        #`commas` ends with len(buf), so every comma index is valid,
+        #`first` is the index of the first comma of each sentence and `count` the number of its commas
+        self.buf, self.commas, self.first, self.count, self.stop = buf, commas, first, count, stop
+
+    def __len__(self):
+        return len(self.stop)
+
+    def bounds(self, k:int): #The start and stop of field `k`, field 0 is the address
+        "The byte range of field `k` of each sentence, empty where the sentence has fewer fields"
+        last = len(self.commas) - 1
+        lo = self.commas[np.minimum(self.first + k - 1, last)] + 1
+        hi = np.where(k < self.count, self.commas[np.minimum(self.first + k, last)], self.stop)
+        return lo, np.where(k <= self.count, hi, lo)
+
+    def text(self, k:int, width:int = 16) -> np.ndarray: #Bytes strings of at most `width` bytes
+        "Field `k` of each sentence"
+        lo, hi = self.bounds(k)
+        width = int(min(max((hi - lo).max(initial = 0), 1), width))
+        index = lo[:, None] + np.arange(width)
+        chars = np.where(index < hi[:, None], self.buf[np.minimum(index, len(self.buf) - 1)], 0).astype(np.uint8)
+        return np.ascontiguousarray(chars).view(f'S{width}').reshape(-1)
+
+    def char(self, k:int) -> np.ndarray: #The first byte of the field, 0 where it is empty
+        "The single character field `k` of each sentence"
+        lo, hi = self.bounds(k)
+        return np.where(hi > lo, self.buf[np.minimum(lo, len(self.buf) - 1)], 0)
+
+    def number(self, k:int) -> np.ndarray: #NaN where the field is empty or not a number
+        "Numeric field `k` of each sentence"
+        text = self.text(k, 24)
+        text = np.where(text == b'', b'nan', text)
+        try:
+            return text.astype(np.float64)
+        except ValueError:
+            return np.array([_float(value) for value in text])
+
+def _float(value):
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
+
+# %% ../nbs/19_nmea.ipynb 13
+_A, _V, _R, _T, _S = (ord(c) for c in 'AVRTS')
+
+#m/s per unit of the wind speed of MWV: km/h, m/s, knots and statute miles per hour
+_WIND_UNITS = np.full(256, np.nan)
+_WIND_UNITS[[ord('K'), ord('M'), ord('N'), _S]] = [1/3.6, 1.0, 1/1.943844, 0.44704]
+
+def _speed(fields, knots:int, kmh:int):
+    "A speed in m/s from its knots field, or its km/h field when there is no knots value"
+    speed = knots_to_ms(fields.number(knots))
+    return np.where(np.isnan(speed), fields.number(kmh)/3.6, speed)
+
+def _mwv(fields, reference):
+    keep = (fields.char(2) == reference) & (fields.char(5) != _V)
+    speed = fields.number(3) * _WIND_UNITS[fields.char(4)]
+    return keep, np.deg2rad(fields.number(1)), speed
+
+def _mwv_relative(fields):
+    keep, direction, speed = _mwv(fields, _R)
+    return keep, {'relative_wind_direction': direction, 'relative_wind_speed': speed}
+
+def _mwv_true(fields):
+    keep, direction, speed = _mwv(fields, _T)
+    return keep, {'true_wind_direction': direction, 'true_wind_speed': speed}
+
+def _vhw(fields):
+    return np.ones(len(fields), bool), {'stw': _speed(fields, 5, 7)}
+
+def _vtg(fields):
+    #NMEA 2.3 adds a mode field, N means the data is not valid
+    return fields.char(9) != ord('N'), {'cog': np.deg2rad(fields.number(1)), 'sog': _speed(fields, 5, 7)}
+
+def _hdt(fields):
+    return np.ones(len(fields), bool), {'heading': np.deg2rad(fields.number(1))}
+
+def _degrees(value, hemisphere, negative):
+    "Degrees from the ddmm.mmmm of NMEA positions"
+    degrees = np.floor(value/100)
+    return np.where(hemisphere == negative, -1, 1) * (degrees + (value - 100*degrees)/60)
+
+def _gga(fields):
+    quality = fields.number(6)
+    columns = {'latitude': _degrees(fields.number(2), fields.char(3), _S), 
+               'longitude': _degrees(fields.number(4), fields.char(5), ord('W')),
+               'quality': np.nan_to_num(quality).astype(np.int8)}
+    #the GGA without a position fix still give the time
+    return np.ones(len(fields), bool), columns
+
+def _time_of_day(fields):
+    "The UTC time hhmmss.ss of GGA in seconds since midnight"
+    hhmmss = fields.number(1)
+    hours, rest = np.divmod(hhmmss, 10000)
+    minutes, seconds = np.divmod(rest, 100)
+    return 3600*hours + 60*minutes + seconds
+
+#table name: (sentence type, decoder)
+SENTENCES = {'MWV': ('MWV', _mwv_relative), 'MWV_T': ('MWV', _mwv_true), 'VHW': ('VHW', _vhw), 
+             'VTG': ('VTG', _vtg), 'HDT': ('HDT', _hdt), 'GGA': ('GGA', _gga)}
+
+# %% ../nbs/19_nmea.ipynb 16
+def _proprietary(columns:dict):
+    "A decoder for a proprietary sentence with the numeric `columns`"
+    def decode(fields):
+        decoded = {}
+        for name, field in columns.items():
+            field, factor = field if isinstance(field, tuple) else (field, 1)
+            decoded[name] = fields.number(field) * factor
+        return np.ones(len(fields), bool), decoded
+    return decode
+
+# %% ../nbs/19_nmea.ipynb 18
+def _sentences(buf, require_checksum:bool):
+    "The line number, start after the `$` and stop at the `*` of the sentences with a valid checksum"
+    n = len(buf)
+    if n == 0:
+        return (np.zeros(0, np.int64),)*3
+    ends = np.flatnonzero(buf == ord('\n'))
+    if buf[-1] != ord('\n'):
+        ends = np.append(ends, n)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    #a carriage return before the line feed is not part of the sentence
+    ends = ends - ((ends > starts) & (buf[np.maximum(ends - 1, 0)] == ord('\r')))
+
+    #the sentence starts at the first $ (or ! for encapsulated sentences) of the line, anything before it is ignored
+    marks = np.append(np.flatnonzero((buf == ord('$')) | (buf == ord('!'))), n)
+    start = marks[np.searchsorted(marks, starts)] + 1
+    stars = np.append(np.flatnonzero(buf == ord('*')), n)
+    star = stars[np.searchsorted(stars, start)]
+
+    #the checksum is the two hexadecimal digits after the *
+    has_star = star + 2 < ends
+    high = np.where(has_star, _HEX[buf[np.minimum(star + 1, n - 1)]], -1)
+    low = np.where(has_star, _HEX[buf[np.minimum(star + 2, n - 1)]], -1)
+    has_star &= (high >= 0) & (low >= 0)
+    stop = np.where(has_star, star, ends)
+    valid = (start < stop) & (stop <= ends)
+
+    #the XOR of the characters of each sentence, a reduction between its start and stop
+    checked = np.flatnonzero(valid & has_star)
+    good = ~has_star & (not require_checksum)
+    if len(checked):
+        xor = np.bitwise_xor.reduceat(buf, np.column_stack((start[checked], stop[checked])).reshape(-1))[::2]
+        good[checked] = xor == 16*high[checked] + low[checked]
+
+    line = np.flatnonzero(valid & good)
+    return line, start[line], stop[line]
+
+def _addresses(buf, commas, first, start, stop) -> np.ndarray: #Bytes strings of at most 8 bytes
+    "The address of each sentence, the text before the first comma"
+    end = np.minimum(commas[first], stop)
+    index = start[:, None] + np.arange(8)
+    chars = np.where(index < end[:, None], buf[np.minimum(index, len(buf) - 1)], 0).astype(np.uint8)
+    return np.ascontiguousarray(chars).view('S8').reshape(-1)
+
+def _kinds(addresses) -> np.ndarray: #Bytes strings of 3 bytes, empty for proprietary sentences
+    "The sentence type of each address, the last three characters of the five character standard addresses"
+    chars = addresses.view(np.uint8).reshape(-1, 8)
+    standard = (chars[:, 0] != ord('P')) & (chars[:, 4] != 0) & (chars[:, 5] == 0)
+    return np.where(standard, np.ascontiguousarray(chars[:, 2:5]).view('S3').reshape(-1), b'')
+
+# %% ../nbs/19_nmea.ipynb 19
+def parse_nmea(data, #bytes or a uint8 array of whole lines of a log
+               proprietary:dict = None, #Proprietary sentences, the address and its columns
+               require_checksum:bool = True, #Skip the sentences without a checksum
+               first_line:int = 0 #The line number of the first line of `data`
+              ) -> dict: #A dictionary of tables, with the `line` of each sentence and the `time_of_day` of GGA
+    "Parse the sentences of a block of a log, without the timestamps"
+
+    buf = np.frombuffer(data, np.uint8) if isinstance(data, (bytes, bytearray, memoryview)) else np.asarray(data, np.uint8)
+    line, start, stop = _sentences(buf, require_checksum)
+    commas = np.append(np.flatnonzero(buf == ord(',')), len(buf))
+    first = np.searchsorted(commas, start)
+    count = np.searchsorted(commas, stop) - first
+    addresses = _addresses(buf, commas, first, start, stop)
+    kinds = _kinds(addresses)
+
+    decoders = {name: (kinds, sentence.encode(), decode) for name, (sentence, decode) in SENTENCES.items()}
+    for address, columns in (proprietary or {}).items():
+        decoders[address] = (addresses, address.encode(), _proprietary(columns))
+
+    res = {}
+    for name, (keys, key, decode) in decoders.items():
+        rows = np.flatnonzero(keys == key)
+        fields = _Fields(buf, commas, first[rows], count[rows], stop[rows])
+        keep, columns = decode(fields)
+        if name == 'GGA':
+            columns['time_of_day'] = _time_of_day(fields)
+        columns['line'] = line[rows] + first_line
+        res[name] = {column: values[keep] for column, values in columns.items()}
+    return res
+
+# %% ../nbs/19_nmea.ipynb 20
+def _blocks(source, block_size:int):
+    "Blocks of whole lines of the log, with the number of the first line of each"
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        yield 0, source
+        return
+    with (open(source, 'rb') if isinstance(source, (str, os.PathLike)) else source) as f:
+        first_line, rest = 0, b''
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            block = rest + block
+            end = block.rfind(b'\n') + 1
+            rest = block[end:]
+            if end:
+                yield first_line, block[:end]
+                first_line += block.count(b'\n', 0, end)
+        if rest:
+            yield first_line, rest
+
+class _Clock:
+    "The time of the last GGA before each sentence, carried from one block to the next"
+
+    def __init__(self):
+        self.time, self.day = np.nan, 0
+
+    def __call__(self, tables:dict):
+        gga = tables['GGA']
+        time_of_day = gga.pop('time_of_day')
+        known = ~np.isnan(time_of_day)
+        line, time = gga['line'][known], time_of_day[known]
+
+        #a time of day earlier than the one before by more than 12 hours is the next day
+        previous = np.concatenate(([self.time - self.day], time[:-1]))
+        day = self.day + 86400*np.cumsum(time - previous < -43200)
+        time = np.concatenate(([self.time], time + day))
+
+        for table in tables.values():
+            table['timestamp'] = time[np.searchsorted(line, table['line'], side = 'right')]
+        if len(line):
+            self.time, self.day = time[-1], day[-1]
+
+# %% ../nbs/19_nmea.ipynb 21
+def iter_nmea(source, #A path, a binary file object or the bytes of a log
+              tables = None, #The names of the tables to return, all of `SENTENCES` and `proprietary` if None
+              proprietary:dict = None, #Proprietary sentences, the address and its columns
+              date = None, #The UTC date of the start of the log, the timestamps are seconds since midnight if None
+              require_checksum:bool = True, #Skip the sentences without a checksum
+              block_size:int = 2**26 #The bytes of the log parsed at once
+             ): #yields a dictionary of tables for each block of the log
+    "Parse a log block by block"
+
+    clock = _Clock()
+    origin = None if date is None else np.datetime64(date, 'ns')
+    for first_line, block in _blocks(source, block_size):
+        res = parse_nmea(block, proprietary, require_checksum, first_line)
+        clock(res)
+        if origin is not None:
+            for table in res.values():
+                seconds = table['timestamp']
+                table['timestamp'] = np.where(np.isnan(seconds), np.datetime64('NaT', 'ns'),
+                                              origin + np.round(np.nan_to_num(seconds)*1e9).astype('timedelta64[ns]'))
+        yield {name: res[name] for name in (res if tables is None else tables)}
+
+def read_nmea(source, #A path, a binary file object or the bytes of a log
+              tables = None, #The names of the tables to return, all of `SENTENCES` and `proprietary` if None
+              proprietary:dict = None, #Proprietary sentences, the address and its columns
+              date = None, #The UTC date of the start of the log, the timestamps are seconds since midnight if None
+              require_checksum:bool = True, #Skip the sentences without a checksum
+              block_size:int = 2**26 #The bytes of the log parsed at once
+             ) -> dict: #A dictionary of tables, each a dictionary of arrays
+    "Parse a whole NMEA 0183 log into a table for each sentence type"
+
+    blocks = list(iter_nmea(source, tables, proprietary, date, require_checksum, block_size))
+    if len(blocks) == 1:
+        return blocks[0]
+    if not blocks:
+        #an empty file has no blocks, its tables are those of an empty block
+        blocks = list(iter_nmea(b'', tables, proprietary, date, require_checksum))
+    return {name: {column: np.concatenate([block[name][column] for block in blocks]) for column in blocks[0][name]}
+            for name in blocks[0]}
@@ -10,24 +10,39 @@ __all__ = ['correction_delivered_power', 'propulsive_efficiency_corr', 'full_sca
 
 # %% ../nbs/04_power.ipynb 4
 import numpy as np
-from fastcore.test import *
+from .instrument import instrumented
+from .cache import cached
+from .precision import promote, demote
 
 # %% ../nbs/04_power.ipynb 6
+@instrumented
 def correction_delivered_power(
     p_dms:float, #delivered power [W]
     resistance_increase:float, #Resistance increase derived from data measured in seatrial
     stw:float, #speed through water [m/s]
     eta_id:float, #propulsive efficiency in the ideal conditions
     eta_ms:float, # propulsive efficiency in the seattrial
+    out:np.ndarray = None, #optional array to write the result into
+    work:np.ndarray = None #optional scratch array the shape of `out`
 
 )-> float:# Returns the corrected delivered power in Newtons [N]
     
     "calculates the corrected delivered power, used as part of the direct power analysis"
     
+    if out is not None:
+        work = np.empty_like(out) if work is None else work
+        np.multiply(resistance_increase, stw, out = out)
+        np.divide(out, eta_id, out = out)
+        np.divide(eta_ms, eta_id, out = work)
+        np.subtract(1, work, out = work)
+        np.multiply(p_dms, work, out = work)
+        return np.add(out, work, out = out)
+    
     return resistance_increase * stw /eta_id + p_dms * (1- eta_ms/eta_id)
     
 
 # %% ../nbs/04_power.ipynb 10
+@instrumented
 def propulsive_efficiency_corr(n_o:float, #open water efficiency
                           n_r:float, #relative rotative efficiency
                           t:float, #thrust deduction factor
@@ -38,32 +53,55 @@ def propulsive_efficiency_corr(n_o:float, #open water efficiency
     
 
 # %% ../nbs/04_power.ipynb 14
+@instrumented
 def full_scale_wake_fraction(wake_fraction_model:float,
-                            scale_correlation_factor:float
+                            scale_correlation_factor:float,
+                            out:np.ndarray = None #optional array to write the result into
                             )-> float:
     
     "used to scale from model results to full-scale vessel"
     
+    if out is not None:
+        np.subtract(1, wake_fraction_model, out = out)
+        np.multiply(out, scale_correlation_factor, out = out)
+        return np.subtract(1, out, out = out)
+    
     return 1- (1- wake_fraction_model) * scale_correlation_factor
 
 # %% ../nbs/04_power.ipynb 19
+@instrumented
 def full_scale_wake_speed(flow_speed:float, #The speed of flow through the propeller
                          stw:float, #Ship's speed through water
+                         out:np.ndarray = None #optional array to write the result into
                          )-> float:
     
     "Calculate the wake fraction using the measured water speeds"
     
+    if out is not None:
+        np.divide(flow_speed, stw, out = out)
+        return np.subtract(1, out, out = out)
+    
     return 1 - (flow_speed/stw)
 
 # %% ../nbs/04_power.ipynb 24
+@instrumented
 def scale_correlation_factor(
     trial:float, #The full-scale wake fraction in the trial
-    model:float  #The wake fraction of the model derived from tank tests
+    model:float, #The wake fraction of the model derived from tank tests
+    out:np.ndarray = None, #optional array to write the result into
+    work:np.ndarray = None #optional scratch array the shape of `out`
 )-> float: #The dimensionless coefficient joining the full scale and model fractions
     "Calcualte the scale correlation factor using the model fraction from tank tests, and the full-scale fraction from trials"
+    if out is not None:
+        work = np.empty_like(out) if work is None else work
+        np.subtract(1, trial, out = out)
+        np.subtract(1, model, out = work)
+        return np.divide(out, work, out = out)
+    
     return (1  - trial)/(1-model)
 
 # %% ../nbs/04_power.ipynb 29
+@instrumented
 def self_propulsion_factors(
     x_ideal:float, #The variable in ideal conditions. It is acceptable to use this value without adjustments
     delta_x:float = 0, #The change per unit of the resistance ratios. Default is 0
@@ -76,12 +114,18 @@ def self_propulsion_factors(
     return x_ideal + delta_x * (delta_r/delta_r_ideal)
 
 # %% ../nbs/04_power.ipynb 34
+@instrumented
+@cached
 def get_curve_coefficient(y:float, #An array containing the dependent variable coefficient
                       x:float, #An array containing the propeller advance coefficient
                      )->float: #Returns an array containing model coefficients
     
     "Obtain the coefficients used to calculate the Thrus, and Torque coefficients and the load factor coefficients"
     
+    #the normal equations lose most of their digits in float32, so float32 data is fitted in float64
+    inputs = (y, x)
+    y, x = promote(y), promote(x)
+    
     #create the X matrix to have a quadratic form
     X = np.concatenate((x**2,x, np.ones(len(x)))).reshape([3,len(x)]).transpose()
     #Get determinate
@@ -94,10 +138,11 @@ def get_curve_coefficient(y:float, #An array containing the dependent variable c
     #Return the beta value
     b = np.matmul(temp, y)
     
-    return b
+    return demote(b, *inputs)
     
 
 # %% ../nbs/04_power.ipynb 41
+@instrumented
 def quadratic_method(coefs:float, #An array of the coefficients created by the function get_curve_coefficient
                     propeller_advance_coef:float #The propeller advance coefficient
                     )-> float: #The target value for the coefficient types entered
@@ -107,15 +152,26 @@ def quadratic_method(coefs:float, #An array of the coefficients created by the f
     return coefs[0] * propeller_advance_coef**2 + coefs[1] * propeller_advance_coef + coefs[2]
 
 # %% ../nbs/04_power.ipynb 46
+@instrumented
 def torque_coef(power:float, #The delivered power
                      shaft_speed:float, #measure propeller shaft speed [rev/s]
                      diameter:float, #properller_diameter [m]
                      efficiency:float, #relative rotative efficiency
-                     water_density:float = 1026 #water density [kg/m^3]
+                     water_density:float = 1026, #water density [kg/m^3]
+                     out:np.ndarray = None, #optional array to write the result into
+                     work:np.ndarray = None #optional scratch array the shape of `out`
                      )->float: #dimensionless thrust coefficient
     
     "calcualte the torque coefficient under ideal or trial conditions"
     
+    if out is not None:
+        work = np.empty_like(out) if work is None else work
+        np.power(shaft_speed, 3, out = work)
+        np.multiply(2 * np.pi * water_density, work, out = work)
+        np.multiply(work, diameter**5, out = work)
+        np.divide(power, work, out = out)
+        return np.multiply(out, efficiency, out = out)
+    
     denominator = 2 * np.pi * water_density * shaft_speed**3 * diameter**5
     
     return (power/denominator) *  efficiency
@@ -123,15 +179,22 @@ def torque_coef(power:float, #The delivered power
     
 
 # %% ../nbs/04_power.ipynb 51
+@instrumented
 def load_factor(thrust_coefficient:float, #The thrust coefficient
-               propeller_advance:float #The propeller advance coefficient
+               propeller_advance:float, #The propeller advance coefficient
+               out:np.ndarray = None #optional array to write the result into
                )->float: # dimensionless load factor
     
     "Calculate the load factor using the thrust and propeller advance coefficients"
     
+    if out is not None:
+        np.multiply(propeller_advance, propeller_advance, out = out)
+        return np.divide(thrust_coefficient, out, out = out)
+    
     return thrust_coefficient/propeller_advance**2
 
 # %% ../nbs/04_power.ipynb 56
+@instrumented
 def load_factor_resistance(
                     resistance:float, # The total resistance experienced by the vessel
                     thrust_deduction:float, #The thrust deduction factor
@@ -139,13 +202,28 @@ def load_factor_resistance(
                     stw:float, #Ships speed through water [m/s]
                     diameter:float, #The diameter of the ships propeller
                     water_density:float = 1026, #density of water in the given conditions [kg/m^3]
+                    out:np.ndarray = None, #optional array to write the result into
+                    work:np.ndarray = None #optional scratch array the shape of `out`
     )-> float: #this value can be in the ideal condition or trial depending on parameters used
     
     "Calculate the load factor of the propeller. Usually used to find the load factor in the ideal condition"
     
+    if out is not None:
+        work = np.empty_like(out) if work is None else work
+        np.subtract(1, wake_fraction, out = work)
+        np.multiply(work, work, out = work)
+        np.subtract(1, thrust_deduction, out = out)
+        np.multiply(out, work, out = out)
+        np.multiply(out, water_density, out = out)
+        np.multiply(stw, stw, out = work)
+        np.multiply(out, work, out = out)
+        np.multiply(out, diameter**2, out = out)
+        return np.divide(resistance, out, out = out)
+    
     return resistance /( (1 - thrust_deduction) * (1- wake_fraction)**2 * water_density * stw**2 * diameter **2 )
 
 # %% ../nbs/04_power.ipynb 61
+@instrumented
 def propeller_advance_coefficient(propeller_value:float, #The torque coefficient or loading factor as appropriate
                                   a:float, #coefficient 'a' from get_curve_coefficient
                                   b:float, #coefficient 'b' from get_curve_coefficient
@@ -171,52 +249,93 @@ def propeller_advance_coefficient(propeller_value:float, #The torque coefficient
     return J
 
 # %% ../nbs/04_power.ipynb 69
+@instrumented
 def open_water_efficiency(propeller_advance_coef:float, #The propeller advance coefficient of the ship
                          thrust_coef:float, # thrust coefficient
-                         torque_coef:float 
+                         torque_coef:float,
+                         out:np.ndarray = None, #optional array to write the result into
+                         work:np.ndarray = None #optional scratch array the shape of `out`
                          )-> float:
     
     "Calculate the open water propeller efficiency"
     
+    if out is not None:
+        work = np.empty_like(out) if work is None else work
+        np.divide(propeller_advance_coef, 2*np.pi, out = out)
+        np.divide(thrust_coef, torque_coef, out = work)
+        return np.multiply(out, work, out = out)
+    
     return (propeller_advance_coef/(2*np.pi))*(thrust_coef/torque_coef)
 
 # %% ../nbs/04_power.ipynb 74
+@instrumented
 def propeller_flow(
     propeller_advance_coef:float, #Propeller advance coefficient [n/a]
     rotations_sec:float, #propeller rotations per second [rev/sec]
     diameter:float, #Diamter of the propeller [m]
+    out:np.ndarray = None #optional array to write the result into
     )-> float: #The value that comes out is in m3/s WHAT ARE THE UNITS?
     
     "Calculate speed of water flow into the propeller"
     
+    if out is not None:
+        np.multiply(propeller_advance_coef, rotations_sec, out = out)
+        return np.multiply(out, diameter, out = out)
+    
     return propeller_advance_coef * rotations_sec * diameter
 
 # %% ../nbs/04_power.ipynb 79
+@instrumented
 def total_resistance(
                     load_factor:float, # The load factor
                     thrust_deduction:float, #The thrust deduction factor
                     wake_fraction:float, #The full-scale wake fraction
                     stw:float, #Ships speed through water [m/s]
                     diameter:float, #The diameter of the ships propeller
-                    water_density:float = 1026 #density of water in the given conditions [kg/m^3]
+                    water_density:float = 1026, #density of water in the given conditions [kg/m^3]
+                    out:np.ndarray = None, #optional array to write the result into
+                    work:np.ndarray = None #optional scratch array the shape of `out`
     )-> float: #this value can be in the ideal condition or trial depending on parameters used
     
     "Calculate the total resistance of the ship. Used to find the resistance in the ideal condition"
     
+    if out is not None:
+        work = np.empty_like(out) if work is None else work
+        np.subtract(1, wake_fraction, out = work)
+        np.multiply(work, work, out = work)
+        np.subtract(1, thrust_deduction, out = out)
+        np.multiply(load_factor, out, out = out)
+        np.multiply(out, work, out = out)
+        np.multiply(out, water_density, out = out)
+        np.multiply(stw, stw, out = work)
+        np.multiply(out, work, out = out)
+        return np.multiply(out, diameter**2, out = out)
+    
     return load_factor * (1 - thrust_deduction) * (1- wake_fraction)**2 * water_density * stw**2 * diameter **2
 
 # %% ../nbs/04_power.ipynb 84
+@instrumented
 def propeller_speed(
         propeller_advance_coef:float, #Propeller advance coefficient [n/a]
         stw:float, #The speed through water of the vessel [m/s]
         diameter:float, #Diamter of the propeller [m]
         wake_fraction:float, #The full scale wake fraction
+        out:np.ndarray = None, #optional array to write the result into
+        work:np.ndarray = None #optional scratch array the shape of `out`
         )-> float: #Propeller speed in rotations per second
     "Calculate the propeller speed in m/s"
 
+    if out is not None:
+        work = np.empty_like(out) if work is None else work
+        np.subtract(1, wake_fraction, out = out)
+        np.multiply(stw, out, out = out)
+        np.multiply(propeller_advance_coef, diameter, out = work)
+        return np.divide(out, work, out = out)
+    
     return stw*(1-wake_fraction)/(propeller_advance_coef * diameter)
 
 # %% ../nbs/04_power.ipynb 89
+@instrumented
 def calculate_all_values_from_trial_phase(
     V_s:float,
     P_dms:float,
@@ -289,6 +408,7 @@ def calculate_all_values_from_trial_phase(
     
 
 # %% ../nbs/04_power.ipynb 94
+@instrumented
 def calculate_all_values_from_ideal_phase(
         V_s:float,
         P_dms:float,
@@ -329,6 +449,7 @@ def calculate_all_values_from_ideal_phase(
     return ideal_values
 
 # %% ../nbs/04_power.ipynb 101
+@instrumented
 def delivered_power_ideal_condition(
     V_s:float,
     P_dms:float,
@@ -0,0 +1,108 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/17_precision.ipynb.
+
+# %% auto 0
+__all__ = ['DTYPES', 'get_dtype', 'set_dtype', 'compute_dtype', 'resolve_dtype', 'as_compute', 'promote', 'demote',
+           'record_dtype', 'float32_error']
+
+# %% ../nbs/17_precision.ipynb 4
+import os
+from contextlib import contextmanager
+import numpy as np
+
+# %% ../nbs/17_precision.ipynb 6
+DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+def _check_dtype(dtype) -> np.dtype:
+    "`dtype` as a numpy dtype, which must be one of `DTYPES`"
+    dtype = np.dtype(dtype)
+    if dtype not in DTYPES:
+        raise ValueError(f"The compute dtype must be float32 or float64, not {dtype}")
+    return dtype
+
+_dtype = _check_dtype(os.environ.get('PYSEATRIALS_DTYPE', 'float64'))
+
+# %% ../nbs/17_precision.ipynb 7
+def get_dtype() -> np.dtype: #The compute dtype
+    "The floating point type the package calculates in"
+    return _dtype
+
+def set_dtype(dtype #float32 or float64
+             ) -> np.dtype: #The previous compute dtype
+    "Set the floating point type the package calculates in"
+    global _dtype
+    previous, _dtype = _dtype, _check_dtype(dtype)
+    return previous
+
+@contextmanager
+def compute_dtype(dtype #float32 or float64
+                 ):
+    "Calculate in `dtype` inside the `with` block"
+    previous = set_dtype(dtype)
+    try:
+        yield get_dtype()
+    finally:
+        set_dtype(previous)
+
+# %% ../nbs/17_precision.ipynb 8
+def resolve_dtype(dtype = None #The dtype asked for by a call, None to use the compute dtype
+                 ) -> np.dtype:
+    "The dtype of a calculation, a per-call dtype takes precedence over the compute dtype"
+    return get_dtype() if dtype is None else _check_dtype(dtype)
+
+def as_compute(x, #A column, array or scalar
+               dtype = None #Optional dtype overriding the compute dtype
+              ):
+    "`x` as an array of the compute dtype, Python scalars are left alone as numpy treats them as weakly typed"
+    if isinstance(x, (int, float)):
+        return x
+    return np.asarray(x, dtype = resolve_dtype(dtype))
+
+# %% ../nbs/17_precision.ipynb 14
+def _is_float32(x) -> bool:
+    return getattr(x, 'dtype', None) == np.float32
+
+def promote(x #A scalar, array or column
+           ):
+    "A float64 copy of a float32 `x`, anything else is returned unchanged"
+    return x.astype(np.float64) if _is_float32(x) else x
+
+def demote(result, #The result of a promoted step
+           *inputs #The inputs of the step
+          ):
+    "`result` in float32 when any of `inputs` is float32, otherwise unchanged"
+    if not any(_is_float32(x) for x in inputs):
+        return result
+    return result.astype(np.float32) if hasattr(result, 'astype') else np.float32(result)
+
+# %% ../nbs/17_precision.ipynb 16
+def record_dtype(dtype:np.dtype, #A record dtype with float fields
+                 *inputs #The inputs of the calculation filling the record array
+                ) -> np.dtype:
+    "`dtype` with float32 fields when the inputs calculate in float32, so the results are stored as they were calculated"
+    if np.result_type(*(getattr(x, 'dtype', x) for x in inputs), np.float32) != np.float32:
+        return dtype
+    return np.dtype([(name, np.float32) for name in dtype.names])
+
+# %% ../nbs/17_precision.ipynb 19
+def _cast(x, dtype):
+    return x.astype(dtype) if isinstance(x, np.ndarray) and x.dtype.kind == 'f' else x
+
+def float32_error(func, #The function to check
+                  *args, #Positional arguments, float arrays are cast to each dtype
+                  **kwargs #Keyword arguments, float arrays are cast to each dtype
+                 ): #The error of each result, a tuple when `func` returns a tuple
+    "The largest difference of the float32 results of `func` from float64, relative to the largest float64 result"
+    results = []
+    for dtype in DTYPES[::-1]:
+        with compute_dtype(dtype):
+            result = func(*(_cast(x, dtype) for x in args), **{name: _cast(x, dtype) for name, x in kwargs.items()})
+        results.append(result if isinstance(result, tuple) else (result,))
+
+    errors = []
+    for exact, single in zip(*results):
+        if np.asarray(single).dtype != np.float32:
+            raise TypeError(f"{getattr(func, '__name__', func)} returned {np.asarray(single).dtype} when calculating in float32")
+        exact = np.asarray(exact, dtype = np.float64)
+        errors.append(float(np.max(np.abs(np.asarray(single, dtype = np.float64) - exact)) / np.max(np.abs(exact))))
+
+    return tuple(errors) if isinstance(result, tuple) else errors[0]
@@ -0,0 +1,227 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/28_registry.ipynb.
+
+# %% auto 0
+__all__ = ['WIND_DIRECTIONS', 'WAVE_SPEEDS', 'WAVE_FREQUENCIES', 'WindTable', 'compile_ship', 'Ship', 'ShipRegistry']
+
+# %% ../nbs/28_registry.ipynb 4
+import io
+import json
+import time
+import sqlite3
+import numpy as np
+from .hull import Hull
+from .analysis import SeaTrialAnalysis
+from .catalog import load_table
+from .cache import input_key, code_digest
+from .power import get_curve_coefficient
+from .wave import calculate_R_wave
+from .wind_res import fujiwara
+
+# %% ../nbs/28_registry.ipynb 6
+#the grids of the tabulated functions
+WIND_DIRECTIONS = np.deg2rad(np.arange(0, 181))
+WAVE_SPEEDS = np.arange(1, 15.5, 0.5)
+WAVE_FREQUENCIES = np.linspace(0.05, 3, 296)
+
+class WindTable:
+    "The wind coefficient $C_X$ interpolated from a table of relative wind directions [rad]"
+
+    def __init__(self,
+                 directions:np.ndarray, #Increasing relative wind directions from 0 to pi [rad]
+                 coefficients:np.ndarray #C_X at each direction
+                ):
+        self.directions, self.coefficients = directions, coefficients
+
+    def __call__(self,
+                 relative_wind_direction:float #The angle of the wind relative to the ship, from 0 to pi [rad]
+                ) -> float:
+        return np.interp(relative_wind_direction, self.directions, self.coefficients)
+
+def _wind_table(definition:dict) -> dict:
+    "The wind coefficients of the ITTC table or the Fujiwara geometry"
+    vessel_type = definition['analysis'].get('wind_coefficients')
+    if 'fujiwara' in definition:
+        if vessel_type is not None:
+            raise ValueError("give either the wind_coefficients of the analysis or the fujiwara geometry, not both")
+        return {'wind_directions': WIND_DIRECTIONS,
+                'wind_coefficients': np.asarray(fujiwara(**definition['fujiwara'], wind_dir = np.rad2deg(WIND_DIRECTIONS)), dtype = float)}
+    if vessel_type is None:
+        return {}
+    table = load_table('wind_coef_data/' + vessel_type)
+    coefficients = table[definition['analysis'].get('ship_state', 'average')]
+    #blank cells of the tables are left out of the interpolation
+    known = ~np.isnan(coefficients)
+    return {'wind_directions': table['angle_of_attack'][known].astype(float), 'wind_coefficients': coefficients[known].astype(float)}
+
+def _propeller(definition:dict) -> dict:
+    "The open water curves and their quadratic fits"
+    propeller = definition.get('propeller')
+    if propeller is None:
+        return {}
+    columns = load_table('datasets/' + propeller) if isinstance(propeller, str) else propeller
+    J, K_T, K_Q = (np.asarray(columns[name], dtype = float) for name in ('J', 'K_T', 'K_Q'))
+    return {'J': J, 'K_T': K_T, 'K_Q': K_Q, 'K_T_coefs': get_curve_coefficient(K_T, J), 'K_Q_coefs': get_curve_coefficient(K_Q, J)}
+
+def _wave_transfer(hull:Hull, water_density:float, g:float = 9.81) -> dict:
+    "The added resistance in regular waves per unit amplitude squared on the grid of speeds and frequencies"
+    if hull.k_yy is None:
+        return {}
+    speed, omega = WAVE_SPEEDS[:, None], WAVE_FREQUENCIES[None, :]
+    #deep water waves
+    R_wave, _, _ = calculate_R_wave(omega = omega, Fr = speed/np.sqrt(g*hull.L_pp), zeta_A = 1, k = omega**2/g, V_s = speed,
+                                    rho_s = water_density, g = g, hull = hull)
+    return {'wave_speeds': WAVE_SPEEDS, 'wave_frequencies': WAVE_FREQUENCIES, 'wave_transfer': np.asarray(R_wave, dtype = float)}
+
+def _reference_curve(definition:dict) -> dict:
+    "The reference speed-power curve, in logarithms for interpolating a power law"
+    curve = definition.get('reference_curve')
+    if curve is None:
+        return {}
+    speed, power = np.asarray(curve['speed'], dtype = float), np.asarray(curve['power'], dtype = float)
+    order = np.argsort(speed)
+    return {'log_reference_speed': np.log(speed[order]), 'log_reference_power': np.log(power[order])}
+
+def compile_ship(definition:dict #The definition of the ship
+                ) -> dict: #The precomputed arrays
+    "Compute the tables of a ship from its definition"
+    hull = Hull(**definition['hull'])
+    return {**_wind_table(definition), **_propeller(definition),
+            **_wave_transfer(hull, definition['analysis'].get('reference_density', 1026)), **_reference_curve(definition)}
+
+# %% ../nbs/28_registry.ipynb 8
+class Ship:
+    "A ship of the registry, with its analysis and precomputed tables"
+
+    def __init__(self,
+                 name:str, #The name of the ship
+                 definition:dict, #The definition of the ship
+                 tables:dict #The arrays from `compile_ship`
+                ):
+        self.name, self.definition, self.tables = name, definition, tables
+        self.hull = Hull(**definition['hull'])
+        analysis = dict(definition['analysis'])
+        if 'wind_directions' in tables:
+            analysis['wind_coefficients'] = WindTable(tables['wind_directions'], tables['wind_coefficients'])
+        self.analysis = SeaTrialAnalysis(self.hull, **analysis)
+
+    @property
+    def propeller(self) -> dict: #J, K_T and K_Q and the coefficients of their fits, for `quadratic_method`
+        return {name: self.tables[name] for name in ('J', 'K_T', 'K_Q', 'K_T_coefs', 'K_Q_coefs') if name in self.tables}
+
+    def added_wave_resistance(self,
+                              speed:float, #The speed through water [m/s]
+                              S_eta, #A function of the circular frequency [rad/s] giving the wave spectrum
+                              **kwargs #Passed to `S_eta`
+                             ) -> float: #The added resistance in irregular waves [N]
+        "The mean added resistance in a wave spectrum, from the tabulated transfer function"
+        if 'wave_transfer' not in self.tables:
+            raise ValueError(f"{self.name} has no wave transfer function, its hull needs k_yy")
+        speeds, omega, transfer = self.tables['wave_speeds'], self.tables['wave_frequencies'], self.tables['wave_transfer']
+        speed = np.asarray(speed, dtype = float)
+        #linear interpolation between the tabulated speeds
+        position = np.clip(np.interp(speed, speeds, np.arange(len(speeds))), 0, len(speeds) - 1)
+        lower = np.minimum(position.astype(int), len(speeds) - 2)
+        fraction = (position - lower)[..., None]
+        R_wave = (1 - fraction)*transfer[lower] + fraction*transfer[lower + 1]
+        #the trapezoidal rule written out, np.trapezoid needs NumPy 2 and np.trapz is removed in it
+        integrand = 2*S_eta(omega, **kwargs)*R_wave
+        return np.sum((integrand[..., 1:] + integrand[..., :-1])*np.diff(omega)/2, axis = -1)
+
+    def reference_power(self,
+                        speed:float #The speed through water [m/s]
+                       ) -> float: #The power of the reference curve [W]
+        "The power of the reference speed-power curve"
+        return np.exp(np.interp(np.log(speed), self.tables['log_reference_speed'], self.tables['log_reference_power']))
+
+    def reference_speed(self,
+                        power:float #The delivered power [W]
+                       ) -> float: #The speed of the reference curve [m/s]
+        "The speed of the reference speed-power curve, for the speed loss at a corrected power"
+        return np.exp(np.interp(np.log(power), self.tables['log_reference_power'], self.tables['log_reference_speed']))
+
+    def __repr__(self):
+        return f'Ship({self.name!r}, tables={sorted(self.tables)})'
+
+# %% ../nbs/28_registry.ipynb 10
+def _pack(tables:dict) -> bytes: #The arrays in the NumPy npz format
+    buffer = io.BytesIO()
+    np.savez(buffer, **tables)
+    return buffer.getvalue()
+
+def _unpack(blob:bytes) -> dict: #The arrays of `_pack`
+    #arrays only, a blob of the file cannot run code when loaded
+    with np.load(io.BytesIO(blob), allow_pickle = False) as data:
+        return {name: data[name] for name in data.files}
+
+class ShipRegistry:
+    "Ship definitions and their precomputed tables in a SQLite file"
+
+    def __init__(self,
+                 path:str = ':memory:' #The SQLite file, created if missing
+                ):
+        self.path, self.version = str(path), code_digest()
+        self.connection = sqlite3.connect(self.path)
+        if self.path != ':memory:':
+            #readers in other processes do not block a writer
+            self.connection.execute('PRAGMA journal_mode=WAL')
+        with self.connection:
+            self.connection.execute("""CREATE TABLE IF NOT EXISTS ships (name TEXT PRIMARY KEY, definition TEXT NOT NULL,
+                                       digest TEXT NOT NULL, version TEXT NOT NULL, tables BLOB NOT NULL, updated REAL NOT NULL)""")
+
+    def put(self,
+            name:str, #The name of the ship
+            definition:dict #The definition of the ship
+           ) -> Ship:
+        "Add or replace a ship, computing its tables"
+        definition = json.loads(json.dumps(definition))
+        ship = Ship(name, definition, compile_ship(definition))
+        with self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO ships VALUES (?, ?, ?, ?, ?, ?)',
+                                    (name, json.dumps(definition), input_key(definition), self.version,
+                                     _pack(ship.tables), time.time()))
+        return ship
+
+    def get(self,
+            name:str #The name of the ship
+           ) -> Ship:
+        "Load a ship, computing its tables again only if they are out of date"
+        row = self.connection.execute('SELECT definition, digest, version, tables FROM ships WHERE name = ?', (name,)).fetchone()
+        if row is None:
+            raise KeyError(f"there is no ship {name!r} in {self.path}")
+        definition = json.loads(row[0])
+        if row[1] != input_key(definition) or row[2] != self.version:
+            return self.put(name, definition)
+        return Ship(name, definition, _unpack(row[3]))
+
+    def definition(self, name:str) -> dict: #The definition of the ship
+        row = self.connection.execute('SELECT definition FROM ships WHERE name = ?', (name,)).fetchone()
+        if row is None:
+            raise KeyError(f"there is no ship {name!r} in {self.path}")
+        return json.loads(row[0])
+
+    def delete(self, name:str):
+        "Remove a ship"
+        with self.connection:
+            if not self.connection.execute('DELETE FROM ships WHERE name = ?', (name,)).rowcount:
+                raise KeyError(f"there is no ship {name!r} in {self.path}")
+
+    def names(self) -> list: #The names of the ships, sorted
+        return [name for name, in self.connection.execute('SELECT name FROM ships ORDER BY name')]
+
+    def analyses(self) -> dict: #The `SeaTrialAnalysis` of every ship by name, for `AnalysisService`
+        return {name: self.get(name).analysis for name in self.names()}
+
+    def __contains__(self, name:str) -> bool:
+        return self.connection.execute('SELECT 1 FROM ships WHERE name = ?', (name,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self.connection.execute('SELECT COUNT(*) FROM ships').fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+    def __repr__(self):
+        return f'ShipRegistry({self.path!r}, ships={len(self)})'
@@ -0,0 +1,166 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/22_segment.ipynb.
+
+# %% auto 0
+__all__ = ['STEADY_LIMITS', 'rolling_stats', 'steady_samples', 'find_runs', 'reciprocal_pairs', 'run_table']
+
+# %% ../nbs/22_segment.ipynb 4
+import numpy as np
+from .trig import rolling_circular_stats, angle_difference
+from .align import ANGLE_COLUMNS, _seconds
+
+# %% ../nbs/22_segment.ipynb 6
+def rolling_stats(values:float, #1D array ordered in time
+                  window:int #the number of samples in the window
+                 ) -> tuple: #the rolling mean and the rolling variance
+    "The mean and variance over a trailing window of samples"
+
+    values = np.asarray(values, dtype = float)
+    finite = np.isfinite(values)
+    #the sums are of the deviations from the overall mean, so the variance of a steady signal does not cancel away
+    shift = values[finite].mean() if finite.any() else 0.0
+    deviation = np.where(finite, values - shift, 0.0)
+
+    sums = np.concatenate(([0.0], np.cumsum(deviation)))
+    squares = np.concatenate(([0.0], np.cumsum(deviation**2)))
+    counts = np.concatenate(([0], np.cumsum(finite)))
+
+    mean = np.full(values.shape, np.nan)
+    variance = np.full(values.shape, np.nan)
+    #a window with a missing value has no statistics
+    full = counts[window:] - counts[:-window] == window
+    window_mean = (sums[window:] - sums[:-window])/window
+    mean[window - 1:] = np.where(full, window_mean + shift, np.nan)
+    variance[window - 1:] = np.where(full, np.maximum((squares[window:] - squares[:-window])/window - window_mean**2, 0), np.nan)
+    return mean, variance
+
+# %% ../nbs/22_segment.ipynb 11
+#the largest spread of a steady window, an angle [rad] for the directions and a fraction of the mean for the others
+STEADY_LIMITS = {'heading': np.deg2rad(1), 'shaft_speed': 0.01, 'power': 0.02}
+
+def _spread(values:np.ndarray, #1D array ordered in time
+            window:int, #the number of samples in the window
+            angle:bool #whether the values are directions [rad]
+           ) -> np.ndarray: #NaN where the window is not full
+    "The circular standard deviation of directions or the standard deviation relative to the mean of the other values"
+    finite = np.isfinite(values)
+    if not angle:
+        mean, variance = rolling_stats(values, window)
+        return np.sqrt(variance)/np.abs(mean)
+    _, variance = rolling_circular_stats(np.where(finite, values, 0.0), window)
+    counts = np.concatenate(([0], np.cumsum(finite)))
+    variance[window - 1:][counts[window:] - counts[:-window] < window] = np.nan
+    return np.sqrt(-2*np.log(np.clip(1 - variance, 1e-300, 1)))
+
+def steady_samples(data, #A table of aligned samples, a DataFrame or dictionary of arrays
+                   window:int = 60, #The number of samples in the windows
+                   limits:dict = None #The largest spread of each column, `STEADY_LIMITS` if None
+                  ) -> np.ndarray: #A mask of the samples
+    "Whether each sample is in a steady window"
+
+    limits = STEADY_LIMITS if limits is None else limits
+    missing = [name for name in limits if name not in data]
+    if missing:
+        raise ValueError(f"The data is missing the columns {missing}")
+    n = len(np.asarray(data[next(iter(limits))]))
+
+    steady = np.ones(n, bool)
+    for name, limit in limits.items():
+        #NaN spreads compare False
+        steady &= _spread(np.asarray(data[name], dtype = float), window, name in ANGLE_COLUMNS) <= limit
+
+    #a sample is steady when any window that contains it is, the windows ending up to `window - 1` samples after it
+    ends = np.concatenate(([0], np.cumsum(steady)))
+    return ends[np.minimum(np.arange(n) + window, n)] - ends[:n] > 0
+
+# %% ../nbs/22_segment.ipynb 13
+def find_runs(data, #A table of aligned samples, a DataFrame or dictionary of arrays
+              window:int = 60, #The number of samples in the windows
+              limits:dict = None, #The largest spread of each column, `STEADY_LIMITS` if None
+              min_samples:int = None, #The shortest run, `window` if None
+              max_drift:float = np.deg2rad(5), #The largest change of the mean heading during a run [rad]
+              trim:int = None #The samples removed from each end of a run, `window // 4` if None
+             ) -> np.ndarray: #The start and stop sample of each run, shape (runs, 2)
+    "The steady runs of a trial"
+
+    min_samples = window if min_samples is None else min_samples
+    trim = window // 4 if trim is None else trim
+    steady = steady_samples(data, window, limits).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], steady, [0])))
+    segments = np.column_stack((np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)))
+
+    heading = np.asarray(data['heading'], dtype = float) if 'heading' in data else None
+    runs = []
+    for start, stop in segments:
+        while heading is not None and stop - start > window:
+            #the mean heading of each window from the start of the run, against the first window
+            mean, _ = rolling_circular_stats(np.nan_to_num(heading[start:stop]), window)
+            drift = np.flatnonzero(np.abs(angle_difference(mean[window - 1:], mean[window - 1])) > max_drift)
+            if not len(drift):
+                break
+            runs.append((start, start + drift[0] + window - 1))
+            start = start + drift[0] + window - 1
+        runs.append((start, stop))
+    #the ends of a run can be the start of the manoeuvre, still within the limits
+    runs = np.array([(start + trim, stop - trim) for start, stop in runs if stop - start - 2*trim >= min_samples], dtype = int)
+    return runs.reshape(-1, 2)
+
+# %% ../nbs/22_segment.ipynb 14
+def reciprocal_pairs(headings:np.ndarray, #The mean heading of each run in time order [rad]
+                     tolerance:float = np.deg2rad(10) #The largest difference from opposite headings [rad]
+                    ) -> np.ndarray: #The pair of each run, counted from 0, -1 for a run without a reciprocal
+    "Label consecutive runs on opposite headings as double runs"
+
+    headings = np.asarray(headings, dtype = float)
+    #whether each run is the reciprocal of the one after it
+    opposite = np.abs(angle_difference(headings[1:], headings[:-1] + np.pi)) <= tolerance
+    pairs = np.full(len(headings), -1)
+    pair, i = 0, 0
+    while i < len(headings) - 1:
+        if opposite[i]:
+            pairs[i:i + 2] = pair
+            pair, i = pair + 1, i + 2
+        else:
+            i += 1
+    return pairs
+
+# %% ../nbs/22_segment.ipynb 17
+def run_table(data, #A table of aligned samples, a DataFrame or dictionary of arrays
+              window:int = 60, #The number of samples in the windows
+              limits:dict = None, #The largest spread of each column, `STEADY_LIMITS` if None
+              min_samples:int = None, #The shortest run, `window` if None
+              max_drift:float = np.deg2rad(5), #The largest change of the mean heading during a run [rad]
+              trim:int = None, #The samples removed from each end of a run, `window // 4` if None
+              reciprocal_tolerance:float = np.deg2rad(10) #The largest difference from opposite headings of a double run [rad]
+             ) -> 'pd.DataFrame': #One row per run with the mean of every numeric column
+    "Find the steady runs of a trial and average each into a row of the run table"
+    import pandas as pd
+
+    runs = find_runs(data, window, limits, min_samples, max_drift, trim)
+    start, stop = runs[:, 0], runs[:, 1]
+    res = {'run': np.arange(len(runs)), 'start': start, 'stop': stop, 'samples': stop - start}
+
+    for name in data.keys():
+        values = np.asarray(data[name])
+        if name == 'timestamp':
+            seconds = _seconds(values)
+            res['duration'] = seconds[np.maximum(stop - 1, 0)] - seconds[start] if len(runs) else np.zeros(0)
+            #the mid time of each run in hours from the first sample, as `current_mean_of_means` needs
+            values, name = (seconds - seconds[0])/3600, 'time'
+        elif values.dtype.kind not in 'fiub':
+            continue
+        values = np.asarray(values, dtype = float)
+        if name in ANGLE_COLUMNS:
+            res[name] = np.mod(np.arctan2(_run_means(np.sin(values), start, stop), _run_means(np.cos(values), start, stop)), 2*np.pi)
+        else:
+            res[name] = _run_means(values, start, stop)
+
+    res['pair'] = reciprocal_pairs(res['heading'], reciprocal_tolerance) if 'heading' in res else np.full(len(runs), -1)
+    return pd.DataFrame(res)
+
+def _run_means(values, start, stop):
+    "The mean of the finite values of each run"
+    finite = np.isfinite(values)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(finite, values, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(finite)))
+    n = counts[stop] - counts[start]
+    return np.divide(sums[stop] - sums[start], n, out = np.full(len(start), np.nan), where = n > 0)
@@ -0,0 +1,307 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/27_service.ipynb.
+
+# %% auto 0
+__all__ = ['ENDPOINTS', 'apply_stages', 'MicroBatcher', 'Metrics', 'AnalysisService', 'serve']
+
+# %% ../nbs/27_service.ipynb 4
+import json
+import time
+import asyncio
+from collections import deque
+from http import HTTPStatus
+import numpy as np
+from .analysis import SeaTrialAnalysis
+
+# %% ../nbs/27_service.ipynb 6
+#the stages run by each endpoint
+ENDPOINTS = {'wind': ('wind',),
+             'waves': ('waves',),
+             'power': ('wind', 'waves', 'current', 'water', 'power'),
+             'run': SeaTrialAnalysis.stages}
+
+def apply_stages(analysis:SeaTrialAnalysis, #The analysis of the ship
+                 stages:tuple, #The names of the stages, in order
+                 res:dict #The columns of the samples
+                ) -> dict: #The columns added by the stages
+    "Apply correction stages to independent samples"
+    res, out = dict(res), {}
+    for name in stages:
+        if name == 'current':
+            #samples are corrected on their own, without the runs the current methods need
+            sog = res['sog']
+            stage = {'stw': res.get('stw', sog), 'current': res.get('stw', sog) - sog}
+        else:
+            stage = getattr(analysis, name)(res)
+        res.update(stage)
+        out.update(stage)
+    return out
+
+# %% ../nbs/27_service.ipynb 8
+def _columns(body:dict) -> tuple: #The columns as float arrays of equal length and that length
+    "The columns of a request, single numbers repeated for every sample"
+    if not isinstance(body, dict) or not body:
+        raise ValueError("the request must be a JSON object of columns")
+    columns = {name: np.asarray(values, dtype = float) for name, values in body.items()}
+    lengths = {len(values) for values in columns.values() if values.ndim == 1}
+    if len(lengths) > 1 or any(values.ndim > 1 for values in columns.values()):
+        raise ValueError("the columns must be single numbers or lists of the same length")
+    n = lengths.pop() if lengths else 1
+    return {name: np.broadcast_to(values, (n,)) for name, values in columns.items()}, n
+
+class MicroBatcher:
+    "Gather the calls arriving within a window into a single call on the concatenated columns"
+
+    def __init__(self,
+                 func, #A function of a dictionary of columns returning a dictionary of columns
+                 window:float = 0.002, #The longest a call waits for others to join its batch [s]
+                 max_rows:int = 2**16, #A batch is started at once when it reaches this many rows
+                 on_batch = None #Called with the number of calls and rows of each batch
+                ):
+        self.func, self.window, self.max_rows, self.on_batch = func, window, max_rows, on_batch
+        self.pending, self.rows, self.timer = [], 0, None
+
+    async def __call__(self,
+                       columns:dict, #Arrays of equal length
+                       n:int #The length of the arrays
+                      ) -> dict: #The columns of the result for these rows
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((columns, n, future))
+        self.rows += n
+        if self.rows >= self.max_rows:
+            self._flush()
+        elif self.timer is None:
+            self.timer = asyncio.get_running_loop().call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        "Start the pending calls as a batch"
+        if self.timer is not None:
+            self.timer.cancel()
+        batch, self.pending, self.rows, self.timer = self.pending, [], 0, None
+        if batch:
+            asyncio.get_running_loop().create_task(self._run(batch))
+
+    async def _run(self, batch):
+        "Call the function on the batch in a worker thread and hand each call its rows"
+        total = sum(n for _, n, _ in batch)
+        try:
+            names = batch[0][0].keys()
+            merged = {name: np.concatenate([columns[name] for columns, _, _ in batch]) for name in names}
+            result = await asyncio.get_running_loop().run_in_executor(None, self.func, merged)
+        except Exception as error:
+            if len(batch) > 1:
+                #one bad call must not fail the others, each is run again on its own
+                await asyncio.gather(*[self._run([call]) for call in batch])
+                return
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        if self.on_batch is not None:
+            self.on_batch(len(batch), total)
+        start = 0
+        for _, n, future in batch:
+            if not future.done():
+                #columns that are not one value per row, such as constants, go to every call
+                future.set_result({name: values[start:start + n] if np.ndim(values) == 1 and len(values) == total else values
+                                   for name, values in result.items()})
+            start += n
+
+# %% ../nbs/27_service.ipynb 11
+class Metrics:
+    "Counts of the requests and batches and the latency of the latest requests"
+
+    def __init__(self,
+                 size:int = 10000 #The number of latest latencies kept
+                ):
+        self.start = time.perf_counter()
+        self.requests, self.errors, self.rows, self.batches, self.batched_rows = 0, 0, 0, 0, 0
+        self.latencies = deque(maxlen = size)
+
+    def request(self,
+                seconds:float, #The time from receiving the request to sending the response
+                rows:int = 0, #The number of samples corrected
+                error:bool = False #Whether the request failed
+               ):
+        self.requests += 1
+        self.errors += error
+        self.rows += rows
+        self.latencies.append(seconds)
+
+    def batch(self, calls:int, rows:int):
+        self.batches += 1
+        self.batched_rows += rows
+
+    def snapshot(self) -> dict: #The metrics as a JSON serialisable dictionary
+        "The totals since the start, the throughput and the latency percentiles [ms]"
+        elapsed = time.perf_counter() - self.start
+        latencies = 1e3*np.array(self.latencies)
+        percentiles = dict(zip(('p50', 'p95', 'p99'), np.percentile(latencies, [50, 95, 99]).tolist())) if len(latencies) else {}
+        return {'uptime': elapsed, 'requests': self.requests, 'errors': self.errors, 'rows': self.rows, 'batches': self.batches,
+                'rows_per_batch': self.batched_rows/self.batches if self.batches else 0.0,
+                'requests_per_second': self.requests/elapsed, 'rows_per_second': self.rows/elapsed,
+                'latency_ms': {'mean': float(latencies.mean()) if len(latencies) else None, **percentiles,
+                               'max': float(latencies.max()) if len(latencies) else None}}
+
+# %% ../nbs/27_service.ipynb 13
+def _json(result:dict) -> bytes:
+    "The columns as JSON, NaN as null"
+    out = {}
+    for name, values in result.items():
+        values = np.asarray(values)
+        if values.dtype.kind == 'f' and np.isnan(values).any():
+            out[name] = np.where(np.isnan(values), None, values).tolist()
+        else:
+            out[name] = values.tolist()
+    return json.dumps(out).encode()
+
+async def _read_request(reader) -> tuple: #The method, path and headers, None when the connection is to be closed
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, path, _ = line.decode('latin-1').split()
+    except ValueError:
+        #not HTTP, the connection is dropped
+        return None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return method, path, headers
+
+class _HTTPError(Exception):
+    def __init__(self, status:HTTPStatus, message:str):
+        super().__init__(message)
+        self.status = status
+
+class AnalysisService:
+    "An HTTP service of the corrections of each ship, batching concurrent requests"
+
+    def __init__(self,
+                 ships:dict = None, #The `SeaTrialAnalysis` of each ship by name
+                 window:float = 0.002, #The longest a request waits for others to join its batch [s]
+                 max_rows:int = 2**16, #A batch is started at once when it reaches this many samples
+                 max_body:int = 2**26 #The largest request accepted [bytes]
+                ):
+        self.window, self.max_rows, self.max_body = window, max_rows, max_body
+        self.ships, self.batchers, self.metrics = {}, {}, Metrics()
+        for name, analysis in (ships or {}).items():
+            self.add_ship(name, analysis)
+
+    def add_ship(self,
+                 name:str, #The name of the ship in the paths
+                 analysis:SeaTrialAnalysis #The analysis of the ship
+                ):
+        "Add or replace a ship, running every stage once so its tables and hull geometry are ready"
+        apply_stages(analysis, SeaTrialAnalysis.stages, {'sog': np.array([5.0]), 'heading': np.array([0.0]),
+                                                         'relative_wind_speed': np.array([5.0]), 'relative_wind_direction': np.array([0.0]),
+                                                         'power': np.array([1e6]), 'shaft_speed': np.array([1.0])})
+        self.ships[name] = analysis
+        #batches of the replaced analysis finish with it
+        self.batchers = {key: batcher for key, batcher in self.batchers.items() if key[0] != name}
+
+    def _batcher(self, ship:str, endpoint:str, names:tuple) -> MicroBatcher:
+        "The batcher of the requests to an endpoint of a ship with the same columns"
+        key = (ship, endpoint, names)
+        if key not in self.batchers:
+            analysis, stages = self.ships[ship], ENDPOINTS[endpoint]
+            self.batchers[key] = MicroBatcher(lambda res: apply_stages(analysis, stages, res), self.window, self.max_rows,
+                                              self.metrics.batch)
+        return self.batchers[key]
+
+    async def handle(self,
+                     method:str, #The HTTP method
+                     path:str, #The path of the request
+                     body:bytes #The body of the request
+                    ) -> tuple: #The status and the JSON body of the response, and the number of samples corrected
+        "Answer a request"
+        parts = [part for part in path.split('?')[0].split('/') if part]
+        if parts == ['metrics'] and method == 'GET':
+            return HTTPStatus.OK, json.dumps(self.metrics.snapshot()).encode(), 0
+        if parts == ['ships'] and method == 'GET':
+            return HTTPStatus.OK, json.dumps(sorted(self.ships)).encode(), 0
+        if len(parts) == 2 and parts[0] == 'ships' and method == 'PUT':
+            return self._put_ship(parts[1], body)
+        if len(parts) == 3 and parts[0] == 'ships' and parts[2] in ENDPOINTS:
+            if method != 'POST':
+                raise _HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} is not allowed, use POST")
+            if parts[1] not in self.ships:
+                raise _HTTPError(HTTPStatus.NOT_FOUND, f"there is no ship {parts[1]!r}")
+            try:
+                columns, n = _columns(json.loads(body))
+            except (ValueError, TypeError) as error:
+                raise _HTTPError(HTTPStatus.BAD_REQUEST, str(error)) from None
+            try:
+                result = await self._batcher(parts[1], parts[2], tuple(sorted(columns)))(columns, n)
+            except KeyError as error:
+                raise _HTTPError(HTTPStatus.BAD_REQUEST, f"the request is missing the column {error}") from None
+            return HTTPStatus.OK, _json(result), n
+        raise _HTTPError(HTTPStatus.NOT_FOUND, f"there is no {path}")
+
+    def _put_ship(self, name:str, body:bytes):
+        "Add a ship from a configuration"
+        from pyseatrials.cli import build_analysis
+        try:
+            config = json.loads(body)
+            self.add_ship(name, build_analysis(config['hull'], config['analysis']))
+        except (ValueError, TypeError, KeyError) as error:
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, f"the configuration is not valid: {error!r}") from None
+        return HTTPStatus.OK, json.dumps(sorted(self.ships)).encode(), 0
+
+    async def _handle_connection(self, reader, writer):
+        "Answer the requests of a connection until it is closed"
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                start = time.perf_counter()
+                method, path, headers = request
+                rows, status = 0, HTTPStatus.OK
+                try:
+                    length = int(headers.get('content-length', 0))
+                    if length > self.max_body:
+                        raise _HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"the request is larger than {self.max_body} bytes")
+                    body = await reader.readexactly(length)
+                    status, response, rows = await self.handle(method, path, body)
+                except _HTTPError as error:
+                    status, response = error.status, json.dumps({'error': str(error)}).encode()
+                except Exception as error:
+                    status, response = HTTPStatus.INTERNAL_SERVER_ERROR, json.dumps({'error': repr(error)}).encode()
+                close = headers.get('connection', '').lower() == 'close' or status == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+                writer.write(f"HTTP/1.1 {status.value} {status.phrase}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(response)}\r\nConnection: {'close' if close else 'keep-alive'}\r\n\r\n".encode() + response)
+                await writer.drain()
+                self.metrics.request(time.perf_counter() - start, rows, status != HTTPStatus.OK)
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self,
+                    host:str = '127.0.0.1', #The address to listen on
+                    port:int = 8080 #The port to listen on, any free port if 0
+                   ) -> asyncio.Server:
+        "Start listening, the server runs until closed"
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+# %% ../nbs/27_service.ipynb 14
+def serve(service:AnalysisService, #The service to run
+          host:str = '127.0.0.1', #The address to listen on
+          port:int = 8080 #The port to listen on
+         ):
+    "Run the service until interrupted"
+    async def main():
+        server = await service.start(host, port)
+        async with server:
+            await server.serve_forever()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -5,25 +5,36 @@ __all__ = ['shallow_water_correction']
 
 # %% ../nbs/07_shallow_water.ipynb 7
 import numpy as np
+from .instrument import instrumented
+from .basic import _require, _from_hull
 
+@instrumented
 def shallow_water_correction(coef_visc_frict: float, #the coefficient of viscous friction [none]
                              stw: float,  # speed through water [m/s^2]
-                             L_pp: float, #The length between perpendiculars of the ship [m]
-                             beam: float, #The beam of the ship [m]
-                             draught: float, #The draught at mid-ship [m]
-                             C_B: float, #The block coefficient of the ship [none]
-                             displacement: float, # The measured displacement from the trial [m^3]
-                             wetted_surface_area: float, # The wetted surface area of the ships hull [m^2]
-                             waterplane_area: float, #area of the waterline from the trail [m^2]
-                             power: float, #The engine power [kW]
-                             etad: float,  #The propulsive efficiency of the propeller [none]
-                             water_density: float, # Water density [kg/m^3]
-                             water_depth: float, # The depth of the water [m]
-                             R_V_deep=None #The viscous friction experienced by the ship, this is left as none and used internally by the function
+                             L_pp: float = None, #The length between perpendiculars of the ship [m]
+                             beam: float = None, #The beam of the ship [m]
+                             draught: float = None, #The draught at mid-ship [m]
+                             C_B: float = None, #The block coefficient of the ship [none]
+                             displacement: float = None, # The measured displacement from the trial [m^3]
+                             wetted_surface_area: float = None, # The wetted surface area of the ships hull [m^2]
+                             waterplane_area: float = None, #area of the waterline from the trail [m^2]
+                             power: float = None, #The engine power [kW]
+                             etad: float = None,  #The propulsive efficiency of the propeller [none]
+                             water_density: float = None, # Water density [kg/m^3]
+                             water_depth: float = None, # The depth of the water [m]
+                             R_V_deep=None, #The viscous friction experienced by the ship, this is left as none and used internally by the function
+                             *,
+                             hull = None #Optional `Hull`, gives the length, beam, draught, block coefficient and wetted surface area not passed
                              ) -> tuple[float, float, float]: # Returns 3 values the equivalent deep water power, the sinkage, the viscous resistance correction
     """
     Perform Raven corrections for shallow water performance
     """
+    _require(displacement = displacement, waterplane_area = waterplane_area, power = power, etad = etad, water_depth = water_depth)
+    if R_V_deep is None:
+        _require(coef_visc_frict = coef_visc_frict, water_density = water_density)
+    L_pp, beam, draught, C_B, wetted_surface_area = _from_hull(hull, {'beam': 'B', 'draught': 'T_M'}, L_pp = L_pp, beam = beam, draught = draught, 
+                                                               C_B = C_B, wetted_surface_area = wetted_surface_area)
+
     # Calculate viscous friction in deep water if not provided
     if R_V_deep is None:
         R_V_deep = coef_visc_frict * 0.5 * water_density * stw**2 * wetted_surface_area
@@ -32,7 +43,8 @@ def shallow_water_correction(coef_visc_frict: float, #the coefficient of viscous
     R_V = R_V_deep * 0.57 * (draught /water_depth)**1.79
 
     # Calculate the sinkage
-    Fr_hd = stw / np.sqrt(9.81 * 0.3 * L_pp)
+    #a power of 0.5 keeps a scalar length a Python float, np.sqrt would make it a float64 and turn float32 speeds into float64
+    Fr_hd = stw / (9.81 * 0.3 * L_pp)**0.5
     Fr_h = stw / np.sqrt(9.81 * water_depth)
     sinkage = 1.46 * displacement / L_pp ** 2 * ((Fr_h**2 / np.sqrt(1 - Fr_h**2)) - (Fr_hd**2 / np.sqrt(1 - Fr_hd ** 2)))
     #sinkage = np.maximum(sinkage, 0)
@@ -0,0 +1,164 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/13_stream.ipynb.
+
+# %% auto 0
+__all__ = ['batch_columns', 'rechunk', 'RollingMean', 'RollingCircularMean', 'RollingCurrent', 'StreamingAnalysis']
+
+# %% ../nbs/13_stream.ipynb 4
+import numpy as np
+from .analysis import SeaTrialAnalysis
+from .precision import as_compute
+
+# %% ../nbs/13_stream.ipynb 6
+def batch_columns(batch) -> dict: #The columns of the batch as a dictionary of NumPy arrays
+    "The columns of a DataFrame, dictionary of arrays, NumPy structured array or Arrow record batch"
+
+    if isinstance(batch, np.ndarray):
+        return {name: batch[name] for name in batch.dtype.names}
+    if hasattr(batch, 'column_names'):
+        #Arrow record batches and tables, without needing pyarrow installed for the other types
+        return {name: batch.column(name).to_numpy() for name in batch.column_names}
+    return {name: np.asarray(batch[name]) for name in batch.keys()}
+
+# %% ../nbs/13_stream.ipynb 7
+def rechunk(batches, #An iterable of record batches
+            chunk_size:int #The maximum number of rows of each chunk
+           ): #yields dictionaries of arrays with chunk_size rows, apart from the last which may be shorter
+    "Regroup a stream of record batches of any size into chunks of a fixed size"
+
+    pending, n_pending = [], 0
+    for batch in batches:
+        columns = batch_columns(batch)
+        n = len(next(iter(columns.values()), ()))
+        start = 0
+        while start < n:
+            take = min(chunk_size - n_pending, n - start)
+            pending.append({name: values[start:start + take] for name, values in columns.items()})
+            n_pending += take
+            start += take
+            if n_pending == chunk_size:
+                yield _join(pending)
+                pending, n_pending = [], 0
+    if n_pending:
+        yield _join(pending)
+
+def _join(parts):
+    if len(parts) == 1:
+        return parts[0]
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+# %% ../nbs/13_stream.ipynb 10
+def _trailing_mean(values, #2D array, samples along the first axis
+                   window:int #The number of samples in the window
+                  ):
+    "The mean over a trailing window of each column, over fewer samples at the start"
+
+    cumulative = np.concatenate((np.zeros((1,) + values.shape[1:]), np.cumsum(values, axis = 0)))
+    end = np.arange(1, len(values) + 1)
+    start = np.maximum(end - window, 0)
+    return (cumulative[end] - cumulative[start])/(end - start).reshape((-1,) + (1,)*(values.ndim - 1))
+
+# %% ../nbs/13_stream.ipynb 11
+class RollingMean:
+    "The trailing mean of `columns` over `window` samples, carried across chunks"
+
+    def __init__(self, 
+                 columns, #The names of the columns to average
+                 window:int, #The number of samples in the window
+                 suffix:str = '' #Added to the names of the averaged columns, the columns are replaced if empty
+                ):
+        self.columns, self.window, self.suffix = tuple(columns), window, suffix
+        self.reset()
+
+    def reset(self):
+        "Forget the samples of the earlier chunks"
+        self.tail = np.zeros((0, len(self.columns)))
+
+    def _values(self, res):
+        return np.stack([res[name] for name in self.columns], axis = -1).astype(float)
+
+    def _mean(self, res):
+        new = self._values(res)
+        values = np.concatenate((self.tail, new))
+        self.tail = values[len(values) - min(self.window - 1, len(values)):]
+        return _trailing_mean(values, self.window)[len(values) - len(new):]
+
+    def __call__(self, res:dict) -> dict:
+        mean = self._mean(res)
+        return {name + self.suffix: mean[:, i] for i, name in enumerate(self.columns)}
+
+# %% ../nbs/13_stream.ipynb 12
+class RollingCircularMean(RollingMean):
+    "The trailing mean direction of the angles in `columns` [rad], carried across chunks"
+
+    def _values(self, res):
+        angles = np.stack([res[name] for name in self.columns], axis = -1).astype(float)
+        return np.concatenate((np.cos(angles), np.sin(angles)), axis = -1)
+
+    def reset(self):
+        self.tail = np.zeros((0, 2*len(self.columns)))
+
+    def __call__(self, res:dict) -> dict:
+        mean = self._mean(res)
+        n = len(self.columns)
+        direction = np.mod(np.arctan2(mean[:, n:], mean[:, :n]), 2*np.pi)
+        return {name + self.suffix: direction[:, i] for i, name in enumerate(self.columns)}
+
+# %% ../nbs/13_stream.ipynb 14
+class RollingCurrent(RollingMean):
+    "The current as the trailing mean of the log speed through water minus the speed over ground"
+
+    def __init__(self, 
+                 window:int #The number of samples in the window
+                ):
+        super().__init__(('current',), window)
+
+    def _values(self, res):
+        return (res['stw'] - res['sog']).astype(float)[:, None]
+
+    def __call__(self, res:dict) -> dict:
+        current = self._mean(res)[:, 0]
+        return {'current': current, 'stw': res['sog'] + current}
+
+# %% ../nbs/13_stream.ipynb 17
+class StreamingAnalysis:
+    "Apply a `SeaTrialAnalysis` to a stream of record batches, one chunk of bounded size at a time"
+
+    def __init__(self, 
+                 analysis:SeaTrialAnalysis, #The analysis applied to each chunk
+                 chunk_size:int = 3600, #The maximum number of rows held in memory
+                 smoothing = (), #Stateful stages applied before the analysis
+                 current = None #Stateful stage replacing the current stage of the analysis
+                ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.analysis, self.chunk_size, self.smoothing, self.current = analysis, chunk_size, list(smoothing), current
+
+    def reset(self):
+        "Forget the state of the stateful stages, ready for a new stream"
+        for stage in self.smoothing + [self.current]:
+            if stage is not None:
+                stage.reset()
+
+    def process_chunk(self, 
+                      res:dict #The columns of one chunk
+                     ) -> 'pd.DataFrame': #The chunk with the corrections added
+        "Apply every stage to a single chunk"
+        import pandas as pd
+        #timestamps and masks keep their types
+        res = {name: as_compute(values) if np.asarray(values).dtype.kind in 'fiu' else values for name, values in res.items()}
+        for stage in self.smoothing:
+            res.update(stage(res))
+        for name in self.analysis.stages:
+            if name == 'current':
+                stage = self.current or (lambda res: {'stw': res.get('stw', res['sog'])})
+            else:
+                stage = getattr(self.analysis, name)
+            res.update(stage(res))
+        return pd.DataFrame(res)
+
+    def process(self, 
+                batches #An iterable of record batches
+               ): #yields a DataFrame of corrected data for each chunk
+        "Apply the correction chain to a stream of record batches"
+        for chunk in rechunk(batches, self.chunk_size):
+            yield self.process_chunk(chunk)
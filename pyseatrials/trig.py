@@ -1,35 +1,48 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/09_trig.ipynb.
 
 # %% auto 0
-__all__ = ['opposite_magnitude_fn', 'adjacent_magnitude_fn', 'combine_vectors', 'law_of_cosines', 'find_gamma_fn']
+__all__ = ['opposite_magnitude_fn', 'adjacent_magnitude_fn', 'combine_vectors', 'law_of_cosines', 'find_gamma_fn',
+           'weighted_circular_mean', 'circular_mean', 'circular_variance', 'angle_difference', 'rolling_circular_stats']
 
 # %% ../nbs/09_trig.ipynb 4
 import numpy as np
-import pandas as pd
-from fastcore.test import *
+from .instrument import instrumented
 
 # %% ../nbs/09_trig.ipynb 6
+@instrumented
 def opposite_magnitude_fn(magnitude:float, #The true speed 
                              angle:float, #The angle in radians
+                             out:np.ndarray = None #optional array to write the result into
                             ) -> int: #The vertical component of the magnitude
     "Product of sin and magnitude"
     
+    if out is not None:
+        np.sin(angle, out = out)
+        return np.multiply(magnitude, out, out = out)
+    
     x = magnitude * np.sin(angle)
     
     return x
 
 # %% ../nbs/09_trig.ipynb 9
+@instrumented
 def adjacent_magnitude_fn(magnitude:float, # The true speed
                              angle:float, # The Ange in radians
+                             out:np.ndarray = None #optional array to write the result into
                              ) -> int: #The adjacent component of the magnitude
     
     "Product of cos and magnitude"
     
+    if out is not None:
+        np.cos(angle, out = out)
+        return np.multiply(magnitude, out, out = out)
+    
     x = magnitude * np.cos(angle)
     
     return x
 
 # %% ../nbs/09_trig.ipynb 13
+@instrumented
 def combine_vectors(a:float, # magnitude of vector a
                     b:float,  #magnitude of vector b
                     alpha:float, #angle of vector a
@@ -48,25 +61,51 @@ def combine_vectors(a:float, # magnitude of vector a
     return magnitude, gamma
 
 # %% ../nbs/09_trig.ipynb 16
+@instrumented
 def law_of_cosines(a:float, # side a which is along the x-axis
                    b:float, #side b makes the angle $\theta$ with side a
-                   theta:float  #the angle in radians opposite side c
+                   theta:float, #the angle in radians opposite side c
+                   out:np.ndarray = None, #optional array to write the result into
+                   work:np.ndarray = None #optional scratch array the shape of `out`
                   ) -> float: #The magnitude of b relative to a
     
     "Finds the length of side c using the angle theta opposite c and the length of the other two sides"
     
+    if out is not None:
+        work = np.empty_like(out) if work is None else work
+        adjacent_magnitude_fn(b, theta, out = out)
+        np.subtract(a, out, out = out)
+        #the sign of the opposite component drops out when it is squared
+        opposite_magnitude_fn(b, theta, out = work)
+        np.multiply(out, out, out = out)
+        np.multiply(work, work, out = work)
+        np.add(out, work, out = out)
+        return np.sqrt(out, out = out)
+    
     adjacent_component = a - adjacent_magnitude_fn(b, theta)
     opposite_component = - opposite_magnitude_fn(b, theta)
     
     return np.sqrt(adjacent_component**2 + opposite_component**2)
 
 # %% ../nbs/09_trig.ipynb 20
+@instrumented
 def find_gamma_fn(a:int, #magnitude of a 
                   b:int, #magnitude of b
                   alpha:int, # the angle between b and a in radians
-                  constrain_to_positive:bool = False #Should the function return a value between 0 and 2 pi
+                  constrain_to_positive:bool = False, #Should the function return a value between 0 and 2 pi
+                  out:np.ndarray = None, #optional array to write the result into
+                  work:np.ndarray = None #optional scratch array the shape of `out`
                  ) -> int:   #the angle in radians between a and the relative magnitude of b
     
+        if out is not None:
+            work = np.empty_like(out) if work is None else work
+            adjacent_magnitude_fn(a, alpha, out = work)
+            np.add(b, work, out = work)
+            opposite_magnitude_fn(a, alpha, out = out)
+            np.arctan2(out, work, out = out)
+            #arctan2 is in [-pi, pi] so the modulo only moves the negative angles
+            return np.mod(out, 2*np.pi, out = out) if constrain_to_positive else out
+        
         adjacent_component = b + adjacent_magnitude_fn(a, alpha)
         opposite_component = opposite_magnitude_fn(a, alpha)
         
@@ -74,6 +113,107 @@ def find_gamma_fn(a:int, #magnitude of a
         
         #prevents negative angles if constrain to positive is true
         #using this method instead of an if statement means the function can perform vectorised operations
-        gamma = gamma + 2*np.pi*(gamma<0)*constrain_to_positive
+        gamma = gamma + np.multiply(2*np.pi, gamma<0, dtype = gamma.dtype)*constrain_to_positive
         
         return gamma
+
+# %% ../nbs/09_trig.ipynb 27
+def _mean_resultant(angles:float, #angles in radians
+                    weights:float = None, #optional weight per angle
+                    groups:float = None #optional group label per angle
+                   ) -> tuple: #the mean cosine, mean sine and the total weight
+
+    "Weighted mean of the unit vectors of `angles`, either along the last axis or per group"
+
+    angles = np.asarray(angles, dtype = float)
+    weights = np.ones_like(angles) if weights is None else np.broadcast_to(np.asarray(weights, dtype = float), angles.shape)
+
+    if groups is None:
+        total = weights.sum(axis = -1)
+        cos_sum = (weights * np.cos(angles)).sum(axis = -1)
+        sin_sum = (weights * np.sin(angles)).sum(axis = -1)
+    else:
+        #bincount sums every group in one pass, the inverse maps the labels onto 0..n_groups-1
+        _, codes = np.unique(np.asarray(groups).ravel(), return_inverse = True)
+        angles, weights = angles.ravel(), weights.ravel()
+        total = np.bincount(codes, weights = weights)
+        cos_sum = np.bincount(codes, weights = weights * np.cos(angles))
+        sin_sum = np.bincount(codes, weights = weights * np.sin(angles))
+
+    return cos_sum/total, sin_sum/total, total
+
+# %% ../nbs/09_trig.ipynb 28
+@instrumented
+def weighted_circular_mean(angles:float, #angles in radians
+                           weights:float, #weight of each angle e.g. sample duration or wind speed
+                           groups:float = None, #optional group label per angle, e.g. the run number
+                           constrain_to_positive:bool = True #Should the function return a value between 0 and 2 pi
+                          ) -> float: #the mean direction in radians
+
+    "The weighted mean direction of a set of angles"
+
+    mean_cos, mean_sin, _ = _mean_resultant(angles, weights, groups)
+    gamma = np.arctan2(mean_sin, mean_cos)
+
+    return gamma + 2*np.pi*(gamma<0)*constrain_to_positive
+
+# %% ../nbs/09_trig.ipynb 29
+@instrumented
+def circular_mean(angles:float, #angles in radians
+                  groups:float = None, #optional group label per angle, e.g. the run number
+                  constrain_to_positive:bool = True #Should the function return a value between 0 and 2 pi
+                 ) -> float: #the mean direction in radians
+
+    "The mean direction of a set of angles"
+
+    return weighted_circular_mean(angles, None, groups, constrain_to_positive)
+
+# %% ../nbs/09_trig.ipynb 30
+@instrumented
+def circular_variance(angles:float, #angles in radians
+                      weights:float = None, #optional weight per angle
+                      groups:float = None #optional group label per angle, e.g. the run number
+                     ) -> float: #the circular variance between 0 and 1
+
+    "One minus the mean resultant length of a set of angles"
+
+    mean_cos, mean_sin, _ = _mean_resultant(angles, weights, groups)
+
+    return 1 - np.sqrt(mean_cos**2 + mean_sin**2)
+
+# %% ../nbs/09_trig.ipynb 37
+@instrumented
+def angle_difference(a:float, #angles in radians
+                     b:float #the angles they are compared with in radians
+                    ) -> float: #the signed difference in radians, between -pi and pi
+
+    "The smallest angle from `b` to `a`"
+
+    return np.mod(a - b + np.pi, 2*np.pi) - np.pi
+
+# %% ../nbs/09_trig.ipynb 41
+@instrumented
+def rolling_circular_stats(angles:float, #1D array of angles in radians, ordered in time
+                           window:int, #the number of samples in the window, at least 1
+                           constrain_to_positive:bool = True #Should the mean direction be between 0 and 2 pi
+                          ) -> tuple: #the rolling mean direction and the rolling circular variance
+
+    "The mean direction and circular variance over a trailing window of samples"
+
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    angles = np.asarray(angles, dtype = float)
+
+    #prepending a zero means the window sums are the difference of two cumulative sums
+    cos_sum = np.concatenate(([0.0], np.cumsum(np.cos(angles))))
+    sin_sum = np.concatenate(([0.0], np.cumsum(np.sin(angles))))
+
+    mean_cos = np.full(angles.shape, np.nan)
+    mean_sin = np.full(angles.shape, np.nan)
+    mean_cos[window - 1:] = (cos_sum[window:] - cos_sum[:-window])/window
+    mean_sin[window - 1:] = (sin_sum[window:] - sin_sum[:-window])/window
+
+    gamma = np.arctan2(mean_sin, mean_cos)
+    gamma = gamma + 2*np.pi*(gamma<0)*constrain_to_positive
+
+    return gamma, 1 - np.sqrt(mean_cos**2 + mean_sin**2)
@@ -3,28 +3,36 @@
 # %% auto 0
 __all__ = ['stawave1_fn', 'modified_pierson_moskowitz_spectrum', 'calculate_R_wave', 'R_AWL']
 
-# %% ../nbs/03_wave_resistance.ipynb 3
+# %% ../nbs/03_wave_resistance.ipynb 4
 import numpy as np
-from scipy.integrate import quad
-from scipy.special import iv, kn
-from fastcore.test import *
+from .instrument import instrumented
+from .cache import cached
+from .precision import promote, demote
+from .basic import _require, _from_hull
 
-# %% ../nbs/03_wave_resistance.ipynb 5
+# %% ../nbs/03_wave_resistance.ipynb 6
+@instrumented
 def stawave1_fn(
-    beam:float, #the beam of the ship [m]
-    wave_height:float, #Significant wave height of wind waves [m]
-    length:float, #The length of the bow on the water line [m]. See documentation for more details
+    beam:float = None, #the beam of the ship [m]
+    wave_height:float = None, #Significant wave height of wind waves [m]
+    length:float = None, #The length of the bow on the water line [m]. See documentation for more details
     water_density:float = 1026, #this should be for the current temperature and salinity [kg/m^3]
-            gravity:float  = 9.81
+            gravity:float  = 9.81,
+            *,
+            hull = None #Optional `Hull`, gives the beam and length of the bow if they are not passed
             )-> float: # Wave resistance [kg*m/s^2]
-    
+
     "STAWAVE-1 finds the resistance caused by bow waves for ships experiencing low heave and pitch"
-    
-    
+
+    _require(wave_height = wave_height)
+    if hull is not None and beam is None and length is None:
+        return (1/16)* water_density * gravity * wave_height**2 * hull.B * hull.sqrt_beam_bow_ratio
+    beam, length = _from_hull(hull, {'beam': 'B', 'length': 'L_BWL'}, beam = beam, length = length)
+
     return (1/16)* water_density * gravity * wave_height**2 * beam * np.sqrt(beam/length)
-    
 
-# %% ../nbs/03_wave_resistance.ipynb 9
+# %% ../nbs/03_wave_resistance.ipynb 10
+@instrumented
 def modified_pierson_moskowitz_spectrum(omega:float, #The circular frequency [rads/s]
                                         H_W1_3:float, #Significant wave height of Wind and Swell waves [m]
                                         #T_01:float#
@@ -36,7 +44,7 @@ def modified_pierson_moskowitz_spectrum(omega:float, #The circular frequency [ra
     S_eta = (A_fw / (omega ** 5)) * np.exp(-B_fw / (omega ** 4))
     return S_eta
 
-# %% ../nbs/03_wave_resistance.ipynb 13
+# %% ../nbs/03_wave_resistance.ipynb 14
 def _a_1(C_B):
     return 60.3 * C_B**1.34
 
@@ -49,11 +57,15 @@ def _b_1(bar_omega):
 
     return (logical_test *11.0) + (~logical_test) *-8.5
 
-def _d_1(bar_omega, L_pp, B):
+def _d_1(bar_omega, L_pp, B, d_1_long = None):
 
     logical_test = (bar_omega < 1)
+    
+    #the long wave value only depends on the hull so can be passed in pre-calculated
+    if d_1_long is None:
+        d_1_long = -566 * (L_pp / B)**(-2.66)
 
-    return (logical_test *14.0) + (~logical_test) *(-566 * (L_pp / B)**(-2.66))
+    return (logical_test *14.0) + (~logical_test) *d_1_long
 
 def _r_aw(bar_omega, b_1, d_1, a_1, Fr):
     return (bar_omega**b_1) * np.exp((b_1 / d_1) * (1 - bar_omega**(d_1))) * a_1 * Fr**1.5 * np.exp(3.50 * Fr)
@@ -72,27 +84,38 @@ def _alpha_1(I_1, K_1, f1):
 def _R_AWRL(rho_s, g, zeta_A, B, alpha_1):
     return 0.5 * rho_s * g * zeta_A**2 * B * alpha_1
 
-# %% ../nbs/03_wave_resistance.ipynb 14
+# %% ../nbs/03_wave_resistance.ipynb 15
+@instrumented
 def calculate_R_wave(omega:float, # circular wave frequency [rads/s]
-                     C_B:float, # block coefficient [dimensionless]
-                     L_pp:float, # Length between perpendiculars [m]
-                     k_yy:float, # radius of gyration in the lateral direction [dimensionless]
-                     Fr:float, # Froude number [dimensionless]
-                     zeta_A:float, # wave amplitude [m]
-                     B:float, # ship breadth [m]
-                     k:float, # circular wave number [rads/m]
-                     T_M:float, # draught at midship [m]
-                     V_s:float, # speed through water [m/s]
+                     C_B:float = None, # block coefficient [dimensionless]
+                     L_pp:float = None, # Length between perpendiculars [m]
+                     k_yy:float = None, # radius of gyration in the lateral direction [dimensionless]
+                     Fr:float = None, # Froude number [dimensionless]
+                     zeta_A:float = None, # wave amplitude [m]
+                     B:float = None, # ship breadth [m]
+                     k:float = None, # circular wave number [rads/m]
+                     T_M:float = None, # draught at midship [m]
+                     V_s:float = None, # speed through water [m/s]
                      rho_s:float = 1025, # water density [kg/m^3]
-                     g:float = 9.81 # acceleration due to gravity [m/s^2]
+                     g:float = 9.81, # acceleration due to gravity [m/s^2]
+                     *,
+                     hull = None # Optional `Hull`, gives the hull particulars not passed and the cached coefficients
                      ) -> tuple: #Function outputs the wave transfer function as well as the component parts R_AWRL and R_AWML
-    a1 = _a_1(C_B)
+    _require(Fr = Fr, zeta_A = zeta_A, k = k, V_s = V_s)
+    #the cached coefficients of the hull are used for the particulars it gives
+    a1 = hull.a_1 if hull is not None and C_B is None else None
+    d1_long = hull.d_1 if hull is not None and L_pp is None and B is None else None
+    C_B, L_pp, k_yy, B, T_M = _from_hull(hull, {}, C_B = C_B, L_pp = L_pp, k_yy = k_yy, B = B, T_M = T_M)
+    if a1 is None:
+        a1 = _a_1(C_B)
     bar_omega = _bar_omega_fn(omega, L_pp, g, k_yy, Fr)
     b1 = _b_1(bar_omega)
-    d1 = _d_1(bar_omega, L_pp, B)
+    d1 = _d_1(bar_omega, L_pp, B, d1_long)
     r_aw_val = _r_aw(bar_omega, b1, d1, a1, Fr)
     R_AWML_val = _R_AWML(rho_s, g, zeta_A, B, L_pp, r_aw_val)
     
+    #scipy is imported on first use as it is slow to import
+    from scipy.special import iv, kn
     I_1 = iv(1, 1.5 * k * T_M)
     K_1 = kn(1, 1.5 * k * T_M) 
     f1 = _f_1(V_s, T_M, g, C_B)
@@ -102,21 +125,34 @@ def calculate_R_wave(omega:float, # circular wave frequency [rads/s]
     
     return R_wave, R_AWRL_val, R_AWML_val
 
+@instrumented
+@cached
 def R_AWL(#omega:float, # circular wave frequency [rads/s]
           zeta_A:float, # wave amplitude [m]
-          B:float, # ship breadth [m]
-          L_pp:float, # Length between perpendiculars [m]
-          V_s:float, # speed through water [m/s]
-          T_M:float, # draught at midship [m]
-          C_B:float, # block coefficient [dimensionless]
-          k_yy:float, # radius of gyration in the lateral direction [dimensionless]
-          Fr:float, # Froude number [dimensionless]
-          k:float, # circular wave number [rads/m]
+          B:float = None, # ship breadth [m]
+          L_pp:float = None, # Length between perpendiculars [m]
+          V_s:float = None, # speed through water [m/s]
+          T_M:float = None, # draught at midship [m]
+          C_B:float = None, # block coefficient [dimensionless]
+          k_yy:float = None, # radius of gyration in the lateral direction [dimensionless]
+          Fr:float = None, # Froude number [dimensionless]
+          k:float = None, # circular wave number [rads/m]
           rho_s:float = 1025, # water density [kg/m^3]
           g:float = 9.81, # accerleation due to gravity [m/s^2]
           S_eta:object = None, #A function calculating the wave spectrum 
+          *,
+          hull = None, # Optional `Hull`, gives the hull particulars not passed
           **kwargs)->tuple: # The added wave resistance, the wave resistance from reflection, the wave resistsance from pitching
     
+    from scipy.integrate import quad
+
+    _require(V_s = V_s, Fr = Fr, k = k, S_eta = S_eta)
+    B, L_pp, T_M, C_B, k_yy = _from_hull(hull, {}, B = B, L_pp = L_pp, T_M = T_M, C_B = C_B, k_yy = k_yy)
+    
+    #the quadrature is done in float64, float32 particulars are promoted and the results returned in float32
+    inputs = (zeta_A, B, L_pp, V_s, T_M, C_B, k_yy, Fr, k, rho_s, g)
+    zeta_A, B, L_pp, V_s, T_M, C_B, k_yy, Fr, k, rho_s, g = (promote(x) for x in inputs)
+    
     def integrand(omega: float) -> tuple:
         R_wave, R_AWRL_val, R_AWML_val = calculate_R_wave(omega = omega, C_B = C_B, L_pp = L_pp, k_yy = k_yy, 
                                                           Fr = Fr , zeta_A = zeta_A, B = B, k = k, T_M = T_M, 
@@ -131,4 +167,4 @@ def R_AWL(#omega:float, # circular wave frequency [rads/s]
     result_1, _ = quad(lambda omega: integrand_n(omega, 1), 0, np.inf)
     result_2, _ = quad(lambda omega: integrand_n(omega, 2), 0, np.inf)
     
-    return result_0, result_1, result_2
+    return tuple(demote(result, *inputs) for result in (result_0, result_1, result_2))
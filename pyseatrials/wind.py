@@ -6,12 +6,12 @@ __all__ = ['rel2true_speed', 'rel2true_dir', 'true2rel_speed', 'true2rel_dir', '
 
 # %% ../nbs/02_wind.ipynb 5
 import numpy as np
-import pandas as pd
-from fastcore.test import *
+from .instrument import instrumented
 from .trig import *
 
 
 # %% ../nbs/02_wind.ipynb 8
+@instrumented
 def rel2true_speed(relative_windspeed:float, #speed of wind relative to ship
                             sog:float, #speed over ground
                            relative_wind_direction:float #wind direction relative to ship
@@ -20,6 +20,7 @@ def rel2true_speed(relative_windspeed:float, #speed of wind relative to ship
     return law_of_cosines(relative_windspeed, sog, relative_wind_direction)
 
 # %% ../nbs/02_wind.ipynb 18
+@instrumented
 def rel2true_dir(
     relative_wind_speed:float, #Speed of the wind relative to the ship
     sog:float, #Speed of the ship overground
@@ -36,12 +37,14 @@ def rel2true_dir(
         
     #prevents negative angles if constrain to positive is true
     #using this method instead of an if statement means the function can perform vectorised operations
-    gamma = gamma + 2*np.pi*(gamma<0)*constrain_to_positive
+    #the correction takes the dtype of gamma so float32 angles stay float32
+    gamma = gamma + np.multiply(2*np.pi, gamma<0, dtype = gamma.dtype)*constrain_to_positive
     
     return gamma 
     
 
 # %% ../nbs/02_wind.ipynb 27
+@instrumented
 def true2rel_speed(true_wind_speed:float, #The windspeed over ground
                             sog:float, #Speed over ground of the vessel
                             true_wind_direction:float, #Direction of wind relative to north
@@ -54,6 +57,7 @@ def true2rel_speed(true_wind_speed:float, #The windspeed over ground
            
 
 # %% ../nbs/02_wind.ipynb 34
+@instrumented
 def true2rel_dir(
                             true_wind_speed:float, #The windspeed over ground
                             sog:float, #Speed over ground of the vessel
@@ -66,9 +70,10 @@ def true2rel_dir(
     
     gamma  = find_gamma_fn(true_wind_speed, sog, true_wind_direction - vessel_heading)
 
-    return gamma + 2*np.pi*(gamma<0)*constrain_to_positive
+    return gamma + np.multiply(2*np.pi, gamma<0, dtype = gamma.dtype)*constrain_to_positive
 
 # %% ../nbs/02_wind.ipynb 43
+@instrumented
 def double_run_average(a, b, alpha, beta):
     #it makes no difference if a/2, b/2 is used or average_velocity/2 the result is the same
     average_velocity, average_direction = combine_vectors(a, b, alpha, beta)
@@ -76,6 +81,7 @@ def double_run_average(a, b, alpha, beta):
     return average_velocity/2, average_direction
 
 # %% ../nbs/02_wind.ipynb 47
+@instrumented
 def vertical_position_anemometer(true_wind_speed:float, #True windspeed [m/s]
                                  reference_height:float, #reference height [m]
                                  measured_height:float  # measured height [m]
@@ -5,24 +5,24 @@ __all__ = ['load_wind_coefficients', 'interpolate_cx', 'fujiwara']
 
 # %% ../nbs/05_wind_resistance_coef.ipynb 2
 import numpy as np
-import pandas as pd
-from fastcore.test import *
-import pkgutil
-from io import BytesIO
+from .instrument import instrumented
+from .cache import cached
+from .precision import demote
+from .catalog import load_frame
 
 # %% ../nbs/05_wind_resistance_coef.ipynb 5
+@instrumented
 def load_wind_coefficients(vessel_type:str #The name of the vessel type. Must be one of 9 options
                      ): #returns a data set with where the first column us angle_of_attack in radians, the second is angle_of_attack in degrees, the subsequent columns names ship states
         
         "Load a wind coefficient table for a generic ship class. Datasets from ITTC"
         
-        #This needs to be adapted so that the paths work on any system, using pathlib.path would be a better choice
-        res = pkgutil.get_data('pyseatrials', 'wind_coef_data/'+vessel_type+'.csv')
-        
-        return pd.read_csv(BytesIO(res))
+        #parsed once by the catalog, a new frame each call
+        return load_frame('wind_coef_data/'+vessel_type)
     
 
 # %% ../nbs/05_wind_resistance_coef.ipynb 9
+@instrumented
 def interpolate_cx(df, #dataframe of the wind resistance dataset
                    relative_wind_direction:float, #The angle of the wind relative to the ship [rads]
                    ship_state:str #The state of the ship the resistance should be evaluated in. Chosen from the columns of the wind resistance datasets
@@ -30,7 +30,8 @@ def interpolate_cx(df, #dataframe of the wind resistance dataset
     
     "Find a linearly interpolated value for wind resistance coefficient"
     
-    return np.interp(relative_wind_direction, df.angle_of_attack, df[ship_state])
+    #the table lookup is in float64, float32 directions get float32 coefficients
+    return demote(np.interp(relative_wind_direction, df.angle_of_attack, df[ship_state]), relative_wind_direction)
 
 # %% ../nbs/05_wind_resistance_coef.ipynb 27
 def _clf(aod:float, #is the lateral projected area of superstructures on deck [m2]
@@ -187,6 +188,8 @@ def _fujiwara_internal(aod:float, #is the lateral projected area of superstructu
         
     return ca
 
+@instrumented
+@cached
 def fujiwara(aod:float, #is the lateral projected area of superstructures on deck [m2]
              axv:float, #is the area of maximum transverse section exposed to the winds [m2]
              alv:float, #is the projected lateral area above the waterline [m2]
@@ -201,5 +204,7 @@ def fujiwara(aod:float, #is the lateral projected area of superstructures on dec
     
     #wrap 'fujiwara_internal' to accept arrays and vectorise the calculation
     
-    return np.vectorize(_fujiwara_internal)(aod=aod, axv=axv, alv=alv, cmc=cmc, hc=hc, hbr=hbr, loa=loa, b=b, wind_dir=wind_dir, smoothing=smoothing)
+    ca = np.vectorize(_fujiwara_internal)(aod=aod, axv=axv, alv=alv, cmc=cmc, hc=hc, hbr=hbr, loa=loa, b=b, wind_dir=wind_dir, smoothing=smoothing)
+    
+    return demote(ca, wind_dir)
 